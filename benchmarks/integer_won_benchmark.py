@@ -0,0 +1,98 @@
+"""
+원 단위 정수 상환 스케줄 벤치마크
+
+utils.loan_rounding의 int64 벡터화 구현을 fractions.Fraction 순차 계산(정확한 기준값)과 비교해
+결과가 원 단위까지 같은지 확인하고, 실수 구현(calculate_loan_schedule)과 속도를 비교합니다.
+
+실행 방법:
+    python benchmarks/integer_won_benchmark.py
+"""
+import os
+import sys
+import math
+import timeit
+from fractions import Fraction
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.financial_utils import PAYMENT_TYPES, calculate_loan_schedule
+from utils.loan_rounding import ROUNDING_RULES, calculate_loan_schedule_won
+
+# 양수 유리수를 원 단위 정수로 바꾸는 반올림 규칙
+FRACTION_ROUNDING = {
+    "절사": math.floor,
+    "반올림": lambda value: math.floor(value + Fraction(1, 2)),
+    "절상": math.ceil,
+}
+
+def fraction_loan_schedule(principal, periods, annual_rate, payment_type, rounding):
+    """유리수(Fraction)로 회차마다 순차 계산하는 기준 구현 (원리금균등 납입금액도 정확히 계산)"""
+    round_won = FRACTION_ROUNDING[rounding]
+    rows = []
+    r = Fraction(str(annual_rate)) / 1200
+    if r == 0:
+        level_payment = round_won(Fraction(principal, periods))
+    else:
+        growth = (1 + r) ** periods
+        level_payment = round_won(principal * r * growth / (growth - 1))
+    remaining = principal
+    base_principal = principal // periods
+
+    for period in range(1, periods + 1):
+        interest = round_won(remaining * r)
+        if period == periods:
+            principal_payment = remaining
+        elif payment_type == "원리금균등상환":
+            # 잔금과 이자의 합이 납입금액 이하이면 이번 회차에 완납
+            principal_payment = min(level_payment - interest, remaining)
+        elif payment_type == "원금균등상환":
+            principal_payment = base_principal
+        else:
+            principal_payment = 0
+        remaining -= principal_payment
+        rows.append((principal_payment + interest, principal_payment, interest, remaining))
+    return np.array(rows, dtype=np.int64)
+
+def main():
+    # (대출금액, 연이자율, 회차들). 19.9%처럼 연이자율/1200이 유한소수가 아닌 금리,
+    # 반올림 차이가 길게 전파되는 금리(7.77%, 3,600회차), 절상 납입금액으로 만기 전에 완납하는
+    # 고금리 장기 대출(19.9% 720회차, 15% 960회차)을 포함. 납입금액의 1원 미만 반올림 차이가
+    # (1+r)^n배로 커져 int64 범위를 넘을 수 있는 입력은 ValueError로 거부하므로 제외
+    cases = [
+        (300_000_000, 4.35, [360, 600, 3_600]),
+        (300_000_000, 19.9, [360, 600]),
+        (300_000_000, 7.77, [360, 3_600]),
+        (100_000_000, 19.9, [720]),
+        (100_000_000, 15, [960]),
+    ]
+
+    for principal, annual_rate, period_options in cases:
+        for periods in period_options:
+            for payment_type in PAYMENT_TYPES:
+                for rounding in ROUNDING_RULES:
+                    expected = fraction_loan_schedule(principal, periods, annual_rate, payment_type, rounding)
+                    actual = calculate_loan_schedule_won(principal, periods, annual_rate, payment_type, rounding)
+                    assert np.array_equal(expected, actual.to_numpy()), \
+                        f"{annual_rate}% {payment_type} {rounding} {periods}회차 불일치"
+                    assert actual['원금상환'].sum() == principal
+                    assert actual['납입금액'].sum() == actual['원금상환'].sum() + actual['이자금액'].sum()
+
+                number = 20
+                fraction_time = timeit.timeit(
+                    lambda: fraction_loan_schedule(principal, periods, annual_rate, payment_type, "반올림"),
+                    number=1)
+                won_time = max(
+                    timeit.timeit(
+                        lambda: calculate_loan_schedule_won(principal, periods, annual_rate, payment_type, rounding),
+                        number=number) / number
+                    for rounding in ROUNDING_RULES
+                )
+                float_time = timeit.timeit(
+                    lambda: calculate_loan_schedule.__wrapped__(principal, periods, annual_rate / 1200, payment_type),
+                    number=number) / number
+                print(f"{annual_rate:5.2f}% {payment_type:<8} {periods:>6,}회차 | Fraction {fraction_time * 1000:8.2f} ms | "
+                      f"정수(최악 규칙) {won_time * 1000:6.2f} ms | 실수 {float_time * 1000:6.2f} ms | 원 단위 일치")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+투자 성장 데이터 생성 벤치마크
+
+기존 월별 반복문 구현과 calculators.investment_calculator의 벡터화 구현을 비교합니다.
+
+실행 방법:
+    python benchmarks/investment_data_benchmark.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from calculators.investment_calculator import generate_investment_data
+
+def loop_investment_data(initial_investment, monthly_contribution, monthly_rate, total_months, contribution_period):
+    """기존 반복문 방식의 투자 성장 데이터 생성 (비교 기준)"""
+    data = []
+    balance = initial_investment
+    invested = initial_investment
+
+    for month in range(total_months + 1):
+        if month > 0:
+            interest = balance * monthly_rate
+            if contribution_period == "월 납입" or (contribution_period == "연 납입" and month % 12 == 1):
+                contribution = monthly_contribution if contribution_period == "월 납입" else monthly_contribution * 12
+                balance += interest + contribution
+                invested += contribution
+            else:
+                balance += interest
+
+        data.append({'월': month, '투자원금': invested, '투자수익': balance - invested, '총자산': balance})
+
+    return pd.DataFrame(data)
+
+def main():
+    initial_investment = 10_000_000
+    monthly_contribution = 500_000
+
+    for total_months in [120, 600, 6_000]:
+        for annual_return in [0.0, 7.0, 30.0]:
+            monthly_rate = annual_return / 12 / 100
+            for contribution_period in ["월 납입", "연 납입"]:
+                args = (initial_investment, monthly_contribution, monthly_rate, total_months, contribution_period)
+                expected = loop_investment_data(*args)
+                actual = generate_investment_data(*args)
+                assert (expected.columns == actual.columns).all()
+                rel_diff = np.abs(expected.to_numpy() - actual.to_numpy()).max() / expected['총자산'].abs().max()
+                assert rel_diff < 1e-9, f"{total_months}개월 {annual_return}% {contribution_period}: 상대 오차 {rel_diff:.2e}"
+
+                number = 20
+                loop_time = timeit.timeit(lambda: loop_investment_data(*args), number=number) / number
+                vector_time = timeit.timeit(lambda: generate_investment_data(*args), number=number) / number
+                print(f"{total_months:>6,}개월 연 {annual_return:4.1f}% {contribution_period} | "
+                      f"반복문 {loop_time * 1000:8.2f} ms | 벡터화 {vector_time * 1000:6.2f} ms | "
+                      f"{loop_time / vector_time:6.1f}배 | 상대 오차 {rel_diff:.2e}")
+
+if __name__ == "__main__":
+    main()
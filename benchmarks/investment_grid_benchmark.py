@@ -0,0 +1,74 @@
+"""
+수익률 × 투자기간 시나리오 표 벤치마크
+
+수익률마다 잔액을 한 달씩 쌓아 가는 반복문(닫힌 식과 독립적인 기준값)과
+utils.investment_solvers.calculate_investment_grid의 브로드캐스팅 구현을 비교합니다.
+
+실행 방법:
+    python benchmarks/investment_grid_benchmark.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.investment_solvers import calculate_investment_grid
+from utils.tvm import compound_monthly_rate
+
+def loop_investment_grid(base_amount, monthly_contribution, annual_returns, total_months, compounding_periods,
+                         escalation_rate, present_value):
+    """수익률마다 월별 잔액을 반복문으로 쌓아 투자 개월별 값을 읽는 방식 (비교 기준)"""
+    max_months = max(total_months)
+    values = []
+    for annual_return in annual_returns:
+        monthly_rate = compound_monthly_rate(annual_return, compounding_periods)
+        # 초기투자금 없이 납입금만 쌓은 잔액과 1원의 성장 배수를 월별로 기록
+        balance, growth = 0.0, 1.0
+        balances, growths = [0.0], [1.0]
+        for month in range(1, max_months + 1):
+            contribution = monthly_contribution * (1 + escalation_rate) ** ((month - 1) // 12)
+            balance = balance * (1 + monthly_rate) + contribution
+            growth *= 1 + monthly_rate
+            balances.append(balance)
+            growths.append(growth)
+        if present_value:
+            row = [max(0, (base_amount - balances[months]) / growths[months]) for months in total_months]
+        else:
+            row = [base_amount * growths[months] + balances[months] for months in total_months]
+        values.append(row)
+    return pd.DataFrame(values, index=annual_returns, columns=total_months)
+
+def main():
+    monthly_contribution = 500_000
+    annual_returns = np.arange(0, 15, 0.25)
+    total_months = np.arange(1, 601)
+
+    for present_value, base_amount in [(False, 10_000_000), (True, 1_000_000_000)]:
+        for compounding_periods in [12, 4, 1]:
+            for escalation_rate in [0.0, 0.03]:
+                args = (base_amount, monthly_contribution, annual_returns, total_months, compounding_periods,
+                        escalation_rate, present_value)
+                expected = loop_investment_grid(*args)
+                actual = calculate_investment_grid(*args[:4], compounding_periods=compounding_periods,
+                                                   escalation_rate=escalation_rate, present_value=present_value)
+                scale = np.abs(expected.to_numpy()).max()
+                rel_diff = np.abs(expected.to_numpy() - actual.to_numpy()).max() / scale
+                assert rel_diff < 1e-9, f"상대 오차 {rel_diff:.2e}"
+
+                loop_time = timeit.timeit(lambda: loop_investment_grid(*args), number=1)
+                number = 20
+                grid_time = timeit.timeit(
+                    lambda: calculate_investment_grid(*args[:4], compounding_periods=compounding_periods,
+                                                      escalation_rate=escalation_rate, present_value=present_value),
+                    number=number
+                ) / number
+                label = "PV" if present_value else "FV"
+                print(f"{label} {len(annual_returns)}×{len(total_months)} 연 {compounding_periods:>2}회 복리 "
+                      f"증가율 {escalation_rate * 100:3.0f}% | 반복문 {loop_time * 1000:8.1f} ms | "
+                      f"브로드캐스팅 {grid_time * 1000:5.2f} ms | {loop_time / grid_time:6.0f}배 | 상대 오차 {rel_diff:.2e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+대출 상환 스케줄 계산 벤치마크
+
+기존 회차별 반복문 구현과 utils.financial_utils의 벡터화 구현을 비교합니다.
+
+실행 방법:
+    python benchmarks/loan_schedule_benchmark.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.financial_utils import PAYMENT_TYPES, SCHEDULE_COLUMNS, calculate_loan_schedule
+
+def loop_loan_schedule(principal, periods, monthly_rate, payment_type):
+    """기존 반복문 방식의 상환 스케줄 계산 (비교 기준)"""
+    schedule = []
+    remaining = principal
+
+    if payment_type == "원리금균등상환":
+        if monthly_rate == 0:
+            payment = principal / periods
+        else:
+            payment = principal * (monthly_rate * (1 + monthly_rate) ** periods) / ((1 + monthly_rate) ** periods - 1)
+
+        for period in range(1, periods + 1):
+            interest = remaining * monthly_rate
+            principal_payment = payment - interest
+            remaining -= principal_payment
+            if period == periods:
+                if abs(remaining) < 1:
+                    remaining = 0
+            schedule.append({"회차": period, "납입금액": payment, "원금상환": principal_payment,
+                             "이자금액": interest, "잔금": max(0, remaining)})
+
+    elif payment_type == "원금균등상환":
+        principal_payment = principal / periods
+        for period in range(1, periods + 1):
+            interest = remaining * monthly_rate
+            payment = principal_payment + interest
+            remaining -= principal_payment
+            schedule.append({"회차": period, "납입금액": payment, "원금상환": principal_payment,
+                             "이자금액": interest, "잔금": max(0, remaining)})
+
+    elif payment_type == "만기일시상환":
+        for period in range(1, periods + 1):
+            interest = remaining * monthly_rate
+            if period == periods:
+                principal_payment = principal
+                payment = principal + interest
+                remaining = 0
+            else:
+                principal_payment = 0
+                payment = interest
+            schedule.append({"회차": period, "납입금액": payment, "원금상환": principal_payment,
+                             "이자금액": interest, "잔금": remaining})
+
+    return pd.DataFrame(schedule).set_index("회차")
+
+def main():
+    principal = 100_000_000
+    annual_rate = 4.5
+
+    for periods in [360, 3_600, 100_000]:
+        # 회차 수가 많을수록 회차당 이자율을 낮춰 현실적인 범위(주간/일간 상환)를 유지
+        monthly_rate = annual_rate / 100 / (12 * periods / 360)
+        for payment_type in PAYMENT_TYPES:
+            expected = loop_loan_schedule(principal, periods, monthly_rate, payment_type)
+            actual = calculate_loan_schedule(principal, periods, monthly_rate, payment_type)
+            max_diff = np.abs(expected[SCHEDULE_COLUMNS].to_numpy() - actual.to_numpy()).max()
+            assert max_diff < 1, f"{payment_type} {periods}회차: 최대 오차 {max_diff:.4f}원"
+
+            number = 3 if periods >= 100_000 else 20
+            loop_time = timeit.timeit(
+                lambda: loop_loan_schedule(principal, periods, monthly_rate, payment_type), number=number) / number
+            # 캐시 적중이 아닌 계산 시간을 재기 위해 캐시되지 않은 원래 함수를 사용
+            vector_time = timeit.timeit(
+                lambda: calculate_loan_schedule.__wrapped__(principal, periods, monthly_rate, payment_type), number=number) / number
+            print(f"{payment_type:<8} {periods:>7,}회차 | 반복문 {loop_time * 1000:9.2f} ms | "
+                  f"벡터화 {vector_time * 1000:7.2f} ms | {loop_time / vector_time:6.1f}배 | 최대 오차 {max_diff:.2e}원")
+
+if __name__ == "__main__":
+    main()
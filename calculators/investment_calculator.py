@@ -1,6 +1,26 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+from utils.after_tax import (
+    ISA_ANNUAL_CONTRIBUTION_LIMIT, ISA_TAX_FREE_LIMITS, PENSION_CREDIT_RATES, PENSION_INCOME_TAX_RATES, TAX_TIMINGS,
+    compare_tax_wrappers
+)
+from utils.backtest import (
+    backtest_rolling_windows, backtest_window_path, list_return_datasets, load_monthly_returns, summarize_backtest
+)
+from utils.cache import LRUCache
+from utils.investment_solvers import (
+    calculate_investment_grid, required_return_by_horizon, solve_required_contribution, solve_required_return
+)
+from utils.contributions import contribution_schedule
+from utils.monte_carlo import simulate_investment
+from utils.portfolio import simulate_portfolio
+from utils.tvm import annuity_factor, compound_monthly_rate, fv, pv
+from utils.xirr import xirr_batch
+from utils.visualization import (
+    create_after_tax_chart, create_backtest_chart, create_fan_chart, create_investment_grid_heatmap,
+    create_portfolio_chart
+)
 
 def investment_calculator():
     st.header("투자계산기")
@@ -8,22 +28,30 @@ def investment_calculator():
     # 사용 방법 안내
     with st.expander("💡 투자계산기 사용 방법"):
         st.write("""
-        이 투자계산기는 두 가지 핵심 계산을 제공합니다:
+        이 투자계산기는 세 가지 핵심 계산을 제공합니다:
         
         **미래가치(FV) 계산**: 현재 투자금액이 미래에 얼마가 될지 계산합니다.
         - 예: 현재 1천만원과 매월 50만원을 연 7%로 10년간 투자하면 얼마가 될까요?
         
         **현재가치(PV) 계산**: 미래에 필요한 금액을 위해 현재 얼마를 투자해야 할지 계산합니다.
         - 예: 10년 후 1억원이 필요하다면, 연 7%로 투자할 때 현재 얼마를 준비해야 할까요?
+        
+        **실제 수익률(XIRR) 계산**: 날짜가 불규칙한 입금·출금 내역으로 계좌의 연환산 수익률을 계산합니다.
+        - 예: 수시로 입금하고 일부 출금한 계좌의 현재 평가액이 얼마라면, 연 몇 %로 굴린 셈일까요?
         """)
     
     # 계산 유형 선택
     calc_type = st.radio(
         "계산 유형",
-        options=["미래가치(FV) 계산", "현재가치(PV) 계산"],
+        options=["미래가치(FV) 계산", "현재가치(PV) 계산", "실제 수익률(XIRR) 계산"],
         horizontal=True
     )
     
+    # 불규칙 현금흐름 수익률은 고정 수익률 입력을 쓰지 않으므로 별도 화면으로 처리
+    if calc_type == "실제 수익률(XIRR) 계산":
+        _render_xirr_mode()
+        return
+    
     tabs = st.tabs(["기본 입력", "상세 설정"])
     
     with tabs[0]:
@@ -142,173 +170,577 @@ def investment_calculator():
             compounding_periods = 2
         else:  # 연 복리
             compounding_periods = 1
+        
+        # 연봉 인상 등에 맞춰 매년 정기 투자금액을 늘리는 경우
+        escalation_percent = st.number_input(
+            "연간 투자금 증가율 (%)",
+            min_value=0.0,
+            max_value=20.0,
+            value=0.0,
+            step=0.5,
+            help="매년 첫 달에 정기 투자금액이 이 비율만큼 늘어납니다. 0이면 매년 같은 금액을 투자합니다."
+        )
+        escalation_rate = escalation_percent / 100
     
     # 조정된 월이율 계산
     if compounding_periods < 12:
-        periodic_rate = annual_return / 100 / compounding_periods
-        effective_monthly_rate = (1 + periodic_rate) ** (1 / (12 / compounding_periods)) - 1
+        effective_monthly_rate = compound_monthly_rate(annual_return, compounding_periods)
     else:
         effective_monthly_rate = monthly_rate
     
+    # 세션별 결과 저장소 (입력값 키 → 계산 결과). 표시 간격만 바꿀 때는 다시 계산하지 않음
+    if 'investment_results' not in st.session_state:
+        st.session_state.investment_results = LRUCache(max_entries=16, max_bytes=16 * 1024 * 1024)
+        st.session_state.investment_result_key = None
+    
     if st.button("계산하기", key="investment_calc_button", use_container_width=True):
-        # 투자 주기에 따른 기여금 조정
-        if contribution_period == "연 납입":
-            monthly_equivalent = monthly_contribution / 12
-        else:
-            monthly_equivalent = monthly_contribution
-        
-        if calc_type == "미래가치(FV) 계산":
-            # 미래가치 계산
-            future_value = calculate_future_value(initial_investment, monthly_equivalent, effective_monthly_rate, total_months)
-            
-            # 총 투자금액 계산
-            if contribution_period == "월 납입":
-                total_contributions = initial_investment + monthly_contribution * total_months
-            else:  # 연 납입
-                total_contributions = initial_investment + monthly_contribution * (total_months / 12)
-                
-            investment_gain = future_value - total_contributions
+        base_amount = initial_investment if calc_type == "미래가치(FV) 계산" else target_amount
+        result_key = (calc_type, base_amount, monthly_contribution, contribution_period, total_months,
+                      effective_monthly_rate, escalation_rate)
+        hit, _ = st.session_state.investment_results.get(result_key)
+        if not hit:
+            st.session_state.investment_results.put(
+                result_key,
+                _calculate_investment_result(calc_type, base_amount, monthly_contribution, contribution_period,
+                                             effective_monthly_rate, total_months, escalation_rate)
+            )
+        st.session_state.investment_result_key = result_key
+    
+    # 계산 결과가 있을 때만 표시 (표시 간격을 바꿔도 결과 유지)
+    if st.session_state.investment_result_key is not None:
+        hit, result = st.session_state.investment_results.get(st.session_state.investment_result_key)
+        if hit:
+            (result_type, metrics), df = result
             
             # 결과 표시
             st.subheader("투자 결과")
             col1, col2, col3 = st.columns(3)
-            col1.metric("미래 가치", f"₩{future_value:,.0f}")
-            col2.metric("총 투자금액", f"₩{total_contributions:,.0f}")
-            col3.metric("투자 수익", f"₩{investment_gain:,.0f}", f"{investment_gain/total_contributions*100:.1f}%")
-            
-            # 결과 데이터
-            df = generate_investment_data(initial_investment, monthly_equivalent, effective_monthly_rate, total_months, contribution_period)
+            if result_type == "미래가치(FV) 계산":
+                future_value, total_contributions, investment_gain = metrics
+                col1.metric("미래 가치", f"₩{future_value:,.0f}")
+                col2.metric("총 투자금액", f"₩{total_contributions:,.0f}")
+                col3.metric("투자 수익", f"₩{investment_gain:,.0f}", f"{investment_gain/total_contributions*100:.1f}%")
+            else:
+                present_value, total_contributions, future_gain, total_required = metrics
+                col1.metric("필요 초기 투자금", f"₩{present_value:,.0f}")
+                col2.metric("총 정기 투자액", f"₩{total_contributions:,.0f}")
+                col3.metric("투자 수익", f"₩{future_gain:,.0f}", f"{future_gain/total_required*100:.1f}%")
             
             # 표시 간격 선택
             display_interval = st.selectbox(
                 "표시 간격",
                 options=["연도별", "월별", "분기별"],
-                index=0
+                index=0,
+                key="investment_display_interval"
             )
             
-            if display_interval == "연도별":
-                display_df = df[df['월'] % 12 == 0].copy()
-                display_df['기간'] = display_df['월'] // 12
-                display_df['단위'] = "년"
-            elif display_interval == "분기별":
-                display_df = df[df['월'] % 3 == 0].copy()
-                display_df['기간'] = display_df['월'] // 3
-                display_df['단위'] = "분기"
-            else:  # 월별
-                display_df = df.copy()
-                display_df['기간'] = display_df['월']
-                display_df['단위'] = "월"
+            st.dataframe(
+                investment_display_view(df, display_interval).style.format(
+                    {col: '{:,.0f}' for col in ['투자원금', '투자수익', '총자산']}
+                ),
+                use_container_width=True
+            )
+    
+    # 수익률 × 투자 기간 시나리오 표 (복리 계산 주기 · 투자금 증가율 반영)
+    with st.expander("📊 수익률 × 투자기간 시나리오 표"):
+        grid_col1, grid_col2, grid_col3 = st.columns(3)
+        grid_return_range = grid_col1.slider(
+            "연수익률 범위 (%)",
+            min_value=0.0,
+            max_value=30.0,
+            value=(0.0, 15.0),
+            step=0.25,
+            key="investment_grid_returns"
+        )
+        grid_step = grid_col1.number_input(
+            "수익률 간격 (%p)",
+            min_value=0.05,
+            max_value=5.0,
+            value=0.25,
+            step=0.05,
+            key="investment_grid_step"
+        )
+        grid_year_range = grid_col2.slider(
+            "투자기간 범위 (년)",
+            min_value=1,
+            max_value=50,
+            value=(1, 50),
+            key="investment_grid_years"
+        )
+        grid_resolution = grid_col3.radio(
+            "기간 간격",
+            options=["연", "월"],
+            horizontal=True,
+            key="investment_grid_resolution"
+        )
+        
+        grid_returns = np.round(np.arange(grid_return_range[0], grid_return_range[1] + grid_step / 2, grid_step), 4)
+        month_step = 12 if grid_resolution == "연" else 1
+        grid_months = np.arange(grid_year_range[0] * 12, grid_year_range[1] * 12 + 1, month_step)
+        grid_base = initial_investment if calc_type == "미래가치(FV) 계산" else target_amount
+        grid_contribution = monthly_contribution / 12 if contribution_period == "연 납입" else monthly_contribution
+        grid = calculate_investment_grid(
+            grid_base,
+            grid_contribution,
+            grid_returns,
+            grid_months,
+            compounding_periods=compounding_periods,
+            escalation_rate=escalation_rate,
+            present_value=calc_type != "미래가치(FV) 계산"
+        )
+        
+        if calc_type == "미래가치(FV) 계산":
+            grid_title, grid_label = "수익률 · 투자기간별 미래 가치", "미래 가치 (원)"
+        else:
+            grid_title, grid_label = "수익률 · 투자기간별 필요 초기 투자금", "필요 초기 투자금 (원)"
+        st.plotly_chart(create_investment_grid_heatmap(grid, grid_title, grid_label), use_container_width=True)
+        st.download_button(
+            "시나리오 표 내려받기 (CSV)",
+            data=grid.to_csv().encode('utf-8-sig'),
+            file_name="investment_grid.csv",
+            mime="text/csv",
+            key="investment_grid_download"
+        )
+    
+    # 수익률 변동성을 반영한 확률적 시뮬레이션 (미래가치 모드)
+    if calc_type == "미래가치(FV) 계산":
+        with st.expander("📈 수익률 변동성 시뮬레이션 (몬테카를로)"):
+            mc_col1, mc_col2, mc_col3 = st.columns(3)
+            annual_volatility = mc_col1.number_input(
+                "연 변동성 (%)",
+                min_value=0.0,
+                max_value=60.0,
+                value=15.0,
+                step=1.0,
+                help="연수익률의 표준편차입니다. 주식형은 15~20%, 채권형은 5% 안팎이 일반적입니다."
+            )
+            n_paths = mc_col2.number_input(
+                "시뮬레이션 횟수",
+                min_value=1_000,
+                max_value=100_000,
+                value=10_000,
+                step=1_000
+            )
+            seed = mc_col3.number_input("난수 시드", min_value=0, value=42, help="같은 시드면 같은 결과가 나옵니다.")
+            mc_target_text = st.text_input("목표금액 (원)", value="100,000,000", key="investment_mc_target")
+            try:
+                mc_target = int(mc_target_text.replace(',', ''))
+            except:
+                mc_target = 100000000
             
-            display_df = display_df[['기간', '단위', '투자원금', '투자수익', '총자산']].copy()
+            if 'investment_mc_result' not in st.session_state:
+                st.session_state.investment_mc_result = None
             
-            # 숫자 포맷팅
-            for col in ['투자원금', '투자수익', '총자산']:
-                display_df[col] = display_df[col].map('{:,.0f}'.format)
-                
-            st.dataframe(display_df, use_container_width=True)
+            if st.button("시뮬레이션 실행", key="investment_mc_button", use_container_width=True):
+                monthly_equivalent = monthly_contribution / 12 if contribution_period == "연 납입" else monthly_contribution
+                bands_df, _ = simulate_investment(
+                    initial_investment,
+                    monthly_equivalent,
+                    effective_monthly_rate,
+                    total_months,
+                    contribution_period,
+                    escalation_rate=escalation_rate,
+                    annual_volatility=annual_volatility,
+                    n_paths=n_paths,
+                    target=mc_target,
+                    seed=seed
+                )
+                st.session_state.investment_mc_result = (bands_df, mc_target)
             
-        else:  # 현재가치(PV) 계산
-            # 현재가치 계산
-            present_value = calculate_present_value(target_amount, monthly_equivalent, effective_monthly_rate, total_months)
+            if st.session_state.investment_mc_result is not None:
+                bands_df, mc_target = st.session_state.investment_mc_result
+                final = bands_df.iloc[-1]
+                col1, col2, col3 = st.columns(3)
+                col1.metric("최종 자산 중앙값", f"₩{final['P50']:,.0f}")
+                col2.metric("하위 5% 최종 자산", f"₩{final['P5']:,.0f}")
+                col3.metric("목표 달성 확률", f"{final['목표달성확률'] * 100:.1f}%")
+                st.plotly_chart(create_fan_chart(bands_df, target=mc_target), use_container_width=True)
+    
+    # 목표금액 기준 역산 (필요 수익률 · 필요 월 납입금액)
+    if calc_type == "미래가치(FV) 계산":
+        with st.expander("🎯 목표 달성 역산 (필요 수익률 · 필요 납입금액)"):
+            goal_target_text = st.text_input("목표금액 (원)", value="300,000,000", key="investment_goal_target")
+            try:
+                goal_target = int(goal_target_text.replace(',', ''))
+            except:
+                goal_target = 300000000
             
-            # 총 기여금 계산
-            if contribution_period == "월 납입":
-                total_contributions = monthly_contribution * total_months
-            else:  # 연 납입
-                total_contributions = monthly_contribution * (total_months / 12)
-                
-            total_required = present_value + total_contributions
-            future_gain = target_amount - total_required
+            monthly_equivalent = monthly_contribution / 12 if contribution_period == "연 납입" else monthly_contribution
+            required_rate = solve_required_return(goal_target, initial_investment, monthly_equivalent, total_months,
+                                                  escalation_rate)
+            required_contribution = solve_required_contribution(goal_target, initial_investment, total_months,
+                                                                effective_monthly_rate, escalation_rate)
             
-            # 결과 표시
-            st.subheader("투자 결과")
-            col1, col2, col3 = st.columns(3)
-            col1.metric("필요 초기 투자금", f"₩{present_value:,.0f}")
-            col2.metric("총 정기 투자액", f"₩{total_contributions:,.0f}")
-            col3.metric("투자 수익", f"₩{future_gain:,.0f}", f"{future_gain/total_required*100:.1f}%")
+            col1, col2 = st.columns(2)
+            col1.metric(
+                "필요 연수익률 (월 복리)",
+                f"{required_rate:.2f}%" if np.isfinite(required_rate) else "계산 불가",
+                help="현재 초기투자금과 정기 투자금액으로 목표금액에 도달하기 위한 수익률입니다."
+            )
+            col2.metric(
+                "필요 월 납입금액",
+                f"₩{required_contribution:,.0f}",
+                help="현재 수익률 가정에서 목표금액에 도달하기 위한 월 납입금액입니다. 연간 투자금 증가율을 지정하면 첫해 월 납입금액입니다."
+            )
             
-            # 결과 데이터
-            df = generate_investment_data(present_value, monthly_equivalent, effective_monthly_rate, total_months, contribution_period)
+            st.write("**투자 기간별 필요 조건**")
+            horizon_table = required_return_by_horizon(
+                goal_target, initial_investment, monthly_equivalent, np.arange(1, 51), monthly_rate=effective_monthly_rate,
+                escalation_rate=escalation_rate
+            )
+            st.dataframe(
+                horizon_table.drop(columns=['반복횟수', '수렴']).style.format({
+                    '필요 연수익률 (%)': '{:.2f}%',
+                    '총 납입액': '{:,.0f}',
+                    '필요 월 납입금액': '{:,.0f}'
+                }, na_rep='계산 불가'),
+                use_container_width=True
+            )
+    
+    # 과거 수익률 백테스트 (미래가치 모드)
+    if calc_type == "미래가치(FV) 계산":
+        with st.expander("📜 과거 수익률 백테스트"):
+            datasets = list_return_datasets()
+            uploaded = st.file_uploader(
+                "월간 수익률 CSV 업로드 (선택)",
+                type="csv",
+                help="날짜(YYYY-MM) 열과 자산별 월 수익률(%) 열로 구성된 파일입니다. 업로드하지 않으면 앱에 포함된 데이터를 사용합니다.",
+                key="investment_backtest_upload"
+            )
+            if uploaded is None and not datasets:
+                st.info("사용할 수 있는 수익률 데이터가 없습니다. data/returns 디렉터리에 CSV 또는 Parquet 파일을 추가하거나 파일을 업로드하세요.")
+            else:
+                if uploaded is not None:
+                    returns_df = load_monthly_returns(uploaded)
+                else:
+                    dataset = st.selectbox("데이터셋", options=list(datasets), key="investment_backtest_dataset")
+                    returns_df = load_monthly_returns(datasets[dataset])
+                asset = st.selectbox("자산", options=list(returns_df.columns), key="investment_backtest_asset")
+                
+                if 'investment_backtest_result' not in st.session_state:
+                    st.session_state.investment_backtest_result = None
+                
+                if st.button("백테스트 실행", key="investment_backtest_button", use_container_width=True):
+                    monthly_equivalent = monthly_contribution / 12 if contribution_period == "연 납입" else monthly_contribution
+                    try:
+                        backtest_df = backtest_rolling_windows(
+                            returns_df[asset], initial_investment, monthly_equivalent, total_months, contribution_period,
+                            escalation_rate
+                        )
+                    except ValueError as e:
+                        st.warning(str(e))
+                    else:
+                        summary = summarize_backtest(backtest_df)
+                        worst_path, best_path = (
+                            backtest_window_path(returns_df[asset], summary[key]["시작월"], initial_investment,
+                                                 monthly_equivalent, total_months, contribution_period, escalation_rate)
+                            for key in ["worst", "best"]
+                        )
+                        st.session_state.investment_backtest_result = (asset, backtest_df, summary, worst_path, best_path)
+                
+                if st.session_state.investment_backtest_result is not None:
+                    asset, backtest_df, summary, worst_path, best_path = st.session_state.investment_backtest_result
+                    st.write(f"**{asset}** · {len(backtest_df):,}개 구간")
+                    col1, col2, col3, col4 = st.columns(4)
+                    col1.metric("최종 자산 중앙값", f"₩{summary['distribution']['P50']:,.0f}")
+                    col2.metric("최악 구간", f"₩{summary['worst']['최종자산']:,.0f}", f"{summary['worst']['시작월']} 시작", delta_color="off")
+                    col3.metric("최고 구간", f"₩{summary['best']['최종자산']:,.0f}", f"{summary['best']['시작월']} 시작", delta_color="off")
+                    col4.metric("원금 손실 확률", f"{summary['loss_probability'] * 100:.1f}%")
+                    st.plotly_chart(create_backtest_chart(backtest_df, worst_path, best_path), use_container_width=True)
+    
+    # 여러 자산 포트폴리오 (목표 비중 · 리밸런싱)
+    if calc_type == "미래가치(FV) 계산":
+        with st.expander("🧺 자산배분 포트폴리오 (리밸런싱)"):
+            assets_df = st.data_editor(
+                pd.DataFrame({
+                    "자산": ["국내주식", "해외주식", "채권"],
+                    "목표 비중 (%)": [30.0, 40.0, 30.0],
+                    "기대수익률 (%)": [7.0, 8.0, 3.5],
+                    "변동성 (%)": [20.0, 16.0, 5.0],
+                }),
+                num_rows="dynamic",
+                use_container_width=True,
+                key="investment_portfolio_assets"
+            )
+            assets_df = assets_df.dropna()
+            assets_df = assets_df[assets_df["목표 비중 (%)"] > 0]
             
-            # 표시 간격 선택
-            display_interval = st.selectbox(
-                "표시 간격",
-                options=["연도별", "월별", "분기별"],
-                index=0
+            pf_col1, pf_col2, pf_col3 = st.columns(3)
+            rebalance = pf_col1.selectbox(
+                "리밸런싱",
+                options=["연", "분기", "월", "허용범위 이탈 시", "없음"],
+                key="investment_portfolio_rebalance"
+            )
+            drift_band = None
+            if rebalance == "허용범위 이탈 시":
+                drift_band = pf_col1.number_input("허용범위 (%p)", min_value=1.0, max_value=30.0, value=5.0, step=1.0)
+            correlation_value = pf_col2.number_input(
+                "자산 간 상관계수",
+                min_value=-0.5,
+                max_value=0.95,
+                value=0.3,
+                step=0.05,
+                help="모든 자산 쌍에 같은 상관계수를 적용합니다."
+            )
+            portfolio_paths = pf_col3.number_input(
+                "시뮬레이션 횟수",
+                min_value=1_000,
+                max_value=50_000,
+                value=5_000,
+                step=1_000,
+                key="investment_portfolio_paths"
             )
             
-            if display_interval == "연도별":
-                display_df = df[df['월'] % 12 == 0].copy()
-                display_df['기간'] = display_df['월'] // 12
-                display_df['단위'] = "년"
-            elif display_interval == "분기별":
-                display_df = df[df['월'] % 3 == 0].copy()
-                display_df['기간'] = display_df['월'] // 3
-                display_df['단위'] = "분기"
-            else:  # 월별
-                display_df = df.copy()
-                display_df['기간'] = display_df['월']
-                display_df['단위'] = "월"
+            if 'investment_portfolio_result' not in st.session_state:
+                st.session_state.investment_portfolio_result = None
             
-            display_df = display_df[['기간', '단위', '투자원금', '투자수익', '총자산']].copy()
+            if st.button("포트폴리오 시뮬레이션", key="investment_portfolio_button", use_container_width=True):
+                if assets_df.empty:
+                    st.warning("목표 비중이 0보다 큰 자산을 한 개 이상 입력하세요.")
+                else:
+                    n_assets = len(assets_df)
+                    correlation = np.full((n_assets, n_assets), correlation_value)
+                    np.fill_diagonal(correlation, 1.0)
+                    monthly_equivalent = monthly_contribution / 12 if contribution_period == "연 납입" else monthly_contribution
+                    try:
+                        st.session_state.investment_portfolio_result = simulate_portfolio(
+                            initial_investment,
+                            monthly_equivalent,
+                            assets_df["목표 비중 (%)"].to_numpy(),
+                            total_months,
+                            expected_returns=assets_df["기대수익률 (%)"].to_numpy(),
+                            volatilities=assets_df["변동성 (%)"].to_numpy(),
+                            correlation=correlation,
+                            contribution_period=contribution_period,
+                            escalation_rate=escalation_rate,
+                            rebalance="없음" if drift_band is not None else rebalance,
+                            drift_band=drift_band,
+                            n_paths=portfolio_paths,
+                            seed=42,
+                            asset_names=assets_df["자산"].astype(str).tolist()
+                        )
+                    except np.linalg.LinAlgError:
+                        st.warning("상관계수 행렬을 만들 수 없습니다. 자산 수에 비해 음의 상관계수가 너무 큽니다.")
             
-            # 숫자 포맷팅
-            for col in ['투자원금', '투자수익', '총자산']:
-                display_df[col] = display_df[col].map('{:,.0f}'.format)
-                
-            st.dataframe(display_df, use_container_width=True)
+            if st.session_state.investment_portfolio_result is not None:
+                portfolio = st.session_state.investment_portfolio_result
+                final = portfolio["bands"].iloc[-1]
+                col1, col2, col3 = st.columns(3)
+                col1.metric("최종 자산 중앙값", f"₩{final['P50']:,.0f}")
+                col2.metric("하위 5% 최종 자산", f"₩{final['P5']:,.0f}")
+                col3.metric("평균 리밸런싱 횟수", f"{portfolio['rebalance_count']:,.1f}회", f"회전율 {portfolio['turnover']:,.0f}%", delta_color="off")
+                st.plotly_chart(create_fan_chart(portfolio["bands"]), use_container_width=True)
+                st.plotly_chart(create_portfolio_chart(portfolio["holdings"]), use_container_width=True)
+    
+    # 계좌 유형별 세후 수익 비교 (일반과세 · ISA · 연금저축/IRP)
+    if calc_type == "미래가치(FV) 계산":
+        with st.expander("🧾 세후 수익 비교 (일반과세 · ISA · 연금저축/IRP)"):
+            tax_col1, tax_col2, tax_col3 = st.columns(3)
+            tax_timing = tax_col1.radio(
+                "일반과세 과세 시점",
+                options=TAX_TIMINGS,
+                help="매기: 이자·배당을 받을 때마다 원천징수 / 실현시: 해지할 때 누적 수익에 한 번에 과세",
+                key="investment_tax_timing"
+            )
+            taxable_percent = tax_col1.slider(
+                "수익 중 이자·배당 비중 (%)",
+                min_value=0,
+                max_value=100,
+                value=100,
+                step=5,
+                help="국내주식 매매차익처럼 비과세인 수익은 제외하고 15.4% 과세 대상 비중만 입력합니다.",
+                key="investment_tax_taxable_ratio"
+            )
+            isa_type = tax_col2.radio("ISA 유형", options=list(ISA_TAX_FREE_LIMITS), key="investment_tax_isa_type")
+            credit_bracket = tax_col3.selectbox(
+                "연금저축/IRP 세액공제율",
+                options=list(PENSION_CREDIT_RATES),
+                help=" / ".join(f"{k}: {v * 100:.1f}%" for k, v in PENSION_CREDIT_RATES.items()),
+                key="investment_tax_credit_bracket"
+            )
+            pension_age = tax_col3.selectbox(
+                "연금 수령 나이",
+                options=list(PENSION_INCOME_TAX_RATES),
+                help="연금소득세 " + " / ".join(f"{k}: {v * 100:.1f}%" for k, v in PENSION_INCOME_TAX_RATES.items()),
+                key="investment_tax_pension_age"
+            )
+            
+            monthly_equivalent = monthly_contribution / 12 if contribution_period == "연 납입" else monthly_contribution
+            after_tax = compare_tax_wrappers(
+                initial_investment,
+                monthly_equivalent,
+                effective_monthly_rate,
+                total_months,
+                contribution_period=contribution_period,
+                escalation_rate=escalation_rate,
+                taxable_ratio=taxable_percent / 100,
+                tax_timing=tax_timing,
+                isa_type=isa_type,
+                credit_rate=PENSION_CREDIT_RATES[credit_bracket],
+                pension_tax_rate=PENSION_INCOME_TAX_RATES[pension_age]
+            )
+            
+            if after_tax["isa_over_limit"]:
+                st.warning(f"연간 납입액이 ISA 납입 한도(₩{ISA_ANNUAL_CONTRIBUTION_LIMIT:,.0f})를 넘는 해가 있습니다. 한도 초과분은 ISA에 납입할 수 없습니다.")
+            st.dataframe(
+                after_tax["summary"].style.format({
+                    **{col: '{:,.0f}' for col in ['납입원금', '세전 평가액', '세금', '세액공제 환급(재투자)', '세후 평가액']},
+                    '세후 수익률 (%)': '{:.1f}'
+                }),
+                use_container_width=True
+            )
+            st.plotly_chart(create_after_tax_chart(after_tax["paths"]), use_container_width=True)
+            st.caption("ISA는 의무 보유 기간(3년) 이후 해지, 연금저축/IRP는 55세 이후 연 1,500만원 이하 연금 수령을 가정합니다. "
+                       "세액공제 환급금은 다음 해 1월 일반과세 계좌에 재투자한 것으로 계산합니다.")
 
-def calculate_future_value(initial_investment, monthly_contribution, monthly_rate, total_months):
-    """미래 자금을 계산합니다."""
-    # 현재 저축의 성장
-    future_savings = initial_investment * (1 + monthly_rate) ** total_months
+def _render_xirr_mode():
+    """불규칙한 입금·출금 내역의 연환산 수익률(XIRR)을 계산하는 화면을 그립니다"""
+    input_mode = st.radio(
+        "입력 방식",
+        options=["직접 입력", "CSV 업로드 (여러 계좌)"],
+        horizontal=True,
+        key="investment_xirr_input"
+    )
     
-    # 월 저축의 성장 (복리 적용)
-    if monthly_rate > 0:
-        future_contributions = monthly_contribution * ((1 + monthly_rate) ** total_months - 1) / monthly_rate
+    if input_mode == "직접 입력":
+        st.caption("입금(투자)은 음수, 출금과 현재 평가액은 양수로 입력하세요.")
+        flows_df = st.data_editor(
+            pd.DataFrame({
+                "날짜": pd.to_datetime(["2021-01-04", "2021-07-01", "2022-03-15", "2023-01-02", "2023-08-20", "2024-12-31"]),
+                "금액": [-10_000_000.0, -3_000_000.0, -5_000_000.0, 2_000_000.0, -4_000_000.0, 24_000_000.0],
+            }),
+            num_rows="dynamic",
+            column_config={
+                "날짜": st.column_config.DateColumn(format="YYYY-MM-DD", required=True),
+                "금액": st.column_config.NumberColumn(format="%d", required=True),
+            },
+            use_container_width=True,
+            key="investment_xirr_flows"
+        )
+        flows_df = flows_df.dropna()
+        if flows_df.empty:
+            return
+        
+        result = xirr_batch(flows_df.assign(계좌="입력")).iloc[0]
+        col1, col2, col3 = st.columns(3)
+        if result["수렴"]:
+            col1.metric("연환산 수익률 (XIRR)", f"{result['연환산 수익률 (%)']:.2f}%")
+        else:
+            col1.metric("연환산 수익률 (XIRR)", "계산 불가")
+        col2.metric("총 입금액", f"₩{result['총 입금액']:,.0f}")
+        col3.metric("순손익", f"₩{result['순손익']:,.0f}")
+        if not result["수렴"]:
+            st.warning("수익률을 계산할 수 없습니다. 입금(음수)과 출금·평가액(양수)이 모두 있어야 하며, 연 -99% ~ 1000% 범위 안의 해만 찾습니다.")
     else:
-        future_contributions = monthly_contribution * total_months
-    
-    return future_savings + future_contributions
+        uploaded = st.file_uploader(
+            "현금흐름 CSV 업로드",
+            type="csv",
+            help="계좌, 날짜(YYYY-MM-DD), 금액 열로 구성된 긴 형식 파일입니다. 계좌마다 마지막 평가액을 양수 현금흐름으로 포함하세요.",
+            key="investment_xirr_upload"
+        )
+        if uploaded is None:
+            st.info("계좌, 날짜, 금액 열을 가진 CSV 파일을 업로드하면 계좌별 수익률을 한 번에 계산합니다.")
+            return
+        
+        cash_flows = pd.read_csv(uploaded)
+        missing = {"계좌", "날짜", "금액"} - set(cash_flows.columns)
+        if missing:
+            st.warning(f"필요한 열이 없습니다: {', '.join(sorted(missing))}")
+            return
+        
+        results = xirr_batch(cash_flows)
+        rates = results.loc[results["수렴"], "연환산 수익률 (%)"]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("계좌 수", f"{len(results):,}개", f"계산 불가 {(~results['수렴']).sum():,}개", delta_color="off")
+        col2.metric("수익률 중앙값", f"{rates.median():.2f}%" if len(rates) else "-")
+        col3.metric("손실 계좌 비율", f"{(rates < 0).mean() * 100:.1f}%" if len(rates) else "-")
+        st.dataframe(
+            results.style.format({
+                '연환산 수익률 (%)': '{:.2f}',
+                **{col: '{:,.0f}' for col in ['총 입금액', '총 출금액', '순손익']}
+            }),
+            use_container_width=True
+        )
+        st.download_button(
+            "계좌별 수익률 내려받기 (CSV)",
+            data=results.to_csv().encode('utf-8-sig'),
+            file_name="account_xirr.csv",
+            mime="text/csv"
+        )
 
-def calculate_present_value(future_value, monthly_contribution, monthly_rate, total_months):
-    """필요한 초기 투자금을 계산합니다."""
-    # 월 납입금의 미래 가치
-    if monthly_rate > 0:
-        contribution_future_value = monthly_contribution * ((1 + monthly_rate) ** total_months - 1) / monthly_rate
+def _calculate_investment_result(calc_type, base_amount, monthly_contribution, contribution_period,
+                                 effective_monthly_rate, total_months, escalation_rate=0.0):
+    """요약 지표와 월별 성장 데이터를 계산해 ((계산 유형, 지표), 데이터프레임)으로 반환합니다."""
+    # 투자 주기에 따른 기여금 조정
+    if contribution_period == "연 납입":
+        monthly_equivalent = monthly_contribution / 12
     else:
-        contribution_future_value = monthly_contribution * total_months
+        monthly_equivalent = monthly_contribution
+    # 수익률 0%의 미래가치 계수 = 납입 횟수 (증가율 반영)
+    regular_contributions = monthly_equivalent * annuity_factor(0.0, total_months, escalation_rate)
     
-    # 필요한 초기 투자금 계산
-    required_initial_investment = (future_value - contribution_future_value) / ((1 + monthly_rate) ** total_months)
+    if calc_type == "미래가치(FV) 계산":
+        future_value = calculate_future_value(base_amount, monthly_equivalent, effective_monthly_rate, total_months,
+                                              escalation_rate)
+        total_contributions = base_amount + regular_contributions
+        metrics = (future_value, total_contributions, future_value - total_contributions)
+        initial_amount = base_amount
+    else:  # 현재가치(PV) 계산
+        present_value = calculate_present_value(base_amount, monthly_equivalent, effective_monthly_rate, total_months,
+                                                escalation_rate)
+        total_required = present_value + regular_contributions
+        metrics = (present_value, regular_contributions, base_amount - total_required, total_required)
+        initial_amount = present_value
+    
+    df = generate_investment_data(initial_amount, monthly_equivalent, effective_monthly_rate, total_months,
+                                  contribution_period, escalation_rate)
+    return (calc_type, metrics), df
+
+def investment_display_view(df, display_interval):
+    """월별 성장 데이터에서 표시 간격(연도별/분기별/월별)에 맞는 행만 골라 보여줄 표를 만듭니다."""
+    if display_interval == "연도별":
+        step, unit = 12, "년"
+    elif display_interval == "분기별":
+        step, unit = 3, "분기"
+    else:  # 월별
+        step, unit = 1, "월"
+    
+    # 월 열이 0부터 1씩 증가하므로 간격별 행은 단순 슬라이싱으로 선택
+    view = df.iloc[::step]
+    return pd.DataFrame({
+        '기간': view['월'].to_numpy() // step,
+        '단위': unit,
+        '투자원금': view['투자원금'].to_numpy(),
+        '투자수익': view['투자수익'].to_numpy(),
+        '총자산': view['총자산'].to_numpy()
+    }, index=view.index)
+
+def calculate_future_value(initial_investment, monthly_contribution, monthly_rate, total_months, escalation_rate=0.0):
+    """미래 자금을 계산합니다. escalation_rate는 정기 투자금의 연간 증가율(소수)입니다."""
+    # 현재 투자금의 성장 + 월 투자금의 성장 (매년 계단식 증액은 성장형 연금 닫힌 식)
+    return fv(monthly_rate, total_months, monthly_contribution, initial_investment, escalation_rate)
+
+def calculate_present_value(future_value, monthly_contribution, monthly_rate, total_months, escalation_rate=0.0):
+    """필요한 초기 투자금을 계산합니다. escalation_rate는 정기 투자금의 연간 증가율(소수)입니다."""
+    # 목표금액에서 월 납입금의 미래 가치를 뺀 뒤 현재 가치로 할인
+    required_initial_investment = pv(monthly_rate, total_months, monthly_contribution, future_value, escalation_rate)
     
     return max(0, required_initial_investment)
 
-def generate_investment_data(initial_investment, monthly_contribution, monthly_rate, total_months, contribution_period):
+def generate_investment_data(initial_investment, monthly_contribution, monthly_rate, total_months, contribution_period,
+                             escalation_rate=0.0):
     """투자 성장 데이터를 생성합니다."""
-    data = []
-    balance = initial_investment
-    invested = initial_investment
+    month = np.arange(total_months + 1)
+    contributions = contribution_schedule(monthly_contribution, total_months, contribution_period, escalation_rate)
+    invested = initial_investment + np.cumsum(contributions)
     
-    for month in range(total_months + 1):
-        if month > 0:
-            # 이자 계산
-            interest = balance * monthly_rate
-            
-            # 월 납입인 경우 매월 추가, 연 납입인 경우 매년 시작시 추가
-            if contribution_period == "월 납입" or (contribution_period == "연 납입" and month % 12 == 1):
-                # 연 납입인 경우 한 번에 12개월치 추가
-                contribution = monthly_contribution if contribution_period == "월 납입" else monthly_contribution * 12
-                balance += interest + contribution
-                invested += contribution
-            else:
-                balance += interest
-        
-        data.append({
-            '월': month,
-            '투자원금': invested,
-            '투자수익': balance - invested,
-            '총자산': balance
-        })
+    # 잔액 B_m = B_(m-1) × (1 + r) + c_m 의 닫힌 식: B_m = G_m × (B_0 + Σ c_j / G_j), G_m = (1 + r)^m
+    growth = np.exp(month * np.log1p(monthly_rate))
+    balance = growth * (initial_investment + np.cumsum(contributions / growth))
     
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        '월': month,
+        '투자원금': invested,
+        '투자수익': balance - invested,
+        '총자산': balance
+    })
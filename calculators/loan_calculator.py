@@ -1,6 +1,20 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import datetime
+from utils.financial_utils import (
+    PAYMENT_TYPES, SCHEDULE_COLUMNS, amortization_columns, calculate_loan_grid, calculate_loan_schedule,
+    calculate_loan_summary, compare_repayment_methods, loan_schedule_page
+)
+from utils.loan_dates import calculate_dated_loan_schedule, korean_holidays, load_holidays
+from utils.loan_rounding import ROUNDING_RULES, calculate_loan_schedule_won
+from utils.refinance import analyze_refinancing
+from utils.loan_segments import calculate_segmented_schedule
+from utils.loan_solvers import solve_loan_principal, solve_loan_rate, solve_loan_term
+from utils.visualization import (
+    create_loan_payment_chart, create_loan_sensitivity_heatmap, create_refinance_savings_chart,
+    create_repayment_comparison_chart
+)
 
 def loan_calculator():
     st.header("대출계산기")
@@ -34,96 +48,359 @@ def loan_calculator():
             "상환방식",
             ["원리금균등상환", "원금균등상환", "만기일시상환"]
         )
+        show_schedule = st.checkbox(
+            "상환 스케줄 표시",
+            value=True,
+            help="끄면 상환 스케줄 없이 대출 요약만 빠르게 계산합니다."
+        )
+        won_rounding = st.selectbox(
+            "원 단위 처리",
+            options=["사용 안 함"] + ROUNDING_RULES,
+            index=0,
+            help="선택하면 모든 금액을 원 단위 정수로 계산하고, 회차별 이자에 선택한 규칙을 적용합니다. "
+                 "원리금균등상환은 반올림 차이를 회차별로 맞춰 가므로 수천 회차에서는 실수 계산보다 10배 이상 느릴 수 있습니다."
+        )
+
+    with st.expander("변동금리 · 중도상환 설정 (선택)"):
+        event_col1, event_col2 = st.columns(2)
+        with event_col1:
+            st.write("**금리 변경**")
+            rate_changes_df = st.data_editor(
+                pd.DataFrame({"적용 회차": pd.Series(dtype="int64"), "연이자율 (%)": pd.Series(dtype="float64")}),
+                num_rows="dynamic",
+                use_container_width=True,
+                key="loan_rate_changes"
+            )
+        with event_col2:
+            st.write("**중도상환**")
+            prepayments_df = st.data_editor(
+                pd.DataFrame({"상환 회차": pd.Series(dtype="int64"), "중도상환금액 (원)": pd.Series(dtype="float64")}),
+                num_rows="dynamic",
+                use_container_width=True,
+                key="loan_prepayments"
+            )
+        fee_col1, fee_col2 = st.columns(2)
+        prepayment_fee_rate = fee_col1.number_input(
+            "중도상환수수료율 (%)",
+            min_value=0.0,
+            max_value=5.0,
+            value=1.2,
+            step=0.1
+        )
+        fee_periods = fee_col2.number_input(
+            "수수료 부과기간 (개월)",
+            min_value=0,
+            max_value=120,
+            value=36,
+            help="대출 실행 후 이 기간이 지나면 중도상환수수료가 면제됩니다."
+        )
+
+    with st.expander("대출 역산 계산 (월 납입금액 기준)"):
+        solve_target = st.radio(
+            "계산 항목",
+            options=["대출 가능 금액", "실질 연이자율", "필요 대출기간"],
+            horizontal=True,
+            help="위에 입력한 대출금액·대출기간·연이자율·상환방식 중 선택한 항목을 월 납입금액으로 역산합니다."
+        )
+        payment_text = st.text_input(
+            "월 납입금액 (원)",
+            value="1,500,000",
+            help="원금균등상환은 첫 회차 납입금액, 만기일시상환은 월 이자 납입금액 기준입니다."
+        )
+        try:
+            target_payment = int(payment_text.replace(',', ''))
+        except:
+            target_payment = 1500000
+
+        if st.button("역산하기", key="loan_solver_button", use_container_width=True):
+            if solve_target == "대출 가능 금액":
+                result = solve_loan_principal(target_payment, loan_term * 12, interest_rate, payment_type)
+                message = f"₩{result:,.0f}" if np.isfinite(result) else None
+            elif solve_target == "실질 연이자율":
+                result = solve_loan_rate(target_payment, loan_amount, loan_term * 12, payment_type)
+                message = f"{result:.2f}%" if np.isfinite(result) else None
+            else:
+                result = solve_loan_term(target_payment, loan_amount, interest_rate, payment_type)
+                message = f"{result:,.0f}개월 ({result / 12:.1f}년)" if np.isfinite(result) else None
+
+            if message:
+                st.metric(solve_target, message)
+            else:
+                st.warning("입력한 조건으로는 계산할 수 없습니다. 월 납입금액이 이자 또는 원금 상환에 충분한지 확인하세요.")
+
+    with st.expander("납입일 기준 계산 (실제 일수/365)"):
+        date_col1, date_col2, date_col3 = st.columns(3)
+        start_date = date_col1.date_input("대출 실행일", value=datetime.date.today())
+        payment_day = date_col2.number_input("약정 납입일", min_value=1, max_value=31, value=start_date.day)
+        roll_label = date_col3.selectbox(
+            "휴일 납입일 조정",
+            options=["다음 영업일", "다음 영업일 (월말 넘으면 직전 영업일)", "조정 안 함"],
+            help="주말과 공휴일(양력 고정 공휴일, 설날·추석·부처님오신날, 대체공휴일, 선거일)에 해당하는 납입일을 영업일로 옮깁니다."
+        )
+        roll = {"다음 영업일": "following", "다음 영업일 (월말 넘으면 직전 영업일)": "modifiedfollowing"}.get(roll_label, "none")
+
+        if st.button("납입일 기준 계산하기", key="loan_dated_button", use_container_width=True):
+            # 양력 고정 공휴일 + 배포된 음력·대체공휴일 목록 (목록에 없는 연도는 양력 고정 공휴일만 반영)
+            listed_holidays = load_holidays()
+            holidays = korean_holidays(start_date.year, start_date.year + loan_term + 2, listed_holidays)
+            dated_df = calculate_dated_loan_schedule(
+                loan_amount, interest_rate, payment_type, start_date, loan_term * 12,
+                payment_day=payment_day, holidays=holidays, roll=roll
+            )
+            listed_years = listed_holidays.astype("datetime64[Y]").astype(int) + 1970
+            if start_date.year + loan_term > listed_years.max():
+                st.caption(f"설날·추석·부처님오신날·대체공휴일·선거일은 {listed_years.min()}~{listed_years.max()}년만 반영되며, "
+                           "이후 납입일은 주말과 양력 고정 공휴일만 조정합니다.")
+            st.dataframe(
+                dated_df.style.format({
+                    '납입일': lambda d: d.strftime('%Y-%m-%d'),
+                    **{col: '{:,.0f}' for col in SCHEDULE_COLUMNS}
+                }),
+                use_container_width=True
+            )
+            dated_interest = dated_df['이자금액'].sum()
+            dated_col1, dated_col2 = st.columns(2)
+            dated_col1.metric("총 상환금액", f"₩{loan_amount + dated_interest:,.0f}")
+            dated_col2.metric("총 이자금액", f"₩{dated_interest:,.0f}")
+
+    # 상태 초기화
+    if 'loan_inputs' not in st.session_state:
+        st.session_state.loan_inputs = None
 
     if st.button("계산하기", key="loan_button", use_container_width=True):
+        st.session_state.loan_inputs = {
+            "loan_amount": loan_amount,
+            "loan_term": loan_term,
+            "interest_rate": interest_rate,
+            "payment_type": payment_type,
+            "rate_changes": list(rate_changes_df.dropna().itertuples(index=False, name=None)),
+            "prepayments": list(prepayments_df.dropna().itertuples(index=False, name=None)),
+            "prepayment_fee_rate": prepayment_fee_rate,
+            "fee_periods": fee_periods,
+            "won_rounding": won_rounding,
+        }
+
+    # 계산 결과가 있을 때만 표시 (페이지 이동 시에도 결과 유지)
+    if st.session_state.loan_inputs:
+        inputs = st.session_state.loan_inputs
+        loan_amount = inputs["loan_amount"]
+        interest_rate = inputs["interest_rate"]
+        payment_type = inputs["payment_type"]
         monthly_rate = interest_rate / 12 / 100
-        periods = loan_term * 12
+        periods = inputs["loan_term"] * 12
 
-        # 대출 상환 스케줄 계산
-        schedule = []
-        remaining = loan_amount
-        
-        if payment_type == "원리금균등상환":
-            # 원리금균등상환 - 매달 동일한 금액 납부
-            if monthly_rate == 0:
-                payment = loan_amount / periods
-            else:
-                payment = loan_amount * (monthly_rate * (1 + monthly_rate) ** periods) / ((1 + monthly_rate) ** periods - 1)
-            
-            for period in range(1, periods + 1):
-                interest = remaining * monthly_rate
-                principal_payment = payment - interest
-                remaining -= principal_payment
-                
-                # 마지막 회차에는 반올림 오차로 인해 잔액이 음수가 될 수 있음
-                if period == periods:
-                    if abs(remaining) < 1:  # 1원 미만이면 0으로 조정
-                        remaining = 0
-                
-                schedule.append({
-                    "회차": period,
-                    "납입금액": payment,
-                    "원금상환": principal_payment,
-                    "이자금액": interest,
-                    "잔금": max(0, remaining)
-                })
-                
-        elif payment_type == "원금균등상환":
-            # 원금균등상환 - 매달 동일한 원금 상환
-            principal_payment = loan_amount / periods
-            
-            for period in range(1, periods + 1):
-                interest = remaining * monthly_rate
-                payment = principal_payment + interest
-                remaining -= principal_payment
-                
-                schedule.append({
-                    "회차": period,
-                    "납입금액": payment,
-                    "원금상환": principal_payment,
-                    "이자금액": interest,
-                    "잔금": max(0, remaining)
-                })
-                
-        elif payment_type == "만기일시상환":
-            # 만기일시상환 - 이자만 납부하다가 마지막에 원금 상환
-            for period in range(1, periods + 1):
-                interest = remaining * monthly_rate
-                
-                if period == periods:
-                    principal_payment = loan_amount
-                    payment = loan_amount + interest
-                    remaining = 0
-                else:
-                    principal_payment = 0
-                    payment = interest
-                
-                schedule.append({
-                    "회차": period,
-                    "납입금액": payment,
-                    "원금상환": principal_payment,
-                    "이자금액": interest,
-                    "잔금": remaining
-                })
-        
-        schedule_df = pd.DataFrame(schedule).set_index("회차")
+        if inputs["rate_changes"] or inputs["prepayments"]:
+            # 변동금리 · 중도상환 구간별 스케줄
+            schedule_df, prepayment_df = calculate_segmented_schedule(
+                loan_amount,
+                periods,
+                interest_rate,
+                payment_type,
+                rate_changes=inputs["rate_changes"],
+                prepayments=inputs["prepayments"],
+                prepayment_fee_rate=inputs["prepayment_fee_rate"],
+                fee_periods=inputs["fee_periods"]
+            )
+
+            if show_schedule:
+                st.subheader("상환 스케줄 (변동금리 · 중도상환 반영)")
+                money_columns = [col for col in schedule_df.columns if col != '적용금리']
+                st.dataframe(
+                    schedule_df.style.format({'적용금리': '{:.2f}%', **{col: '{:,.0f}' for col in money_columns}}),
+                    use_container_width=True
+                )
+
+            if not prepayment_df.empty:
+                st.subheader("중도상환 내역")
+                st.dataframe(prepayment_df.style.format('{:,.0f}'), use_container_width=True)
+                st.caption("절감이자는 중도상환 시점의 금리가 만기까지 유지된다고 가정한 값입니다.")
+
+            total_interest = schedule_df['이자금액'].sum()
+            total_fee = schedule_df['중도상환수수료'].sum()
 
-        # 결과 섹션을 전체 너비로 표시
-        st.subheader("상환 스케줄")
+            st.subheader("대출 요약")
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("총 상환금액", f"₩{loan_amount + total_interest + total_fee:,.0f}")
+            col2.metric("총 이자금액", f"₩{total_interest:,.0f}")
+            col3.metric("중도상환수수료", f"₩{total_fee:,.0f}")
+            col4.metric("절감이자 합계", f"₩{prepayment_df['절감이자'].sum():,.0f}")
+            return
 
-        # 데이터프레임 숫자 포맷팅
-        formatted_df = schedule_df.copy()
-        for col in ['납입금액', '원금상환', '이자금액', '잔금']:
-            formatted_df[col] = formatted_df[col].map('{:,.0f}'.format)
+        won_schedule_df = None
+        if inputs["won_rounding"] in ROUNDING_RULES:
+            try:
+                won_schedule_df = calculate_loan_schedule_won(
+                    loan_amount, periods, interest_rate, payment_type, inputs["won_rounding"]
+                )
+            except ValueError as e:
+                st.warning(f"{e} 원 단위 처리 없이 계산합니다.")
 
-        st.dataframe(formatted_df, use_container_width=True)
+        if show_schedule:
+            # 결과 섹션을 전체 너비로 표시
+            st.subheader("상환 스케줄")
+
+            page_col1, page_col2 = st.columns(2)
+            page_size = page_col1.selectbox(
+                "페이지당 회차 수",
+                options=[12, 60, 120, 360],
+                index=2,
+                key="loan_page_size"
+            )
+            total_pages = -(-periods // page_size)
+            page = page_col2.number_input(
+                f"페이지 (총 {total_pages}페이지)",
+                min_value=1,
+                max_value=total_pages,
+                value=1,
+                key=f"loan_page_{page_size}"
+            )
+
+            if won_schedule_df is not None:
+                page_df = won_schedule_df.iloc[(page - 1) * page_size:page * page_size]
+            else:
+                # 현재 페이지의 회차만 계산하고, 숫자형 그대로 표시 형식만 지정
+                page_df = loan_schedule_page(loan_amount, periods, monthly_rate, payment_type, page, page_size)
+            st.dataframe(
+                page_df.style.format({col: '{:,.0f}' for col in SCHEDULE_COLUMNS}),
+                use_container_width=True
+            )
+
+            # 상환 차트 (회차가 많으면 분기/연 단위 합산 및 잔금 선 축약). 데이터프레임 없이 배열로 그림
+            if won_schedule_df is not None:
+                chart_values = won_schedule_df
+            else:
+                chart_values = amortization_columns(loan_amount, periods, monthly_rate, payment_type)
+            full_resolution = st.checkbox("차트를 전체 회차 해상도로 보기", value=False, key="loan_chart_full")
+            st.plotly_chart(
+                create_loan_payment_chart(chart_values, full_resolution=full_resolution),
+                use_container_width=True
+            )
 
-        # 간단한 요약 정보
-        total_payment = schedule_df['납입금액'].sum()
-        total_interest = schedule_df['이자금액'].sum()
+            # 전체 스케줄 CSV는 요청할 때만 만들고, 같은 입력이면 만들어 둔 바이트를 재사용
+            if 'loan_schedule_csv' not in st.session_state:
+                st.session_state.loan_schedule_csv = None
+            csv_key = (loan_amount, periods, monthly_rate, payment_type, inputs["won_rounding"])
+            if st.button("전체 상환 스케줄 CSV 만들기", key="loan_csv_button"):
+                if won_schedule_df is not None:
+                    full_schedule_df = won_schedule_df
+                else:
+                    full_schedule_df = calculate_loan_schedule(loan_amount, periods, monthly_rate, payment_type)
+                st.session_state.loan_schedule_csv = (csv_key, full_schedule_df.to_csv().encode('utf-8-sig'))
+            if st.session_state.loan_schedule_csv is not None and st.session_state.loan_schedule_csv[0] == csv_key:
+                st.download_button(
+                    "전체 상환 스케줄 내려받기 (CSV)",
+                    data=st.session_state.loan_schedule_csv[1],
+                    file_name="loan_schedule.csv",
+                    mime="text/csv"
+                )
+
+        if won_schedule_df is not None:
+            # 원 단위 정수 스케줄의 합계 (원 단위까지 일치)
+            total_payment = won_schedule_df['납입금액'].sum()
+            total_interest = won_schedule_df['이자금액'].sum()
+        else:
+            # 간단한 요약 정보 (스케줄 없이 닫힌 식으로 계산)
+            total_payment, total_interest = calculate_loan_summary(loan_amount, periods, monthly_rate, payment_type)
         
         st.subheader("대출 요약")
         col1, col2, col3 = st.columns(3)
         col1.metric("총 상환금액", f"₩{total_payment:,.0f}")
         col2.metric("총 이자금액", f"₩{total_interest:,.0f}")
         col3.metric("원금대비 이자율", f"{(total_interest/loan_amount)*100:.1f}%")
+
+        # 상환방식 3종 비교
+        with st.expander("상환방식 비교 (원리금균등 · 원금균등 · 만기일시)"):
+            comparison_df, comparison_summary, crossover_period = compare_repayment_methods(
+                loan_amount, periods, monthly_rate
+            )
+            st.dataframe(comparison_summary.style.format('{:,.0f}'), use_container_width=True)
+            if crossover_period is not None:
+                interest_gap = (
+                    comparison_summary.loc['원리금균등상환', '총 이자금액']
+                    - comparison_summary.loc['원금균등상환', '총 이자금액']
+                )
+                st.info(
+                    f"원금균등상환의 월 납입금액은 {crossover_period}회차부터 원리금균등상환보다 작아지며, "
+                    f"총 이자는 원금균등상환이 ₩{interest_gap:,.0f} 적습니다."
+                )
+            st.plotly_chart(create_repayment_comparison_chart(comparison_df, crossover_period), use_container_width=True)
+
+        # 금리 × 기간 민감도 분석
+        with st.expander("금리 × 대출기간 민감도 분석"):
+            grid_col1, grid_col2, grid_col3 = st.columns(3)
+            rate_range = grid_col1.slider(
+                "연이자율 범위 (%)",
+                min_value=0.0,
+                max_value=max(20.0, interest_rate + 2.0),
+                value=(max(0.0, interest_rate - 2.0), interest_rate + 2.0),
+                step=0.1
+            )
+            term_range = grid_col2.slider(
+                "대출기간 범위 (년)",
+                min_value=1,
+                max_value=50,
+                value=(1, 40)
+            )
+            grid_metric = grid_col3.radio("표시 항목", options=["월 납입금액", "총 이자금액"])
+
+            grid_rates = np.round(np.linspace(rate_range[0], rate_range[1], 200), 3)
+            grid_periods = np.arange(term_range[0], term_range[1] + 1) * 12
+            payment_grid, interest_grid = calculate_loan_grid(loan_amount, grid_rates, grid_periods, payment_type)
+
+            if grid_metric == "월 납입금액":
+                fig = create_loan_sensitivity_heatmap(payment_grid, "금리 · 기간별 월 납입금액", "월 납입금액 (원)")
+            else:
+                fig = create_loan_sensitivity_heatmap(interest_grid, "금리 · 기간별 총 이자금액", "총 이자금액 (원)")
+            st.plotly_chart(fig, use_container_width=True)
+
+        # 대환대출 손익분기 분석
+        with st.expander("대환대출 손익분기 분석"):
+            elapsed_periods = st.number_input(
+                "현재까지 납입한 회차",
+                min_value=0,
+                max_value=periods - 1,
+                value=min(24, periods - 1),
+                help="이 회차까지 납입한 뒤의 잔금으로 갈아타는 것으로 계산합니다. 기존 대출의 중도상환수수료 설정이 반영됩니다.",
+                key="refinance_elapsed"
+            )
+            offers_df = st.data_editor(
+                pd.DataFrame({
+                    "연이자율 (%)": [max(0.0, interest_rate - 1.0), max(0.0, interest_rate - 0.5)],
+                    "대출기간 (년)": [inputs["loan_term"], inputs["loan_term"]],
+                    "상환방식": [payment_type, payment_type],
+                    "부대비용 (원)": [1_000_000.0, 0.0],
+                }),
+                column_config={
+                    "상환방식": st.column_config.SelectboxColumn(options=PAYMENT_TYPES, required=True),
+                },
+                num_rows="dynamic",
+                use_container_width=True,
+                key="refinance_offers"
+            )
+            offers_df = offers_df.dropna()
+            offers_df = offers_df[offers_df["대출기간 (년)"] > 0]
+
+            if offers_df.empty:
+                st.info("비교할 대환 상품을 한 개 이상 입력하세요.")
+            else:
+                refinance_summary, savings_df = analyze_refinancing(
+                    loan_amount,
+                    periods,
+                    interest_rate,
+                    payment_type,
+                    elapsed_periods,
+                    offers_df["연이자율 (%)"].to_numpy(),
+                    (offers_df["대출기간 (년)"].to_numpy() * 12).astype(np.int64),
+                    offers_df["상환방식"].to_numpy(),
+                    offers_df["부대비용 (원)"].to_numpy(),
+                    prepayment_fee_rate=inputs["prepayment_fee_rate"],
+                    fee_periods=inputs["fee_periods"]
+                )
+                st.dataframe(
+                    refinance_summary.style.format('{:,.0f}', na_rep='없음'),
+                    use_container_width=True
+                )
+                st.plotly_chart(
+                    create_refinance_savings_chart(savings_df, refinance_summary['손익분기회차']),
+                    use_container_width=True
+                )
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+from utils.tvm import fv, pmt, pv
 
 def retirement_calculator():
     st.header("은퇴계산기")
@@ -109,6 +110,15 @@ def retirement_calculator():
             except:
                 target_monthly_savings = monthly_savings
             
+            savings_growth_rate = st.slider(
+                "연간 저축 증가율 (%)",
+                min_value=0.0,
+                max_value=10.0,
+                value=0.0,
+                step=0.5,
+                help="소득 증가에 맞춰 매년 월 저축액을 늘리는 비율 (0이면 매년 같은 금액)"
+            )
+            
             retirement_withdraw_rate = st.slider(
                 "연간 인출률 (%)",
                 min_value=1.0,
@@ -134,7 +144,8 @@ def retirement_calculator():
             current_savings,
             target_monthly_savings,
             annual_return_rate / 100 / 12,
-            years_to_retirement * 12
+            years_to_retirement * 12,
+            savings_growth_rate / 100
         )
         
         # 은퇴 후 필요 자금 계산 (인출률 기준)
@@ -182,7 +193,8 @@ def retirement_calculator():
             additional_savings_needed = calculate_additional_savings_needed(
                 deficit,
                 annual_return_rate / 100 / 12,
-                years_to_retirement * 12
+                years_to_retirement * 12,
+                savings_growth_rate / 100
             )
             
             current_vs_needed = st.columns(2)
@@ -207,7 +219,8 @@ def retirement_calculator():
                         current_savings,
                         target_monthly_savings,
                         annual_return_rate / 100 / 12,
-                        new_years_to_retirement * 12
+                        new_years_to_retirement * 12,
+                        savings_growth_rate / 100
                     )
                     
                     # 줄어든 은퇴 기간에 따른 필요 자금 재계산
@@ -257,7 +270,8 @@ def retirement_calculator():
                         current_savings,
                         target_monthly_savings,
                         new_return_rate / 100 / 12,
-                        years_to_retirement * 12
+                        years_to_retirement * 12,
+                        savings_growth_rate / 100
                     )
                     
                     funding_ratio = (new_future_value / required_fund) * 100
@@ -294,38 +308,23 @@ def retirement_calculator():
             st.metric("연간 인출률", f"{retirement_withdraw_rate:.1f}%")
             st.metric("필요 은퇴 자금", f"₩{required_fund:,.0f}")
 
-def calculate_future_value(initial_investment, monthly_contribution, monthly_rate, total_months):
-    """은퇴 시점의 자금을 계산합니다."""
-    # 현재 저축의 성장
-    future_savings = initial_investment * (1 + monthly_rate) ** total_months
-    
-    # 월 저축의 성장 (복리 적용)
-    if monthly_rate > 0:
-        future_contributions = monthly_contribution * ((1 + monthly_rate) ** total_months - 1) / monthly_rate
-    else:
-        future_contributions = monthly_contribution * total_months
-    
-    return future_savings + future_contributions
+def calculate_future_value(initial_investment, monthly_contribution, monthly_rate, total_months, escalation_rate=0.0):
+    """은퇴 시점의 자금을 계산합니다. escalation_rate는 월 저축액의 연간 증가율(소수)입니다."""
+    # 현재 저축의 성장 + 월 저축의 성장 (매년 계단식 증액은 성장형 연금 닫힌 식)
+    return fv(monthly_rate, total_months, monthly_contribution, initial_investment, escalation_rate)
 
 def calculate_required_retirement_fund(monthly_expenses, monthly_rate, retirement_months):
     """은퇴 생활에 필요한 자금을 계산합니다."""
-    if monthly_rate > 0:
-        # 현재 가치 계수(Present Value Annuity Factor)를 사용
-        pv_factor = (1 - 1 / (1 + monthly_rate) ** retirement_months) / monthly_rate
-        required_fund = monthly_expenses * pv_factor
-    else:
-        # 수익률이 0인 경우, 단순히 월 지출 * 개월 수
-        required_fund = monthly_expenses * retirement_months
-    
-    return required_fund
+    # 매월 생활비를 인출하는 연금의 현재 가치 (수익률이 0이면 월 지출 * 개월 수)
+    return pv(monthly_rate, retirement_months, pmt=-monthly_expenses)
 
-def calculate_additional_savings_needed(deficit, monthly_rate, months):
-    """부족한 자금을 마련하기 위한 추가 월 저축액을 계산합니다."""
-    if monthly_rate > 0 and months > 0:
-        # 미래 가치를 위한 월 납입액 공식의 역산
-        additional_monthly = deficit * monthly_rate / ((1 + monthly_rate) ** months - 1)
+def calculate_additional_savings_needed(deficit, monthly_rate, months, escalation_rate=0.0):
+    """부족한 자금을 마련하기 위한 추가 월 저축액(첫해 기준)을 계산합니다."""
+    if months > 0:
+        # 미래 가치를 위한 월 납입액 공식의 역산 (저축액 증가율 반영)
+        additional_monthly = pmt(monthly_rate, months, fv=deficit, escalation_rate=escalation_rate)
     else:
-        # 수익률이 0이거나 기간이 0인 경우
-        additional_monthly = deficit / months if months > 0 else deficit
+        # 기간이 0인 경우
+        additional_monthly = deficit
     
     return additional_monthly
@@ -4,6 +4,7 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import re
+from utils.tvm import fv, growth_factor
 
 def calculate_simple_interest(principal, rate, time):
     """단리 계산 함수"""
@@ -15,7 +16,7 @@ def calculate_compound_interest(principal, rate, time, compounds_per_year=1):
     """복리 계산 함수"""
     n = compounds_per_year  # 연간 복리 횟수
     r = rate / 100  # 비율로 변환
-    amount = principal * (1 + r/n)**(n*time)
+    amount = principal * growth_factor(r/n, n*time)
     interest = amount - principal
     return amount, interest
 
@@ -396,14 +397,8 @@ def deposit_installment_calculator():
         # 적금 총 납입액
         total_installment_principal = monthly_deposit * investment_period * 12
         
-        # 매월 납입 시 복리 계산
-        installment_amount = 0
-        for month in range(int(investment_period * 12)):
-            remaining_time = investment_period - (month / 12)
-            amount, _ = calculate_compound_interest(
-                monthly_deposit, interest_rate, remaining_time, 12
-            )
-            installment_amount += amount
+        # 매월 납입 시 복리 계산 (월초 납입 연금의 미래가치)
+        installment_amount = fv(interest_rate / 100 / 12, int(investment_period * 12), monthly_deposit, due=True)
         
         installment_interest = installment_amount - total_installment_principal
         
@@ -413,29 +408,14 @@ def deposit_installment_calculator():
         
         # 차트 데이터 준비
         years = np.arange(0, investment_period + 0.1, 0.25)
-        deposit_values = []
-        installment_values = []
-        installment_principals = []
-        
-        for year in years:
-            # 예금 계산
-            deposit_value, _ = calculate_compound_interest(principal, interest_rate, year, compound_period)
-            deposit_values.append(deposit_value)
-            
-            # 적금 계산
-            months = int(year * 12)
-            installment_principal = monthly_deposit * months
-            installment_principals.append(installment_principal)
-            
-            # 매월 납입 시 복리 계산
-            installment_value = 0
-            for m in range(months):
-                remaining_time = year - (m / 12)
-                if remaining_time > 0:
-                    amount, _ = calculate_compound_interest(monthly_deposit, interest_rate, remaining_time, 12)
-                    installment_value += amount
-            
-            installment_values.append(installment_value)
+        
+        # 예금 계산
+        deposit_values, _ = calculate_compound_interest(principal, interest_rate, years, compound_period)
+        
+        # 적금 계산 (시점별 납입 개월 수에 대한 월초 납입 연금의 미래가치)
+        months = (years * 12).astype(int)
+        installment_principals = monthly_deposit * months
+        installment_values = fv(interest_rate / 100 / 12, months, monthly_deposit, due=True)
         
         # 데이터 저장
         st.session_state.deposit_data = {
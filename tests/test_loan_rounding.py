@@ -0,0 +1,131 @@
+"""
+utils.loan_rounding 원 단위 정수 상환 스케줄 테스트
+
+회차마다 fractions.Fraction으로 순차 계산하는 기준 구현과 원 단위까지 비교합니다.
+
+실행 방법:
+    python -m pytest tests
+"""
+import math
+import os
+import sys
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.loan_rounding import (
+    ROUNDING_RULES, calculate_level_payment_won, calculate_loan_schedule_won, round_won
+)
+
+PAYMENT_TYPES = ["원리금균등상환", "원금균등상환", "만기일시상환"]
+
+FRACTION_ROUNDING = {
+    "절사": math.floor,
+    "반올림": lambda value: math.floor(value + Fraction(1, 2)),
+    "절상": math.ceil,
+}
+
+def fraction_level_payment(principal, periods, annual_rate, rounding):
+    """원리금균등상환 납입금액의 정확한 값 (비교 기준)"""
+    r = Fraction(str(annual_rate)) / 1200
+    if r == 0:
+        return FRACTION_ROUNDING[rounding](Fraction(principal, periods))
+    growth = (1 + r) ** periods
+    return FRACTION_ROUNDING[rounding](principal * r * growth / (growth - 1))
+
+def fraction_schedule(principal, periods, annual_rate, payment_type, rounding):
+    """회차마다 잔금에서 이자를 정확히 계산해 반올림하는 순차 계산 (비교 기준)"""
+    round_fraction = FRACTION_ROUNDING[rounding]
+    r = Fraction(str(annual_rate)) / 1200
+    level_payment = fraction_level_payment(principal, periods, annual_rate, rounding)
+    remaining = principal
+    rows = []
+    for period in range(1, periods + 1):
+        interest = round_fraction(remaining * r)
+        if period == periods:
+            principal_payment = remaining
+        elif payment_type == "원리금균등상환":
+            # 잔금과 이자의 합이 납입금액 이하이면 이번 회차에 완납
+            principal_payment = min(level_payment - interest, remaining)
+        elif payment_type == "원금균등상환":
+            principal_payment = principal // periods
+        else:
+            principal_payment = 0
+        remaining -= principal_payment
+        rows.append((principal_payment + interest, principal_payment, interest, remaining))
+    return np.array(rows, dtype=np.int64)
+
+@pytest.mark.parametrize("rounding", ROUNDING_RULES)
+def test_round_won_matches_fraction(rounding):
+    numerators = np.arange(-50, 51, dtype=np.int64)
+    for denominator in [1, 2, 3, 7, 12_000_000]:
+        expected = [FRACTION_ROUNDING[rounding](Fraction(int(x), denominator)) for x in numerators * 9_999_991]
+        assert round_won(numerators * 9_999_991, denominator, rounding).tolist() == expected
+
+def test_round_won_unknown_rule():
+    with pytest.raises(ValueError):
+        round_won(10, 3, "사사오입")
+
+@pytest.mark.parametrize("rounding", ROUNDING_RULES)
+@pytest.mark.parametrize("principal, periods, annual_rate", [
+    (100_000_000, 360, 4.5),
+    (123_456_789, 120, 19.9),
+    (50_000_000, 37, 0),
+    (300_000_000, 600, 7.77),
+])
+def test_level_payment_matches_fraction(principal, periods, annual_rate, rounding):
+    assert calculate_level_payment_won(principal, periods, annual_rate, rounding) == \
+        fraction_level_payment(principal, periods, annual_rate, rounding)
+
+@pytest.mark.parametrize("rounding", ROUNDING_RULES)
+@pytest.mark.parametrize("payment_type", PAYMENT_TYPES)
+@pytest.mark.parametrize("principal, periods, annual_rate", [
+    (100_000_000, 360, 4.5),
+    (123_456_789, 121, 19.9),
+    (50_000_001, 37, 0),
+    (300_000_000, 1_200, 7.77),
+    # 절상 납입금액으로 만기 전에 완납하는 고금리 장기 대출
+    (100_000_000, 720, 19.9),
+    (100_000_000, 960, 15),
+])
+def test_schedule_matches_fraction(principal, periods, annual_rate, payment_type, rounding):
+    expected = fraction_schedule(principal, periods, annual_rate, payment_type, rounding)
+    actual = calculate_loan_schedule_won(principal, periods, annual_rate, payment_type, rounding)
+    assert actual.dtypes.eq(np.int64).all()
+    assert np.array_equal(actual.to_numpy(), expected)
+    assert actual["원금상환"].sum() == principal
+    assert actual["잔금"].iloc[-1] == 0
+    assert (actual["잔금"] >= 0).all()
+
+@pytest.mark.parametrize("principal, periods, annual_rate", [(100_000_000, 720, 19.9), (100_000_000, 960, 15)])
+def test_round_up_pays_off_early(principal, periods, annual_rate):
+    schedule = calculate_loan_schedule_won(principal, periods, annual_rate, "원리금균등상환", "절상")
+    paid_off = int(np.argmax(schedule["잔금"].to_numpy() == 0))
+    assert paid_off < periods - 1
+    # 완납 이후 회차의 금액은 모두 0
+    assert (schedule.iloc[paid_off + 1:].to_numpy() == 0).all()
+    assert (schedule["이자금액"] >= 0).all()
+
+@pytest.mark.parametrize("rounding", ROUNDING_RULES)
+def test_fixed_point_pass_limit_does_not_change_result(rounding):
+    # 고정점 반복이 적으면 남은 회차를 순차 계산하며, 결과는 반복 횟수와 무관해야 함
+    args = (300_000_000, 3_600, 7.77, "원리금균등상환", rounding)
+    limited = calculate_loan_schedule_won(*args, max_iter=1)
+    assert limited.equals(calculate_loan_schedule_won(*args, max_iter=2_000))
+
+@pytest.mark.parametrize("rounding", ROUNDING_RULES)
+@pytest.mark.parametrize("principal, periods, annual_rate, payment_type", [
+    (100_000_000, 1_200, 30, "원리금균등상환"),
+    (100_000_000, 3_600, 19.9, "원리금균등상환"),
+    (10 ** 15, 360, 100, "원금균등상환"),
+    (10 ** 15, 360, 100, "만기일시상환"),
+])
+def test_int64_overflow_is_rejected(principal, periods, annual_rate, payment_type, rounding):
+    with pytest.raises(ValueError):
+        calculate_loan_schedule_won(principal, periods, annual_rate, payment_type, rounding)
+
+def test_rate_finer_than_scale_is_rejected():
+    with pytest.raises(ValueError):
+        calculate_loan_schedule_won(100_000_000, 12, 4.123456, "원리금균등상환")
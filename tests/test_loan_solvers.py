@@ -0,0 +1,105 @@
+"""
+utils.loan_solvers 대출 역산 테스트
+
+amortization_columns로 만든 상환 스케줄의 첫 회차 납입금액에서 원금·기간·이자율을 다시 역산해
+원래 값으로 돌아오는지 확인합니다.
+
+실행 방법:
+    python -m pytest tests
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.financial_utils import amortization_columns
+from utils.loan_solvers import solve_loan_principal, solve_loan_rate, solve_loan_term
+
+PAYMENT_TYPES = ["원리금균등상환", "원금균등상환", "만기일시상환"]
+
+CASES = [
+    # (대출 원금, 총 회차, 연이자율(%))
+    (100_000_000, 360, 4.5),
+    (300_000_000, 120, 19.9),
+    (50_000_000, 12, 0.1),
+    (1_000_000_000, 600, 7.77),
+    (20_000_000, 1, 6.0),
+]
+
+def first_payment(principal, periods, annual_rate, payment_type):
+    """상환 스케줄 첫 회차 납입금액 (역산 함수의 납입금액 기준)"""
+    return amortization_columns(principal, periods, annual_rate / 12 / 100, payment_type, k=[1])[0, 0]
+
+@pytest.mark.parametrize("payment_type", PAYMENT_TYPES)
+@pytest.mark.parametrize("principal, periods, annual_rate", CASES)
+def test_principal_round_trip(principal, periods, annual_rate, payment_type):
+    if payment_type == "만기일시상환" and periods == 1:
+        pytest.skip("1회차 만기일시상환은 첫 회차에 원금을 함께 상환함")
+    payment = first_payment(principal, periods, annual_rate, payment_type)
+    assert solve_loan_principal(payment, periods, annual_rate, payment_type) == pytest.approx(principal, rel=1e-10)
+
+@pytest.mark.parametrize("payment_type", ["원리금균등상환", "원금균등상환"])
+@pytest.mark.parametrize("principal, periods, annual_rate", CASES)
+def test_term_round_trip(principal, periods, annual_rate, payment_type):
+    payment = first_payment(principal, periods, annual_rate, payment_type)
+    assert solve_loan_term(payment, principal, annual_rate, payment_type) == periods
+    # 납입금액이 조금 많으면 같은 회차, 조금 적으면 한 회차 이상 늘어남
+    assert solve_loan_term(payment * 1.000001, principal, annual_rate, payment_type) == periods
+    assert solve_loan_term(payment * 0.999, principal, annual_rate, payment_type) > periods
+
+@pytest.mark.parametrize("payment_type", PAYMENT_TYPES)
+@pytest.mark.parametrize("principal, periods, annual_rate", CASES)
+def test_rate_round_trip(principal, periods, annual_rate, payment_type):
+    if payment_type == "만기일시상환" and periods == 1:
+        pytest.skip("1회차 만기일시상환은 첫 회차에 원금을 함께 상환함")
+    payment = first_payment(principal, periods, annual_rate, payment_type)
+    assert solve_loan_rate(payment, principal, periods, payment_type) == pytest.approx(annual_rate, abs=1e-6)
+
+def test_rate_round_trip_grid():
+    # 원리금균등상환: 뉴턴 단계가 구간을 벗어나거나 충분히 줄지 않는 경우에도 이분법으로 수렴
+    annual_rates = np.linspace(0.01, 99.0, 300)
+    periods = np.tile([1, 12, 360, 1_200, 3_600], 60)
+    payments = np.array([
+        first_payment(100_000_000, n, rate, "원리금균등상환") for n, rate in zip(periods, annual_rates)
+    ])
+    solved = solve_loan_rate(payments, 100_000_000, periods, "원리금균등상환")
+    assert np.allclose(solved, annual_rates, atol=1e-5)
+
+def test_mixed_payment_types():
+    payment_types = np.array(PAYMENT_TYPES)
+    payments = [first_payment(100_000_000, 240, 5.0, payment_type) for payment_type in PAYMENT_TYPES]
+    assert np.allclose(solve_loan_rate(payments, 100_000_000, 240, payment_types), 5.0, atol=1e-6)
+    assert np.allclose(solve_loan_principal(payments, 240, 5.0, payment_types), 100_000_000, rtol=1e-10)
+
+@pytest.mark.parametrize("payment_type", ["원리금균등상환", "원금균등상환"])
+def test_zero_rate(payment_type):
+    payment = 100_000_000 / 120
+    assert solve_loan_principal(payment, 120, 0.0, payment_type) == pytest.approx(100_000_000)
+    assert solve_loan_term(payment, 100_000_000, 0.0, payment_type) == 120
+    # 총 납입액이 원금과 같으면 무이자
+    assert solve_loan_rate(payment, 100_000_000, 120, payment_type) == 0
+
+def test_interest_only_zero_rate_is_nan():
+    # 이자율이 0이면 만기일시상환의 이자 납입금액으로 원금을 정할 수 없음
+    assert np.isnan(solve_loan_principal(100_000, 120, 0.0, "만기일시상환"))
+    assert solve_loan_rate(0.0, 100_000_000, 120, "만기일시상환") == 0
+
+def test_term_independent_of_payment_is_nan():
+    assert np.isnan(solve_loan_term(500_000, 100_000_000, 6.0, "만기일시상환"))
+
+@pytest.mark.parametrize("payment_type", ["원리금균등상환", "원금균등상환"])
+def test_payment_below_interest_is_nan(payment_type):
+    # 월 이자 50만원보다 적거나 같은 납입금액으로는 원금이 줄지 않음
+    assert np.isnan(solve_loan_term(400_000, 100_000_000, 6.0, payment_type))
+    assert np.isnan(solve_loan_term(500_000, 100_000_000, 6.0, payment_type))
+
+@pytest.mark.parametrize("payment_type", ["원리금균등상환", "원금균등상환"])
+def test_payment_below_principal_is_nan(payment_type):
+    # 총 납입액이 원금보다 적으면 음수 이자율이 되므로 해가 없음
+    assert np.isnan(solve_loan_rate(100_000_000 / 120 * 0.9, 100_000_000, 120, payment_type))
+
+def test_rate_not_converged_is_nan():
+    payment = first_payment(100_000_000, 360, 4.5, "원리금균등상환")
+    assert np.isnan(solve_loan_rate(payment, 100_000_000, 360, "원리금균등상환", max_iter=1))
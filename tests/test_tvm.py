@@ -0,0 +1,127 @@
+"""
+utils.tvm 화폐의 시간가치 커널 테스트
+
+닫힌 식 결과를 회차별 잔액 반복문(독립 기준값)과 비교합니다.
+
+실행 방법:
+    python -m pytest tests
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.tvm import annuity_factor, compound_monthly_rate, fv, nper, pmt, pv, rate
+
+def loop_fv(rate, nper, pmt=0.0, pv=0.0, escalation_rate=0.0, due=False):
+    """회차마다 잔액에 이자를 붙이고 납입금을 더하는 방식의 미래가치 (비교 기준)"""
+    balance = pv
+    for period in range(1, nper + 1):
+        payment = pmt * (1 + escalation_rate) ** ((period - 1) // 12)
+        if due:
+            balance += payment
+        balance *= 1 + rate
+        if not due:
+            balance += payment
+    return balance
+
+CASES = [
+    # (기간 이자율, 기간 수, 납입금, 현재 금액, 증가율, 기초 납입)
+    (0.005, 120, 500_000, 10_000_000, 0.0, False),
+    (0.005, 127, 500_000, 10_000_000, 0.03, False),
+    (0.0025, 360, 300_000, 0.0, 0.05, True),
+    (0.0, 61, 200_000, 1_000_000, 0.04, False),
+    (0.0, 24, 100_000, 0.0, 0.0, True),
+    (-0.003, 84, 1_000_000, 50_000_000, 0.02, False),
+    (1e-10, 240, 400_000, 0.0, 0.0, False),
+    # (1+r)^12 = 1+g 이라 성장형 등비합의 공비가 1인 경우
+    (np.expm1(np.log1p(0.05) / 12), 150, 100_000, 0.0, 0.05, False),
+    (0.004, 11, 100_000, 5_000_000, 0.1, True),
+]
+
+@pytest.mark.parametrize("r, n, c, p, g, due", CASES)
+def test_fv_matches_loop(r, n, c, p, g, due):
+    assert fv(r, n, c, p, g, due) == pytest.approx(loop_fv(r, n, c, p, g, due), rel=1e-10)
+
+@pytest.mark.parametrize("r, n, c, p, g, due", CASES)
+def test_annuity_factor_matches_loop(r, n, c, p, g, due):
+    assert annuity_factor(r, n, g, due) == pytest.approx(loop_fv(r, n, 1.0, 0.0, g, due), rel=1e-10)
+
+def test_annuity_factor_level_closed_form():
+    r = np.array([0.001, 0.005, 0.02])
+    n = np.array([[12], [120], [600]])
+    assert np.allclose(annuity_factor(r, n), np.expm1(n * np.log1p(r)) / r, rtol=1e-12)
+    assert np.allclose(annuity_factor(r, n, due=True), np.expm1(n * np.log1p(r)) / r * (1 + r), rtol=1e-12)
+
+def test_zero_rate():
+    assert fv(0.0, 36, 100_000, 1_000_000) == pytest.approx(1_000_000 + 100_000 * 36)
+    assert pv(0.0, 36, 100_000, 10_000_000) == pytest.approx(10_000_000 - 100_000 * 36)
+    assert pmt(0.0, 36, pv=1_000_000, fv=10_000_000) == pytest.approx(9_000_000 / 36)
+    assert nper(0.0, 100_000, pv=1_000_000, fv=4_600_000) == pytest.approx(36)
+    # 첫해 1원, 둘째 해 1.1원, 셋째 해 1.21원 (각 12회)
+    assert annuity_factor(0.0, 36, 0.1) == pytest.approx(12 * (1 + 1.1 + 1.21))
+
+@pytest.mark.parametrize("r, n, c, p, g, due", CASES)
+def test_pv_reaches_target(r, n, c, p, g, due):
+    target = 200_000_000
+    required = pv(r, n, c, target, g, due)
+    assert loop_fv(r, n, c, required, g, due) == pytest.approx(target, rel=1e-10)
+
+@pytest.mark.parametrize("r, n, c, p, g, due", CASES)
+def test_pmt_reaches_target(r, n, c, p, g, due):
+    target = 300_000_000
+    payment = pmt(r, n, p, target, g, due)
+    assert loop_fv(r, n, payment, p, g, due) == pytest.approx(target, rel=1e-10)
+
+def test_pmt_loan_payment():
+    # 1억원을 연 4.8%, 360회 원리금균등상환: 잔액이 0이 되는 상환액 (음수)
+    payment = pmt(0.004, 360, pv=100_000_000)
+    assert payment < 0
+    assert loop_fv(0.004, 360, payment, 100_000_000) == pytest.approx(0.0, abs=1e-4)
+
+@pytest.mark.parametrize("r, n, c, p, due", [
+    (0.005, 37, 500_000, 10_000_000, False),
+    (0.002, 240, 300_000, 0.0, True),
+    (0.0, 61, 200_000, 1_000_000, False),
+    (1e-12, 100, 50_000, 0.0, False),
+])
+def test_nper_inverts_loop(r, n, c, p, due):
+    target = loop_fv(r, n, c, p, due=due)
+    assert nper(r, c, p, target, due) == pytest.approx(n, rel=1e-9)
+
+def test_nper_unreachable_is_nan():
+    # 인출액이 이자보다 커서 잔액이 줄기만 하면 목표에 도달할 수 없음
+    assert np.isnan(nper(0.005, -1_000_000, pv=100_000_000, fv=200_000_000))
+
+@pytest.mark.parametrize("r, n, c, p, g, due", [case for case in CASES if case[0] > -0.5])
+def test_rate_inverts_loop(r, n, c, p, g, due):
+    target = loop_fv(r, n, c, p, g, due)
+    solved = rate(n, c, p, target, escalation_rate=g, due=due, tol=1e-12)
+    assert solved == pytest.approx(r, abs=1e-9)
+
+def test_rate_loan():
+    # 원리금균등 상환액에서 대출 금리 역산 (pv 양수, 상환액 음수, fv = 0)
+    payments = np.array([pmt(monthly_rate, 360, pv=100_000_000) for monthly_rate in [0.001, 0.004, 0.01]])
+    solved, diagnostics = rate(360, payments, 100_000_000, 0.0, return_diagnostics=True)
+    assert np.allclose(solved, [0.001, 0.004, 0.01], atol=1e-10)
+    assert diagnostics["수렴"].all()
+
+def test_rate_bracket_failure_is_nan():
+    # 월 100% 수익률로도 12개월 뒤 100원이 100만원이 될 수 없음 (2^12 × 100 < 1,000,000)
+    solved, diagnostics = rate(12, 0.0, 100.0, 1_000_000.0, return_diagnostics=True)
+    assert np.isnan(solved)
+    assert not diagnostics["수렴"].iloc[0]
+    assert diagnostics["반복횟수"].iloc[0] == 0
+
+def test_scalar_inputs_return_float():
+    assert isinstance(fv(0.005, 12, 1.0), float)
+    assert isinstance(rate(12, 1.0, 0.0, 13.0), float)
+    assert isinstance(compound_monthly_rate(6.0, 4), float)
+
+def test_compound_monthly_rate():
+    # 분기 복리 연 6% → 분기 1.5% 와 같은 효과를 내는 월수익률
+    monthly = compound_monthly_rate(6.0, 4)
+    assert (1 + monthly) ** 3 == pytest.approx(1.015, rel=1e-12)
+    assert compound_monthly_rate(6.0, 12) == pytest.approx(0.005, rel=1e-12)
@@ -0,0 +1,126 @@
+import pandas as pd
+import numpy as np
+
+from utils.contributions import contribution_schedule
+
+TAX_WRAPPERS = ["일반과세", "ISA", "연금저축/IRP"]
+TAX_TIMINGS = ["매기", "실현시"]
+
+# 이자·배당소득세 (소득세 14% + 지방소득세 1.4%)
+INTEREST_DIVIDEND_TAX_RATE = 0.154
+# ISA 비과세 한도와 초과분 분리과세 세율 (9%, 지방소득세 포함 9.9%)
+ISA_TAX_FREE_LIMITS = {"일반형": 2_000_000, "서민형": 4_000_000}
+ISA_SEPARATE_TAX_RATE = 0.099
+ISA_ANNUAL_CONTRIBUTION_LIMIT = 20_000_000
+# 연금저축 + IRP 세액공제 대상 납입 한도 (연간)와 공제율 (지방소득세 포함)
+PENSION_CREDIT_LIMIT = 9_000_000
+PENSION_CREDIT_RATES = {"총급여 5,500만원 이하": 0.165, "총급여 5,500만원 초과": 0.132}
+# 연금 수령 시 연금소득세 (수령 나이 기준, 지방소득세 포함, 연 1,500만원 이하 수령 가정)
+PENSION_INCOME_TAX_RATES = {"70세 미만": 0.055, "70~79세": 0.044, "80세 이상": 0.033}
+
+def _credited_contributions(contributions, limit=PENSION_CREDIT_LIMIT):
+    """
+    월별 납입금 중 연간 세액공제 한도 안에 드는 금액을 계산합니다.
+
+    초기투자금(0번째 월)은 첫해 납입으로 보고, 1~12개월을 첫해, 13~24개월을 둘째 해로 묶습니다.
+
+    Returns:
+        tuple: (연도별 납입액, 연도별 공제 대상 금액, 월별 누적 공제 대상 금액)
+    """
+    months = contributions.size - 1
+    years = max(1, -(-months // 12))
+    yearly = np.zeros((years, 12))
+    yearly.ravel()[:months] = contributions[1:]
+    yearly[0, 0] += contributions[0]
+    # 연도 안에서 누적 납입액을 한도로 자른 뒤, 앞선 연도의 공제액을 더해 월별 누적 공제액으로 펼침
+    capped = np.minimum(np.cumsum(yearly, axis=1), limit)
+    credited = capped[:, -1].copy()
+    capped += np.concatenate([[0.0], np.cumsum(credited)[:-1]])[:, None]
+    credited_to_date = np.concatenate([[min(contributions[0], limit)], capped.ravel()[:months]])
+    return yearly.sum(axis=1), credited, credited_to_date
+
+def compare_tax_wrappers(initial_investment, monthly_contribution, monthly_rate, total_months,
+                         contribution_period="월 납입", escalation_rate=0.0, taxable_ratio=1.0, tax_timing="매기",
+                         isa_type="일반형", credit_rate=0.132, pension_tax_rate=0.055):
+    """
+    같은 투자 계획을 일반과세 계좌, ISA, 연금저축/IRP에 넣었을 때의 세후 평가액을 비교합니다.
+
+    계좌별 월 성장률만 다르고 납입금 벡터는 같으므로, (계좌 × 개월) 성장 계수 행렬 하나로
+    B = G × (B_0 + Σ c_j / G_j) 를 모든 계좌에 한 번에 계산합니다.
+
+    - 일반과세: 수익 중 이자·배당 비중(taxable_ratio)에 15.4% 과세.
+      "매기"는 매월 수익에서 원천징수(세후 수익률로 복리), "실현시"는 해지 시 누적 수익에 과세
+    - ISA: 만기 해지 시 순수익 중 비과세 한도를 넘는 부분만 9.9% 분리과세
+    - 연금저축/IRP: 연 900만원까지 납입액에 세액공제(credit_rate). 환급금은 다음 해 1월에 일반과세
+      계좌(매기 과세)에 재투자하는 것으로 보고, 연금 수령 시 세액공제 받은 원금과 수익에 연금소득세 과세
+
+    Args:
+        initial_investment: 초기투자금액
+        monthly_contribution: 월 납입금액 (연 납입은 월 환산 금액)
+        monthly_rate: 세전 월수익률 (소수)
+        total_months: 투자 기간 (개월 수)
+        contribution_period: 투자 주기 ("월 납입" 또는 "연 납입")
+        escalation_rate: 연간 납입금 증가율 (소수)
+        taxable_ratio: 수익 중 이자·배당소득 비중 (0~1, 국내주식 매매차익처럼 비과세인 부분 제외)
+        tax_timing: 일반과세 계좌 과세 시점 ("매기" 또는 "실현시")
+        isa_type: ISA 유형 ("일반형" 또는 "서민형")
+        credit_rate: 연금저축/IRP 세액공제율 (소수)
+        pension_tax_rate: 연금소득세율 (소수)
+
+    Returns:
+        dict:
+            summary: 계좌별 납입원금, 세전 평가액, 세금, 세액공제 환급(재투자), 세후 평가액, 세후 수익률 (%)
+            paths: 월별 계좌별 세후 평가액 (해당 월에 해지·수령했을 때) 데이터프레임
+            isa_over_limit: 어느 해든 납입액이 ISA 연간 납입 한도를 넘는지 여부
+    """
+    contributions = contribution_schedule(monthly_contribution, total_months, contribution_period, escalation_rate)
+    contributions[0] = initial_investment
+    invested = np.cumsum(contributions)
+    month = np.arange(total_months + 1)
+
+    # 연금저축/IRP 세액공제 환급금: 해당 연도 납입액(초기투자금 포함) 중 한도까지, 다음 해 1월 재투자
+    # (투자 기간 안에 환급 시점이 오지 않는 마지막 해의 환급금은 만기 시점에 더함)
+    yearly, credited, credited_to_date = _credited_contributions(contributions)
+    refund_months = np.minimum(12 * np.arange(1, yearly.size + 1) + 1, total_months)
+    refunds = np.zeros(total_months + 1)
+    np.add.at(refunds, refund_months, credited * credit_rate)
+
+    # 계좌별 월 성장률: 일반과세(매기)는 세후 수익률, 나머지는 세전 수익률로 복리
+    per_period_rate = monthly_rate - max(monthly_rate, 0) * INTEREST_DIVIDEND_TAX_RATE * taxable_ratio
+    taxable_rate = per_period_rate if tax_timing == "매기" else monthly_rate
+    rates = np.array([taxable_rate, monthly_rate, monthly_rate, per_period_rate])
+    flows = np.vstack([contributions, contributions, contributions, refunds])
+    growth = np.exp(np.log1p(rates)[:, None] * month)
+    balances = growth * np.cumsum(flows / growth, axis=1)
+    taxable, isa, pension, refund_account = balances
+
+    gain = taxable - invested
+    if tax_timing == "실현시":
+        taxable_after = taxable - np.maximum(gain, 0) * INTEREST_DIVIDEND_TAX_RATE * taxable_ratio
+    else:
+        taxable_after = taxable
+    isa_tax = np.maximum(isa - invested - ISA_TAX_FREE_LIMITS[isa_type], 0) * ISA_SEPARATE_TAX_RATE
+    isa_after = isa - isa_tax
+    # 세액공제를 받지 않은 납입 원금은 연금 수령 시 과세하지 않음
+    pension_tax = np.maximum(pension - (invested - credited_to_date), 0) * pension_tax_rate
+    pension_after = pension - pension_tax + refund_account
+
+    paths = pd.DataFrame(
+        {"일반과세": taxable_after, "ISA": isa_after, "연금저축/IRP": pension_after},
+        index=pd.RangeIndex(total_months + 1, name="월")
+    )
+    # 세전 평가액은 세 계좌 모두 같음 (일반과세 매기 과세분은 세전 잔액과의 차이가 세금)
+    gross = isa[-1]
+    summary = pd.DataFrame({
+        "납입원금": invested[-1],
+        "세전 평가액": gross,
+        "세금": [gross - taxable_after[-1], isa_tax[-1], pension_tax[-1]],
+        "세액공제 환급(재투자)": [0.0, 0.0, refund_account[-1]],
+        "세후 평가액": paths.iloc[-1].to_numpy(),
+    }, index=pd.Index(TAX_WRAPPERS, name="계좌"))
+    summary["세후 수익률 (%)"] = (summary["세후 평가액"] / summary["납입원금"] - 1) * 100
+    return {
+        "summary": summary,
+        "paths": paths,
+        "isa_over_limit": bool((yearly > ISA_ANNUAL_CONTRIBUTION_LIMIT).any()),
+    }
@@ -0,0 +1,164 @@
+import os
+
+import pandas as pd
+import numpy as np
+
+from utils.contributions import contribution_schedule
+
+# 앱과 함께 배포하는 월간 수익률 데이터 위치 (data/returns/*.csv, *.parquet)
+RETURNS_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "returns")
+DATE_COLUMN = "날짜"
+
+def list_return_datasets(data_dir=RETURNS_DATA_DIR):
+    """배포된 월간 수익률 데이터 파일 목록을 {표시 이름: 경로} 사전으로 반환합니다."""
+    if not os.path.isdir(data_dir):
+        return {}
+    return {
+        os.path.splitext(name)[0]: os.path.join(data_dir, name)
+        for name in sorted(os.listdir(data_dir))
+        if name.endswith((".csv", ".parquet"))
+    }
+
+def load_monthly_returns(source):
+    """
+    월간 수익률 데이터를 읽습니다.
+
+    파일은 날짜(YYYY-MM) 열과 자산별 월 수익률(%) 열로 구성됩니다. Parquet 파일은 pyarrow로 메모리 매핑해
+    읽어 전체를 복사하지 않습니다. 업로드된 파일 객체도 CSV로 읽을 수 있습니다.
+
+    Args:
+        source: CSV/Parquet 파일 경로 또는 파일 객체
+
+    Returns:
+        DataFrame: 월(Period) 인덱스, 자산별 월 수익률(소수) 열
+    """
+    if isinstance(source, str) and source.endswith(".parquet"):
+        df = pd.read_parquet(source, memory_map=True)
+    else:
+        df = pd.read_csv(source)
+    df.index = pd.PeriodIndex(pd.to_datetime(df.pop(DATE_COLUMN)), freq="M", name=DATE_COLUMN)
+    return df.sort_index().astype(np.float64) / 100
+
+def _contiguous_runs(monthly_returns):
+    """
+    결측값이나 빠진 달 없이 이어지는 구간의 (시작 위치, 끝 위치) 목록을 반환합니다.
+
+    결측값을 지우고 앞뒤 달을 이어 붙이면 존재하지 않는 구간이 만들어지므로, 결측값이나 인덱스의
+    월 간격이 1이 아닌 곳에서 데이터를 나눕니다.
+    """
+    values = monthly_returns.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(values)
+    months = monthly_returns.index.asi8
+    breaks = np.flatnonzero(np.diff(months) != 1) + 1
+    runs = []
+    for segment in np.split(np.arange(values.size), breaks):
+        # 구간 안에서 결측값 기준으로 다시 나눔
+        edges = np.flatnonzero(np.diff(np.concatenate([[False], valid[segment], [False]]).astype(np.int8)))
+        runs += [(segment[0] + a, segment[0] + b) for a, b in zip(edges[::2], edges[1::2])]
+    return runs
+
+def _window_endings(returns, initial_investment, monthly_contribution, window_months, contribution_period,
+                    escalation_rate):
+    """결측값 없이 이어지는 월 수익률 배열에서 모든 창의 최종 자산을 O(개월 수)로 계산합니다."""
+    log_prefix = np.concatenate([[0.0], np.cumsum(np.log1p(returns))])
+    n_windows = returns.size - window_months + 1
+    start = np.arange(n_windows)
+    end = start + window_months
+
+    # 납입금 c_j = w_p × (1+g)^y (p = (j-1) % 12, y = (j-1) // 12, w = 첫해 월별 납입금)를
+    # c_j = w_p × q^(-p) × q^(j-1) (q = (1+g)^(1/12))로 바꾸면, 절대 위치 i = s + j의 나머지 i % 12별로
+    # w_p × q^(-p)가 창 안에서 일정하므로 나머지별 누적합 T_r(m) = Σ_(i≤m, i%12=r) q^i × exp(-L_i)의
+    # 차이로 Σ c_j × exp(L_(s+W) - L_(s+j))를 계산합니다.
+    first_year = contribution_schedule(monthly_contribution, 12, contribution_period)[1:]
+    log_q = np.log1p(escalation_rate) / 12
+    month = np.arange(1, returns.size + 1)
+    terms = np.zeros((12, returns.size + 1))
+    terms[month % 12, month] = np.exp(month * log_q - log_prefix[1:])
+    prefix = np.cumsum(terms, axis=1)
+
+    residue = np.arange(12)[:, None]
+    phase = (residue - start - 1) % 12
+    weights = first_year[phase] * np.exp(-phase * log_q)
+    contribution_sum = (weights * (prefix[:, end] - prefix[:, start])).sum(axis=0)
+    return (
+        initial_investment * np.exp(log_prefix[end] - log_prefix[start])
+        + np.exp(log_prefix[end] - (start + 1) * log_q) * contribution_sum
+    )
+
+def backtest_rolling_windows(monthly_returns, initial_investment, monthly_contribution, window_months,
+                             contribution_period="월 납입", escalation_rate=0.0):
+    """
+    과거 월 수익률의 모든 시작 시점에 대해 같은 투자 계획을 적용한 최종 자산을 한 번에 계산합니다.
+
+    누적 로그수익률 L로 창(window) s의 최종 자산을
+    P0 × exp(L_(s+W) - L_s) + exp(L_(s+W)) × Σ c_j × exp(-L_(s+j)) 로 쓰고, 납입금 합은
+    exp(-L)의 누적합 차이로 구하므로 (창 × 개월) 행렬 없이 데이터 길이에 비례하는 계산으로 끝납니다.
+    결측값이나 빠진 달이 있으면 그 지점에서 데이터를 나누고, 연속 구간 안의 창만 계산합니다.
+
+    Args:
+        monthly_returns: 월 수익률(소수) 시리즈 (월 인덱스)
+        initial_investment: 초기투자금액
+        monthly_contribution: 월 납입금액 (연 납입은 월 환산 금액)
+        window_months: 투자 기간 (개월 수)
+        contribution_period: 투자 주기 ("월 납입" 또는 "연 납입")
+        escalation_rate: 연간 납입금 증가율 (소수)
+
+    Returns:
+        DataFrame: 창별 시작월, 종료월, 투자원금, 최종자산, 누적수익률(%) (시작월 순서)
+    """
+    monthly_returns = monthly_returns.sort_index()
+    runs = [(a, b) for a, b in _contiguous_runs(monthly_returns) if b - a >= window_months]
+    if not runs:
+        longest = max((b - a for a, b in _contiguous_runs(monthly_returns)), default=0)
+        raise ValueError(f"결측 없이 이어지는 데이터 기간(최장 {longest}개월)이 투자 기간({window_months}개월)보다 짧습니다.")
+
+    values = monthly_returns.to_numpy(dtype=np.float64)
+    invested = initial_investment + contribution_schedule(
+        monthly_contribution, window_months, contribution_period, escalation_rate
+    ).sum()
+    results = []
+    for a, b in runs:
+        ending = _window_endings(values[a:b], initial_investment, monthly_contribution, window_months,
+                                 contribution_period, escalation_rate)
+        index = monthly_returns.index[a:b]
+        results.append(pd.DataFrame({
+            "시작월": index[:ending.size].astype(str),
+            "종료월": index[window_months - 1:].astype(str),
+            "투자원금": invested,
+            "최종자산": ending,
+            "누적수익률(%)": (ending / invested - 1) * 100,
+        }))
+    return pd.concat(results, ignore_index=True)
+
+def backtest_window_path(monthly_returns, start_month, initial_investment, monthly_contribution, window_months,
+                         contribution_period="월 납입", escalation_rate=0.0):
+    """시작월부터 window_months 동안의 월별 자산 경로를 계산합니다 (최악·최고 구간 차트용)."""
+    monthly_returns = monthly_returns.sort_index()
+    offset = monthly_returns.index.get_loc(pd.Period(start_month, freq="M"))
+    if not any(a <= offset and offset + window_months <= b for a, b in _contiguous_runs(monthly_returns)):
+        raise ValueError(f"{start_month}부터 {window_months}개월 사이에 결측값이나 빠진 달이 있습니다.")
+    window = monthly_returns.to_numpy(dtype=np.float64)[offset:offset + window_months]
+
+    contributions = contribution_schedule(monthly_contribution, window_months, contribution_period, escalation_rate)
+    growth = np.exp(np.concatenate([[0.0], np.cumsum(np.log1p(window))]))
+    balance = growth * (initial_investment + np.cumsum(contributions / growth))
+    return pd.DataFrame({
+        '월': np.arange(window_months + 1),
+        '투자원금': initial_investment + np.cumsum(contributions),
+        '총자산': balance
+    })
+
+def summarize_backtest(results, percentiles=(5, 25, 50, 75, 95)):
+    """창별 백테스트 결과에서 최종 자산 분포와 최악·최고 구간을 요약합니다."""
+    ending = results["최종자산"]
+    distribution = pd.Series(
+        np.percentile(ending, percentiles),
+        index=[f"P{p:g}" for p in percentiles],
+        name="최종자산"
+    )
+    return {
+        "distribution": distribution,
+        "worst": results.loc[ending.idxmin()],
+        "best": results.loc[ending.idxmax()],
+        "loss_probability": float((ending < results["투자원금"]).mean()),
+    }
@@ -0,0 +1,112 @@
+import sys
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+
+def estimate_bytes(value):
+    """캐시에 저장할 값의 대략적인 메모리 크기(바이트)를 계산합니다."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True))
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_bytes(item) for item in value)
+    return sys.getsizeof(value)
+
+def _copy_value(value):
+    """호출자가 결과를 수정해도 캐시가 바뀌지 않도록 변경 가능한 값은 복사해서 돌려줍니다."""
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy_value(item) for item in value)
+    return value
+
+class LRUCache:
+    """
+    항목 수와 전체 바이트 수로 크기를 제한하는 프로세스 공용 LRU 캐시입니다.
+
+    Streamlit 세션은 서로 다른 스레드에서 실행되므로 모든 접근은 잠금으로 보호합니다.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """(적중 여부, 값)을 반환합니다. 적중한 항목은 가장 최근 사용으로 옮깁니다."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True, self._data[key][0]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        """값을 저장하고 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다."""
+        size = estimate_bytes(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._bytes -= self._data.pop(key)[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """모든 항목과 통계를 초기화합니다."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """캐시 크기 조정을 위한 적중/미적중 통계를 반환합니다."""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "evictions": self.evictions,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    def memoize(self, key_func):
+        """
+        key_func(*args, **kwargs)로 만든 정규화된 키로 함수 결과를 캐시하는 데코레이터입니다.
+
+        캐시되지 않은 원래 함수는 데코레이터가 붙은 함수의 __wrapped__ 속성으로 사용할 수 있습니다.
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = (func.__name__, key_func(*args, **kwargs))
+                hit, value = self.get(key)
+                if not hit:
+                    value = func(*args, **kwargs)
+                    self.put(key, value)
+                return _copy_value(value)
+            wrapper.cache = self
+            return wrapper
+        return decorator
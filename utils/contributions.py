@@ -0,0 +1,28 @@
+import numpy as np
+
+def contribution_schedule(monthly_contribution, total_months, contribution_period, escalation_rate=0.0):
+    """
+    0~total_months 월의 납입금 벡터를 만듭니다.
+
+    월 납입은 매월, 연 납입은 매년 첫 달(month % 12 == 1)에 12개월치를 한 번에 납입합니다.
+    escalation_rate를 지정하면 납입금이 매년 첫 달에 그 비율만큼 계단식으로 늘어납니다.
+
+    Args:
+        monthly_contribution: 첫해 월 납입금액 (연 납입은 월 환산 금액)
+        total_months: 투자 기간 (개월 수)
+        contribution_period: 투자 주기 ("월 납입" 또는 "연 납입")
+        escalation_rate: 연간 납입금 증가율 (소수, 예: 0.03)
+
+    Returns:
+        ndarray: 길이 total_months + 1의 월별 납입금 (0번째 월은 0)
+    """
+    month = np.arange(total_months + 1)
+    contributions = np.zeros(total_months + 1)
+    if contribution_period == "월 납입":
+        contributions[1:] = monthly_contribution
+    else:
+        contributions[month % 12 == 1] = monthly_contribution * 12
+    if escalation_rate:
+        # 1~12월은 첫해, 13~24월은 둘째 해 ... 의 증가율 적용
+        contributions[1:] *= np.exp((month[1:] - 1) // 12 * np.log1p(escalation_rate))
+    return contributions
@@ -0,0 +1,84 @@
+import pandas as pd
+import numpy as np
+
+from utils.financial_utils import LOAN_BOOK_COLUMNS, _loan_totals, _payment_type_codes
+
+APPLICANT_COLUMN = "차주ID"
+INCOME_COLUMN = "연소득"
+MORTGAGE_COLUMN = "주택담보대출"
+
+def annual_debt_service(principal, periods, annual_rate, payment_type):
+    """
+    대출별 연간 원리금 상환액과 연간 이자 상환액을 계산합니다.
+
+    대출기간 전체의 원리금 합계를 연 단위로 나눈 값을 사용하므로 세 가지 상환방식에 같은 기준이
+    적용됩니다. 만기일시상환은 원금을 대출기간(년)으로 나누어 매년 상환하는 것으로 봅니다.
+
+    Args:
+        principal: 대출 원금 배열
+        periods: 총 납입 회차 배열 (개월 수)
+        annual_rate: 연이자율(%) 배열
+        payment_type: 상환방식 배열 또는 문자열
+
+    Returns:
+        tuple: (연간 원리금 상환액 배열, 연간 이자 상환액 배열)
+    """
+    principal = np.asarray(principal, dtype=np.float64)
+    periods = np.asarray(periods, dtype=np.int64)
+    monthly_rate = np.asarray(annual_rate, dtype=np.float64) / 12 / 100
+    codes = _payment_type_codes(payment_type, principal.size)
+
+    _, _, total_interest = _loan_totals(principal, periods, monthly_rate, codes)
+    years = periods / 12
+    return (principal + total_interest) / years, total_interest / years
+
+def evaluate_debt_ratios(loans, incomes, dsr_limit=40.0, dti_limit=50.0):
+    """
+    차주별 DSR(총부채원리금상환비율)과 DTI(총부채상환비율)를 계산하고 한도 초과 여부를 표시합니다.
+
+    대출별 연간 상환액을 배열로 한 번에 계산한 뒤, 차주ID를 정수 코드로 바꿔 bincount로 합산하므로
+    대출 건수만큼 반복하지 않습니다.
+
+    - DSR = 모든 대출의 연간 원리금 상환액 / 연소득
+    - DTI = (주택담보대출 연간 원리금 + 기타 대출 연간 이자) / 연소득
+      (주택담보대출 열이 없으면 모든 대출을 주택담보대출로 봅니다)
+
+    Args:
+        loans: 차주ID, 대출금액, 납입회차, 연이자율, 상환방식(, 주택담보대출) 열을 가진 긴 형식 데이터프레임
+        incomes: 차주ID, 연소득 열을 가진 데이터프레임
+        dsr_limit: DSR 한도 (%)
+        dti_limit: DTI 한도 (%)
+
+    Returns:
+        DataFrame: 차주별 대출건수, 총대출금액, 연간원리금상환액, DTI상환액, 연소득, DSR, DTI, DSR초과, DTI초과
+    """
+    annual_payment, annual_interest = annual_debt_service(
+        *(loans[LOAN_BOOK_COLUMNS[name]].to_numpy() for name in ["principal", "periods", "annual_rate", "payment_type"])
+    )
+    if MORTGAGE_COLUMN in loans:
+        is_mortgage = loans[MORTGAGE_COLUMN].to_numpy(dtype=bool)
+        dti_payment = np.where(is_mortgage, annual_payment, annual_interest)
+    else:
+        dti_payment = annual_payment
+
+    codes, applicants = pd.factorize(loans[APPLICANT_COLUMN], sort=True)
+    size = len(applicants)
+    result = pd.DataFrame(
+        {
+            "대출건수": np.bincount(codes, minlength=size),
+            "총대출금액": np.bincount(codes, weights=loans[LOAN_BOOK_COLUMNS["principal"]].to_numpy(dtype=np.float64), minlength=size),
+            "연간원리금상환액": np.bincount(codes, weights=annual_payment, minlength=size),
+            "DTI상환액": np.bincount(codes, weights=dti_payment, minlength=size),
+        },
+        index=pd.Index(applicants, name=APPLICANT_COLUMN)
+    )
+
+    income = incomes.set_index(APPLICANT_COLUMN)[INCOME_COLUMN]
+    result[INCOME_COLUMN] = income.reindex(result.index).to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result["DSR"] = result["연간원리금상환액"] / result[INCOME_COLUMN] * 100
+        result["DTI"] = result["DTI상환액"] / result[INCOME_COLUMN] * 100
+    # 소득 정보가 없거나 0이면 한도를 초과한 것으로 봄
+    result["DSR초과"] = ~(result["DSR"] <= dsr_limit)
+    result["DTI초과"] = ~(result["DTI"] <= dti_limit)
+    return result
@@ -1,83 +1,464 @@
 import pandas as pd
 import numpy as np
 
-def calculate_loan_schedule(principal, periods, monthly_rate, payment_type):
+from utils.cache import LRUCache
+from utils.tvm import pmt
+
+PAYMENT_TYPES = ["원리금균등상환", "원금균등상환", "만기일시상환"]
+SCHEDULE_COLUMNS = ["납입금액", "원금상환", "이자금액", "잔금"]
+
+# 세션 간에 공유되는 대출 계산 결과 캐시 (LOAN_CACHE.stats()로 적중률 확인)
+LOAN_CACHE = LRUCache(max_entries=2048, max_bytes=128 * 1024 * 1024)
+
+def _loan_cache_key(principal, periods, monthly_rate, payment_type, *args, **kwargs):
+    """입력값 표현 차이(정수/실수, 3.0/12/100과 0.0025 등)가 같은 키가 되도록 정규화합니다."""
+    return (
+        round(float(principal), 2),
+        int(periods),
+        round(float(monthly_rate), 12),
+        str(payment_type),
+        args,
+        tuple(sorted(kwargs.items())),
+    )
+
+def _growth_factors(monthly_rate, k):
+    """(1 + r)^k - 1 값을 계산합니다. 이자율이 0에 가까워도 정밀도를 유지합니다."""
+    return np.expm1(np.multiply(k, np.log1p(monthly_rate)))
+
+def calculate_level_payment(principal, periods, monthly_rate):
     """
-    대출 상환 스케줄을 계산합니다.
-    
+    원리금균등상환의 회차별 납입금액을 계산합니다.
+
     Args:
         principal: 대출 원금
-        periods: 총 납입 회차 (개월 수)
-        monthly_rate: 월 이자율 (연이자율/12/100)
+        periods: 총 납입 회차
+        monthly_rate: 회차당 이자율
+
+    Returns:
+        float: 회차별 납입금액
+    """
+    # 원금을 빌려 잔금 0으로 갚는 연금의 납입금 (상환액이므로 부호를 바꿈)
+    return -pmt(monthly_rate, periods, pv=principal)
+
+def amortization_columns(principal, periods, monthly_rate, payment_type, k=None):
+    """
+    지정한 회차들의 상환 내역을 반복문 없이 계산합니다.
+
+    각 회차의 잔금을 닫힌 식으로 구하므로 임의의 회차 구간만 따로 계산할 수 있습니다.
+
+    Args:
+        principal: 대출 원금
+        periods: 총 납입 회차
+        monthly_rate: 회차당 이자율
         payment_type: 상환방식 (원리금균등상환, 원금균등상환, 만기일시상환)
-    
+        k: 계산할 회차 배열 (1부터 시작). 생략하면 전체 회차
+
     Returns:
-        DataFrame: 상환 스케줄 데이터프레임
+        ndarray: (회차 수, 4) 배열. 열 순서는 SCHEDULE_COLUMNS와 같습니다.
     """
-    schedule = []
-    remaining = principal
-    
+    if k is None:
+        k = np.arange(1, periods + 1)
+    k = np.asarray(k, dtype=np.int64)
+    out = np.empty((k.size, len(SCHEDULE_COLUMNS)))
+    payment, principal_payment, interest, remaining = out.T
+    is_last = k == periods
+
     if payment_type == "원리금균등상환":
-        # 원리금균등상환 - 매달 동일한 금액 납부
+        # 잔금 B_k = P * ((1+r)^n - (1+r)^k) / ((1+r)^n - 1)
         if monthly_rate == 0:
-            payment = principal / periods
+            remaining[:] = principal * (1 - k / periods)
+            interest[:] = 0
         else:
-            payment = principal * (monthly_rate * (1 + monthly_rate) ** periods) / ((1 + monthly_rate) ** periods - 1)
-        
-        for period in range(1, periods + 1):
-            interest = remaining * monthly_rate
-            principal_payment = payment - interest
-            remaining -= principal_payment
-            
-            # 마지막 회차에는 반올림 오차로 인해 잔액이 음수가 될 수 있음
-            if period == periods:
-                if abs(remaining) < 1:  # 1원 미만이면 0으로 조정
-                    remaining = 0
-            
-            schedule.append({
-                "회차": period,
-                "납입금액": payment,
-                "원금상환": principal_payment,
-                "이자금액": interest,
-                "잔금": max(0, remaining)
-            })
-            
+            total_growth = _growth_factors(monthly_rate, periods)
+            previous = principal * (total_growth - _growth_factors(monthly_rate, k - 1)) / total_growth
+            remaining[:] = principal * (total_growth - _growth_factors(monthly_rate, k)) / total_growth
+            interest[:] = previous * monthly_rate
+        payment[:] = calculate_level_payment(principal, periods, monthly_rate)
+        principal_payment[:] = payment - interest
+
     elif payment_type == "원금균등상환":
-        # 원금균등상환 - 매달 동일한 원금 상환
-        principal_payment = principal / periods
-        
-        for period in range(1, periods + 1):
-            interest = remaining * monthly_rate
-            payment = principal_payment + interest
-            remaining -= principal_payment
-            
-            schedule.append({
-                "회차": period,
-                "납입금액": payment,
-                "원금상환": principal_payment,
-                "이자금액": interest,
-                "잔금": max(0, remaining)
-            })
-            
+        principal_payment[:] = principal / periods
+        interest[:] = principal * (1 - (k - 1) / periods) * monthly_rate
+        payment[:] = principal_payment + interest
+        remaining[:] = principal * (1 - k / periods)
+
     elif payment_type == "만기일시상환":
-        # 만기일시상환 - 이자만 납부하다가 마지막에 원금 상환
-        for period in range(1, periods + 1):
-            interest = remaining * monthly_rate
-            
-            if period == periods:
-                principal_payment = principal
-                payment = principal + interest
-                remaining = 0
-            else:
-                principal_payment = 0
-                payment = interest
-            
-            schedule.append({
-                "회차": period,
-                "납입금액": payment,
-                "원금상환": principal_payment,
-                "이자금액": interest,
-                "잔금": remaining
-            })
-    
-    return pd.DataFrame(schedule).set_index("회차")
+        interest[:] = principal * monthly_rate
+        principal_payment[:] = np.where(is_last, principal, 0)
+        payment[:] = principal_payment + interest
+        remaining[:] = np.where(is_last, 0, principal)
+
+    else:
+        raise ValueError(f"지원하지 않는 상환방식입니다: {payment_type}")
+
+    # 마지막 회차의 부동소수점 오차 정리
+    remaining[is_last] = 0
+    np.maximum(remaining, 0, out=remaining)
+    return out
+
+@LOAN_CACHE.memoize(_loan_cache_key)
+def calculate_loan_schedule(principal, periods, monthly_rate, payment_type):
+    """
+    대출 상환 스케줄을 계산합니다.
+
+    Args:
+        principal: 대출 원금
+        periods: 총 납입 회차 (개월 수)
+        monthly_rate: 월 이자율 (연이자율/12/100)
+        payment_type: 상환방식 (원리금균등상환, 원금균등상환, 만기일시상환)
+
+    Returns:
+        DataFrame: 상환 스케줄 데이터프레임
+    """
+    values = amortization_columns(principal, periods, monthly_rate, payment_type)
+    index = pd.RangeIndex(1, periods + 1, name="회차")
+    return pd.DataFrame(values, index=index, columns=SCHEDULE_COLUMNS)
+
+@LOAN_CACHE.memoize(_loan_cache_key)
+def loan_schedule_page(principal, periods, monthly_rate, payment_type, page, page_size=120):
+    """
+    상환 스케줄 중 한 페이지에 해당하는 회차만 계산합니다.
+
+    Args:
+        principal: 대출 원금
+        periods: 총 납입 회차 (개월 수)
+        monthly_rate: 월 이자율 (연이자율/12/100)
+        payment_type: 상환방식 (원리금균등상환, 원금균등상환, 만기일시상환)
+        page: 페이지 번호 (1부터 시작)
+        page_size: 페이지당 회차 수
+
+    Returns:
+        DataFrame: 해당 페이지의 상환 스케줄 데이터프레임 (숫자형 유지)
+    """
+    start = (page - 1) * page_size + 1
+    k = np.arange(start, min(start + page_size, periods + 1))
+    values = amortization_columns(principal, periods, monthly_rate, payment_type, k=k)
+    return pd.DataFrame(values, index=pd.Index(k, name="회차"), columns=SCHEDULE_COLUMNS)
+
+def iter_loan_schedule(principal, periods, monthly_rate, payment_type, page_size=120):
+    """상환 스케줄을 페이지 단위로 필요할 때마다 계산해 돌려주는 제너레이터입니다."""
+    for page in range(1, -(-periods // page_size) + 1):
+        yield loan_schedule_page(principal, periods, monthly_rate, payment_type, page, page_size)
+
+def compare_repayment_methods(principal, periods, monthly_rate):
+    """
+    세 가지 상환방식의 상환 스케줄을 한 번에 계산해 비교합니다.
+
+    (1 + r)^k 성장계수를 한 번만 계산해 원리금균등상환 잔금에 사용하고,
+    세 방식의 스케줄을 (방식, 회차, 항목) 배열 하나에 채웁니다.
+
+    Args:
+        principal: 대출 원금
+        periods: 총 납입 회차 (개월 수)
+        monthly_rate: 월 이자율 (연이자율/12/100)
+
+    Returns:
+        tuple: (스케줄 데이터프레임, 요약 데이터프레임, 납입금액 역전 회차)
+            스케줄은 (상환방식, 항목) 2단 열을 가지며 누적이자 항목을 포함합니다.
+            납입금액 역전 회차는 원금균등상환 납입금액이 원리금균등상환보다 처음 작아지는 회차입니다(없으면 None).
+    """
+    k = np.arange(1, periods + 1)
+    values = np.empty((len(PAYMENT_TYPES), periods, len(SCHEDULE_COLUMNS)))
+
+    # 공유 성장계수 (1+r)^j - 1, j = 0..n
+    growth = _growth_factors(monthly_rate, np.arange(periods + 1))
+    if monthly_rate == 0:
+        level_remaining = principal * (1 - np.arange(periods + 1) / periods)
+    else:
+        level_remaining = principal * (growth[-1] - growth) / growth[-1]
+    level_payment = calculate_level_payment(principal, periods, monthly_rate)
+    level = values[0]
+    level[:, 2] = level_remaining[:-1] * monthly_rate
+    level[:, 0] = level_payment
+    level[:, 1] = level_payment - level[:, 2]
+    level[:, 3] = level_remaining[1:]
+
+    values[1] = amortization_columns(principal, periods, monthly_rate, "원금균등상환", k=k)
+    values[2] = amortization_columns(principal, periods, monthly_rate, "만기일시상환", k=k)
+    values[:, -1, 3] = 0
+    np.maximum(values[:, :, 3], 0, out=values[:, :, 3])
+
+    cumulative_interest = np.cumsum(values[:, :, 2], axis=1)
+    stacked = np.concatenate([values, cumulative_interest[:, :, None]], axis=2)
+    columns = pd.MultiIndex.from_product([PAYMENT_TYPES, SCHEDULE_COLUMNS + ["누적이자"]], names=["상환방식", "항목"])
+    schedule_df = pd.DataFrame(
+        stacked.transpose(1, 0, 2).reshape(periods, -1),
+        index=pd.RangeIndex(1, periods + 1, name="회차"),
+        columns=columns
+    )
+
+    summary_df = pd.DataFrame(
+        {
+            "첫회 납입금액": values[:, 0, 0],
+            "최종회 납입금액": values[:, -1, 0],
+            "총 상환금액": values[:, :, 0].sum(axis=1),
+            "총 이자금액": cumulative_interest[:, -1],
+        },
+        index=pd.Index(PAYMENT_TYPES, name="상환방식")
+    )
+
+    crossing = np.flatnonzero(values[1, :, 0] < values[0, :, 0])
+    crossover_period = int(k[crossing[0]]) if crossing.size else None
+    return schedule_df, summary_df, crossover_period
+
+def _payment_type_codes(payment_type, size):
+    """상환방식 문자열(또는 배열)을 PAYMENT_TYPES 기준 정수 코드 배열로 변환합니다."""
+    if isinstance(payment_type, str):
+        if payment_type not in PAYMENT_TYPES:
+            raise ValueError(f"지원하지 않는 상환방식입니다: {payment_type}")
+        return np.full(size, PAYMENT_TYPES.index(payment_type), dtype=np.int8)
+    codes = pd.Categorical(np.asarray(payment_type), categories=PAYMENT_TYPES).codes
+    if (codes < 0).any():
+        unknown = sorted(set(np.asarray(payment_type)[codes < 0].astype(str)))
+        raise ValueError(f"지원하지 않는 상환방식입니다: {', '.join(unknown)}")
+    return np.asarray(codes, dtype=np.int8)
+
+def _loan_totals(principal, periods, monthly_rate, codes):
+    """
+    상환방식 코드별로 묶어 대출 합계를 닫힌 식으로 계산합니다.
+
+    Returns:
+        tuple: (첫 회 납입금액, 마지막 회 납입금액, 총 이자금액) 배열
+    """
+    first_payment = np.empty(principal.shape)
+    last_payment = np.empty(principal.shape)
+    total_interest = np.empty(principal.shape)
+
+    # 원리금균등상환: 납입금액 A * 회차 수 - 원금
+    mask = codes == 0
+    if mask.any():
+        p, n, r = principal[mask], periods[mask], monthly_rate[mask]
+        growth = _growth_factors(r, n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            payment = np.where(r == 0, p / n, p * r * (growth + 1) / growth)
+        first_payment[mask] = payment
+        last_payment[mask] = payment
+        total_interest[mask] = payment * n - p
+
+    # 원금균등상환: 이자 합계 = P * r * (n + 1) / 2
+    mask = codes == 1
+    if mask.any():
+        p, n, r = principal[mask], periods[mask], monthly_rate[mask]
+        first_payment[mask] = p / n + p * r
+        last_payment[mask] = p / n + p * r / n
+        total_interest[mask] = p * r * (n + 1) / 2
+
+    # 만기일시상환: 매 회차 동일한 이자, 마지막 회차에 원금 상환
+    mask = codes == 2
+    if mask.any():
+        p, n, r = principal[mask], periods[mask], monthly_rate[mask]
+        first_payment[mask] = np.where(n == 1, p, 0) + p * r
+        last_payment[mask] = p + p * r
+        total_interest[mask] = p * r * n
+
+    return first_payment, last_payment, total_interest
+
+def _summarize_loan(principal, periods, monthly_rate, payment_type):
+    """calculate_loan_summary의 캐시를 거치지 않는 계산입니다. 반복 호출되는 내부 계산에 사용합니다."""
+    codes = _payment_type_codes(payment_type, 1)
+    _, _, total_interest = _loan_totals(
+        np.array([principal], dtype=np.float64),
+        np.array([periods], dtype=np.int64),
+        np.array([monthly_rate], dtype=np.float64),
+        codes
+    )
+    total_interest = float(total_interest[0])
+    return principal + total_interest, total_interest
+
+@LOAN_CACHE.memoize(_loan_cache_key)
+def calculate_loan_summary(principal, periods, monthly_rate, payment_type):
+    """
+    상환 스케줄을 만들지 않고 대출 합계를 계산합니다.
+
+    회차 수와 관계없이 닫힌 식으로 계산하므로 요약만 필요할 때 사용합니다.
+
+    Args:
+        principal: 대출 원금
+        periods: 총 납입 회차 (개월 수)
+        monthly_rate: 월 이자율 (연이자율/12/100)
+        payment_type: 상환방식 (원리금균등상환, 원금균등상환, 만기일시상환)
+
+    Returns:
+        tuple: (총 상환금액, 총 이자금액)
+    """
+    return _summarize_loan(principal, periods, monthly_rate, payment_type)
+
+def _remaining_balances(principal, periods, monthly_rate, codes, k):
+    """각 대출의 k회차 납입 후 잔금을 계산합니다."""
+    k = np.minimum(k, periods)
+    growth_total = _growth_factors(monthly_rate, periods)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        level = np.where(
+            monthly_rate == 0,
+            principal * (1 - k / periods),
+            principal * (growth_total - _growth_factors(monthly_rate, k)) / growth_total
+        )
+    remaining = np.select(
+        [codes == 0, codes == 1],
+        [level, principal * (1 - k / periods)],
+        default=np.where(k == periods, 0, principal)
+    )
+    remaining[k == periods] = 0
+    return np.maximum(remaining, 0)
+
+def _price_loan_chunk(principal, periods, annual_rate, codes, profile_periods):
+    """calculate_loan_batch의 한 묶음(chunk)을 계산합니다."""
+    monthly_rate = annual_rate / 12 / 100
+    first_payment, last_payment, total_interest = _loan_totals(principal, periods, monthly_rate, codes)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        interest_ratio = total_interest / principal * 100
+
+    result = {
+        "월납입금액": first_payment,
+        "최종회납입금액": last_payment,
+        "총상환금액": principal + total_interest,
+        "총이자금액": total_interest,
+        "원금대비이자율": interest_ratio,
+    }
+    for k in profile_periods:
+        result[f"잔금_{k}회차"] = _remaining_balances(principal, periods, monthly_rate, codes, k)
+    return result
+
+def calculate_loan_batch(principal, periods, annual_rate, payment_type, profile_periods=(12, 60, 120), chunk_size=None):
+    """
+    여러 대출의 상환 요약을 한 번에 계산합니다.
+
+    상환방식별로 대출을 묶어 닫힌 식으로 계산하므로 대출 건수만큼 반복하지 않습니다.
+    회차 수는 식에 그대로 들어가므로 기간별로 따로 나눌 필요가 없습니다.
+
+    Args:
+        principal: 대출 원금 배열
+        periods: 총 납입 회차 배열 (개월 수)
+        annual_rate: 연이자율(%) 배열
+        payment_type: 상환방식 배열 또는 모든 대출에 적용할 상환방식 문자열
+        profile_periods: 잔금을 함께 계산할 회차 목록 (상환 진행 현황)
+        chunk_size: 한 번에 계산할 대출 건수. 지정하면 메모리 사용량이 이 크기에 비례합니다.
+
+    Returns:
+        DataFrame: 대출별 월납입금액, 최종회납입금액, 총상환금액, 총이자금액, 원금대비이자율, 회차별 잔금
+    """
+    index = principal.index if isinstance(principal, pd.Series) else None
+    principal = np.asarray(principal, dtype=np.float64)
+    periods = np.asarray(periods, dtype=np.int64)
+    annual_rate = np.asarray(annual_rate, dtype=np.float64)
+    codes = _payment_type_codes(payment_type, principal.size)
+    if (periods < 1).any():
+        raise ValueError("납입 회차는 1 이상이어야 합니다.")
+
+    size = principal.size
+    step = size if not chunk_size else int(chunk_size)
+    columns = None
+    for start in range(0, max(size, 1), max(step, 1)):
+        chunk = slice(start, start + step)
+        values = _price_loan_chunk(principal[chunk], periods[chunk], annual_rate[chunk], codes[chunk], profile_periods)
+        if columns is None:
+            columns = {name: np.empty(size) for name in values}
+        for name, column in values.items():
+            columns[name][chunk] = column
+
+    return pd.DataFrame(columns, index=index)
+
+def calculate_loan_grid(principal, annual_rates, periods, payment_type):
+    """
+    연이자율 × 대출기간 조합별 월 납입금액과 총 이자금액을 한 번에 계산합니다.
+
+    이자율 배열과 회차 배열을 브로드캐스팅해 닫힌 식에 한 번만 넣으므로
+    조합 수만큼 대출 계산을 반복하지 않습니다.
+
+    Args:
+        principal: 대출 원금
+        annual_rates: 연이자율(%) 배열 (행)
+        periods: 총 납입 회차 배열 (열, 개월 수)
+        payment_type: 상환방식 (원리금균등상환, 원금균등상환, 만기일시상환)
+
+    Returns:
+        tuple: (월 납입금액 데이터프레임, 총 이자금액 데이터프레임).
+            행 인덱스는 연이자율, 열은 납입 회차입니다. 원금균등상환의 월 납입금액은 첫 회차 기준입니다.
+    """
+    annual_rates = np.asarray(annual_rates, dtype=np.float64)
+    periods = np.asarray(periods, dtype=np.int64)
+    rate_grid, period_grid = np.meshgrid(annual_rates / 12 / 100, periods, indexing="ij")
+    codes = _payment_type_codes(payment_type, rate_grid.size).reshape(rate_grid.shape)
+
+    first_payment, _, total_interest = _loan_totals(
+        np.full(rate_grid.shape, float(principal)), period_grid, rate_grid, codes
+    )
+    index = pd.Index(annual_rates, name="연이자율")
+    columns = pd.Index(periods, name="납입회차")
+    return (
+        pd.DataFrame(first_payment, index=index, columns=columns),
+        pd.DataFrame(total_interest, index=index, columns=columns),
+    )
+
+LOAN_BOOK_COLUMNS = {
+    "principal": "대출금액",
+    "periods": "납입회차",
+    "annual_rate": "연이자율",
+    "payment_type": "상환방식",
+}
+
+def _iter_loan_book(book, chunk_size):
+    """대출 장부를 LOAN_BOOK_COLUMNS 열만 chunk_size 건씩 읽어 DataFrame으로 돌려주는 제너레이터입니다."""
+    columns = list(LOAN_BOOK_COLUMNS.values())
+    if isinstance(book, pd.DataFrame):
+        for start in range(0, len(book), chunk_size):
+            yield book.iloc[start:start + chunk_size][columns]
+    elif str(book).endswith(".parquet"):
+        # 행 그룹 단위로 필요한 열만 읽어 장부 전체를 메모리에 올리지 않음
+        import pyarrow.parquet as pq
+        offset = 0
+        for batch in pq.ParquetFile(book).iter_batches(batch_size=chunk_size, columns=columns):
+            # 배치마다 0부터 시작하는 인덱스를 장부 전체의 행 번호로 맞춤
+            chunk = batch.to_pandas()
+            chunk.index += offset
+            offset += len(chunk)
+            yield chunk
+    else:
+        yield from pd.read_csv(book, usecols=columns, chunksize=chunk_size)
+
+def price_loan_book(book, profile_periods=(12, 60, 120), chunk_size=100_000, output=None):
+    """
+    CSV/Parquet 대출 장부(또는 DataFrame)의 상환 요약을 계산합니다.
+
+    장부에는 LOAN_BOOK_COLUMNS의 열(대출금액, 납입회차, 연이자율, 상환방식)이 있어야 하며, 그 열만
+    chunk_size 건씩 읽어(Parquet은 행 배치, CSV는 chunksize) 계산합니다. 묶음마다 상환방식별 합계만
+    누적하고 대출별 결과는 보관하지 않으므로, 메모리 사용량은 장부 크기와 관계없이 chunk_size에 비례합니다.
+    대출별 결과가 필요하면 output에 CSV 경로를 주어 묶음마다 파일에 이어 씁니다.
+
+    Args:
+        book: CSV/Parquet 파일 경로 또는 DataFrame
+        profile_periods: 잔금을 함께 계산할 회차 목록
+        chunk_size: 한 번에 읽고 계산할 대출 건수
+        output: 대출별 결과(장부 열 + calculate_loan_batch 결과)를 쓸 CSV 경로 (선택)
+
+    Returns:
+        DataFrame: 상환방식별(과 합계) 대출건수, 대출금액, 월납입금액, 총상환금액, 총이자금액,
+            회차별 잔금 합계와 원금대비이자율(%) 표
+    """
+    totals = None
+    first_chunk = True
+    for chunk in _iter_loan_book(book, chunk_size):
+        summary = calculate_loan_batch(
+            *(chunk[LOAN_BOOK_COLUMNS[name]].to_numpy() for name in ["principal", "periods", "annual_rate", "payment_type"]),
+            profile_periods=profile_periods
+        )
+        summary.index = chunk.index
+        if output is not None:
+            pd.concat([chunk, summary], axis=1).to_csv(output, mode="w" if first_chunk else "a", header=first_chunk)
+        first_chunk = False
+
+        # 비율 열은 합계로 다시 계산하므로 금액 열만 상환방식별로 합산
+        amounts = summary.drop(columns=["최종회납입금액", "원금대비이자율"])
+        amounts.insert(0, "대출금액", chunk[LOAN_BOOK_COLUMNS["principal"]].to_numpy(dtype=np.float64))
+        amounts.insert(0, "대출건수", 1)
+        grouped = amounts.groupby(chunk[LOAN_BOOK_COLUMNS["payment_type"]].to_numpy()).sum()
+        totals = grouped if totals is None else totals.add(grouped, fill_value=0)
+
+    if totals is None:
+        raise ValueError("대출 장부에 대출이 없습니다.")
+    totals = totals.reindex([name for name in PAYMENT_TYPES if name in totals.index])
+    totals.loc["합계"] = totals.sum()
+    totals.index.name = LOAN_BOOK_COLUMNS["payment_type"]
+    totals["대출건수"] = totals["대출건수"].astype(np.int64)
+    totals["원금대비이자율"] = totals["총이자금액"] / totals["대출금액"] * 100
+    return totals
@@ -0,0 +1,131 @@
+import pandas as pd
+import numpy as np
+
+from utils.loan_solvers import _broadcast
+from utils.tvm import annuity_factor, compound_monthly_rate, fv, pmt, pv, rate
+
+def solve_required_contribution(target_amount, initial_investment, total_months, monthly_rate, escalation_rate=0.0):
+    """
+    목표금액에 도달하기 위해 필요한 (첫해) 월 납입금액을 계산합니다.
+
+    FV = 초기투자금 × (1+r)^n + 월 납입금액 × 연금 계수 를 월 납입금액에 대해 푼 닫힌 식(tvm.pmt)이며,
+    escalation_rate를 주면 연금 계수는 매년 납입금이 늘어나는 성장형 연금 계수입니다.
+
+    Args:
+        target_amount: 목표금액 (배열 가능)
+        initial_investment: 초기투자금액 (배열 가능)
+        total_months: 투자 기간 (개월 수, 배열 가능)
+        monthly_rate: 월수익률 (소수, 배열 가능)
+        escalation_rate: 연간 납입금 증가율 (소수)
+
+    Returns:
+        ndarray: 필요한 첫해 월 납입금액. 초기투자금만으로 목표에 도달하면 0
+    """
+    target_amount, initial_investment, total_months, monthly_rate = _broadcast(
+        target_amount, initial_investment, total_months, monthly_rate
+    )
+    return np.maximum(0, pmt(monthly_rate, total_months, pv=initial_investment, fv=target_amount,
+                             escalation_rate=escalation_rate))
+
+def solve_required_return(target_amount, initial_investment, monthly_contribution, total_months, escalation_rate=0.0,
+                          tol=1e-9, max_iter=100, return_diagnostics=False):
+    """
+    목표금액에 도달하기 위해 필요한 연수익률(월 복리 기준)을 역산합니다.
+
+    미래가치는 월수익률에 대한 증가함수이므로 [-50%, 100%] 월수익률 구간에서 tvm.rate로 풉니다
+    (뉴턴법, 구간을 벗어나면 이분법).
+    목표금액이 총 납입액보다 작으면 음수 수익률이 나올 수 있습니다.
+
+    Args:
+        target_amount: 목표금액 (배열 가능)
+        initial_investment: 초기투자금액 (배열 가능)
+        monthly_contribution: (첫해) 월 납입금액 (배열 가능)
+        total_months: 투자 기간 (개월 수, 배열 가능)
+        escalation_rate: 연간 납입금 증가율 (소수)
+        tol: 목표금액 대비 상대 허용 오차
+        max_iter: 최대 반복 횟수
+        return_diagnostics: True면 수렴 진단 데이터프레임을 함께 반환
+
+    Returns:
+        ndarray: 필요한 연수익률(%, 월수익률 × 12). 해가 없으면 NaN
+        return_diagnostics=True면 (연수익률, 반복횟수·상대잔차·수렴여부 데이터프레임)
+    """
+    target_amount, initial_investment, monthly_contribution, total_months = _broadcast(
+        target_amount, initial_investment, monthly_contribution, total_months
+    )
+    # 목표금액이나 납입 총액이 0 이하이면 풀지 않음
+    invested = initial_investment + monthly_contribution * annuity_factor(0.0, total_months, escalation_rate)
+    valid = (target_amount > 0) & (invested > 0)
+    monthly_rate, diagnostics = rate(
+        total_months, monthly_contribution, initial_investment, np.where(valid, target_amount, np.nan),
+        escalation_rate=escalation_rate, tol=tol, max_iter=max_iter, return_diagnostics=True
+    )
+    annual_rate = np.asarray(monthly_rate) * 12 * 100
+    if not return_diagnostics:
+        return annual_rate
+    return annual_rate, diagnostics
+
+def required_return_by_horizon(target_amount, initial_investment, monthly_contribution, years, monthly_rate=None,
+                               escalation_rate=0.0):
+    """
+    투자 기간별 목표 달성 조건을 한 번의 배열 계산으로 표로 만듭니다.
+
+    Args:
+        target_amount: 목표금액
+        initial_investment: 초기투자금액
+        monthly_contribution: (첫해) 월 납입금액
+        years: 투자 기간(년) 배열
+        monthly_rate: 지정하면 이 월수익률에서 필요한 월 납입금액 열을 함께 계산
+        escalation_rate: 연간 납입금 증가율 (소수)
+
+    Returns:
+        DataFrame: 투자기간(년)을 인덱스로 하는 필요 연수익률(%), 총 납입액, (필요 월 납입금액,) 반복횟수, 수렴 표
+    """
+    years = np.asarray(years)
+    rates, diagnostics = solve_required_return(
+        target_amount, initial_investment, monthly_contribution, years * 12, escalation_rate, return_diagnostics=True
+    )
+    table = pd.DataFrame({
+        "필요 연수익률 (%)": rates,
+        "총 납입액": initial_investment + monthly_contribution * annuity_factor(0.0, years * 12, escalation_rate),
+    }, index=pd.Index(years, name="투자기간(년)"))
+    if monthly_rate is not None:
+        table["필요 월 납입금액"] = solve_required_contribution(
+            target_amount, initial_investment, years * 12, monthly_rate, escalation_rate
+        )
+    table["반복횟수"] = diagnostics["반복횟수"].to_numpy()
+    table["수렴"] = diagnostics["수렴"].to_numpy()
+    return table
+
+def calculate_investment_grid(base_amount, monthly_contribution, annual_returns, total_months,
+                              compounding_periods=12, escalation_rate=0.0, present_value=False):
+    """
+    연수익률 × 투자 기간 조합별 미래가치(또는 필요 초기 투자금)를 한 번에 계산합니다.
+
+    연수익률 배열(행)을 복리 계산 주기에 맞는 월수익률로 바꾼 뒤 투자 개월 배열(열)과 브로드캐스팅해
+    FV = P × (1+r)^n + c × 연금 계수 닫힌 식에 한 번만 넣으므로, 조합 수만큼 계산을 반복하지 않습니다.
+
+    Args:
+        base_amount: 초기투자금액 (present_value=True면 목표금액)
+        monthly_contribution: 월 납입금액 (연 납입은 월 환산 금액)
+        annual_returns: 연수익률(%) 배열 (행)
+        total_months: 투자 기간(개월 수) 배열 (열)
+        compounding_periods: 연간 복리 계산 횟수 (12, 4, 2, 1)
+        escalation_rate: 연간 납입금 증가율 (소수)
+        present_value: True면 목표금액에 필요한 초기 투자금(음수면 0)을 계산
+
+    Returns:
+        DataFrame: 행 인덱스는 연수익률, 열은 투자 개월 수인 금액 표
+    """
+    annual_returns = np.atleast_1d(np.asarray(annual_returns, dtype=np.float64))
+    total_months = np.atleast_1d(np.asarray(total_months, dtype=np.int64))
+    monthly_rate = compound_monthly_rate(annual_returns, compounding_periods)[:, None]
+    if present_value:
+        values = np.maximum(0, pv(monthly_rate, total_months, monthly_contribution, base_amount, escalation_rate))
+    else:
+        values = fv(monthly_rate, total_months, monthly_contribution, base_amount, escalation_rate)
+    return pd.DataFrame(
+        values,
+        index=pd.Index(annual_returns, name="연수익률"),
+        columns=pd.Index(total_months, name="투자개월")
+    )
@@ -0,0 +1,133 @@
+import os
+
+import pandas as pd
+import numpy as np
+
+DAY_COUNT_BASIS = 365
+DATED_SCHEDULE_COLUMNS = ["납입일", "일수", "납입금액", "원금상환", "이자금액", "잔금"]
+
+# 양력 고정 공휴일 (월-일). 설날·추석·대체공휴일 등 해마다 바뀌는 휴일은 KOREAN_HOLIDAYS_PATH 파일에서 읽습니다.
+KOREAN_FIXED_HOLIDAYS = ["01-01", "03-01", "05-05", "06-06", "08-15", "10-03", "10-09", "12-25"]
+# 앱과 함께 배포하는 음력·대체공휴일·선거일 목록 (data/holidays/korean_holidays.csv)
+KOREAN_HOLIDAYS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "holidays", "korean_holidays.csv"
+)
+
+def korean_holidays(first_year, last_year, extra_holidays=None):
+    """
+    기간 내 한국 양력 고정 공휴일과 추가 휴일을 datetime64[D] 배열로 반환합니다.
+
+    Args:
+        first_year: 시작 연도
+        last_year: 종료 연도
+        extra_holidays: 추가 휴일 목록 (설날, 추석, 대체공휴일 등)
+
+    Returns:
+        ndarray: 정렬된 휴일 날짜 배열
+    """
+    years = np.arange(first_year, last_year + 1).astype(str)
+    fixed = np.char.add(np.char.add(years[:, None], "-"), np.array(KOREAN_FIXED_HOLIDAYS)[None, :])
+    holidays = fixed.ravel().astype("datetime64[D]")
+    if extra_holidays is not None and len(extra_holidays):
+        holidays = np.concatenate([holidays, np.asarray(extra_holidays, dtype="datetime64[D]")])
+    return np.unique(holidays)
+
+def load_holidays(path=KOREAN_HOLIDAYS_PATH, column="날짜"):
+    """CSV 휴일 목록 파일에서 휴일 날짜를 읽어 datetime64[D] 배열로 반환합니다 (기본은 배포된 한국 휴일 목록)."""
+    return pd.read_csv(path, usecols=[column])[column].to_numpy().astype("datetime64[D]")
+
+def generate_payment_dates(start_date, periods, payment_day, holidays=None, roll="following"):
+    """
+    매월 약정 납입일을 생성합니다.
+
+    대출 실행일 다음 달부터 매월 payment_day에 납입하며, 해당 월에 그 날짜가 없으면
+    말일로 조정합니다. 납입일이 주말이나 휴일이면 roll 규칙에 따라 영업일로 옮깁니다.
+
+    Args:
+        start_date: 대출 실행일
+        periods: 총 납입 회차
+        payment_day: 약정 납입일 (1~31)
+        holidays: 휴일 날짜 배열 (생략하면 양력 고정 공휴일과 배포된 휴일 목록 사용)
+        roll: 휴일 조정 규칙 ("following": 다음 영업일, "modifiedfollowing": 다음 영업일이
+            다음 달이면 직전 영업일, "none": 조정하지 않음)
+
+    Returns:
+        ndarray: datetime64[D] 납입일 배열
+    """
+    start = np.datetime64(start_date, "D")
+    months = start.astype("datetime64[M]") + np.arange(1, periods + 1)
+    month_starts = months.astype("datetime64[D]")
+    month_lengths = ((months + 1).astype("datetime64[D]") - month_starts).astype(np.int64)
+    dates = month_starts + (np.minimum(payment_day, month_lengths) - 1)
+
+    if roll == "none":
+        return dates
+    if holidays is None:
+        first_year = int(str(start.astype("datetime64[Y]")))
+        holidays = korean_holidays(first_year, first_year + periods // 12 + 2, load_holidays())
+    return np.busday_offset(dates, 0, roll=roll, holidays=holidays)
+
+def calculate_dated_loan_schedule(principal, annual_rate, payment_type, start_date, periods,
+                                  payment_day=None, holidays=None, roll="following"):
+    """
+    실제 경과 일수(actual/365)로 이자를 계산하는 날짜 기준 상환 스케줄을 만듭니다.
+
+    회차별 이자율 r_i = 연이자율 × 일수_i / 365 를 배열로 만든 뒤 누적곱으로 계산합니다.
+    원리금균등상환의 납입금액은 회차별 일수가 달라도 마지막 회차에 잔금이 0이 되도록
+    A = P × G_n / Σ(G_n / G_j) (G_i = Π(1 + r_k), k ≤ i) 로 구합니다.
+
+    Args:
+        principal: 대출 원금
+        annual_rate: 연이자율 (%)
+        payment_type: 상환방식 (원리금균등상환, 원금균등상환, 만기일시상환)
+        start_date: 대출 실행일
+        periods: 총 납입 회차 (개월 수)
+        payment_day: 약정 납입일 (생략하면 대출 실행일의 일자)
+        holidays: 휴일 날짜 배열 (생략하면 양력 고정 공휴일과 배포된 휴일 목록 사용)
+        roll: 휴일 조정 규칙 (generate_payment_dates 참고)
+
+    Returns:
+        DataFrame: 회차별 납입일, 일수, 납입금액, 원금상환, 이자금액, 잔금
+    """
+    start = np.datetime64(start_date, "D")
+    if payment_day is None:
+        payment_day = int(str(start)[-2:])
+    dates = generate_payment_dates(start, periods, payment_day, holidays, roll)
+    days = np.diff(dates, prepend=start).astype(np.int64)
+    period_rates = annual_rate / 100 * days / DAY_COUNT_BASIS
+    k = np.arange(1, periods + 1)
+
+    if payment_type == "원리금균등상환":
+        growth = np.cumprod(1 + period_rates)
+        payment = np.full(periods, principal * growth[-1] / np.sum(growth[-1] / growth))
+        remaining = growth * (principal - payment[0] * np.cumsum(1 / growth))
+        previous = np.concatenate([[principal], remaining[:-1]])
+        interest = previous * period_rates
+        principal_payment = payment - interest
+    elif payment_type == "원금균등상환":
+        principal_payment = np.full(periods, principal / periods)
+        remaining = principal * (1 - k / periods)
+        interest = principal * (1 - (k - 1) / periods) * period_rates
+        payment = principal_payment + interest
+    elif payment_type == "만기일시상환":
+        interest = principal * period_rates
+        principal_payment = np.where(k == periods, principal, 0)
+        payment = principal_payment + interest
+        remaining = np.where(k == periods, 0, principal)
+    else:
+        raise ValueError(f"지원하지 않는 상환방식입니다: {payment_type}")
+
+    remaining = np.maximum(remaining, 0)
+    remaining[-1] = 0
+    return pd.DataFrame(
+        {
+            "납입일": dates,
+            "일수": days,
+            "납입금액": payment,
+            "원금상환": principal_payment,
+            "이자금액": interest,
+            "잔금": remaining,
+        },
+        index=pd.Index(k, name="회차"),
+        columns=DATED_SCHEDULE_COLUMNS
+    )
@@ -0,0 +1,188 @@
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_UP, localcontext
+
+import pandas as pd
+import numpy as np
+
+from utils.financial_utils import SCHEDULE_COLUMNS, amortization_columns
+
+ROUNDING_RULES = ["절사", "반올림", "절상"]
+# 연이자율(%)을 정수로 표현하기 위한 배율 (0.0001% 단위)
+RATE_SCALE = 10_000
+# 원리금균등상환 고정점 반복의 기본 최대 횟수 (넘으면 남은 회차를 순차 계산)
+FIXED_POINT_PASSES = 8
+
+_DECIMAL_ROUNDING = {"절사": ROUND_FLOOR, "반올림": ROUND_HALF_UP, "절상": ROUND_CEILING}
+
+def round_won(numerator, denominator, rounding):
+    """
+    정수 분수 numerator / denominator 를 원 단위 정수로 반올림 규칙에 맞춰 변환합니다.
+
+    부동소수점을 거치지 않으므로 결과가 정확합니다. denominator는 양수여야 합니다.
+
+    Args:
+        numerator: 분자 (int64 배열 또는 정수)
+        denominator: 분모 (양의 정수)
+        rounding: 반올림 규칙 (절사, 반올림, 절상)
+
+    Returns:
+        int64 배열 또는 정수
+    """
+    if rounding == "절사":
+        return numerator // denominator
+    if rounding == "반올림":
+        return (2 * numerator + denominator) // (2 * denominator)
+    if rounding == "절상":
+        return -(-numerator // denominator)
+    raise ValueError(f"지원하지 않는 반올림 규칙입니다: {rounding}")
+
+def _rate_units(annual_rate):
+    """연이자율(%)을 RATE_SCALE 배율의 정수로 정확히 변환합니다."""
+    units = Decimal(str(annual_rate)) * RATE_SCALE
+    if units != units.to_integral_value():
+        raise ValueError(f"연이자율은 {1 / RATE_SCALE}% 단위까지만 지원합니다: {annual_rate}")
+    return int(units)
+
+def calculate_level_payment_won(principal, periods, annual_rate, rounding):
+    """
+    원리금균등상환 납입금액을 원 단위로 계산합니다.
+
+    회차마다 한 번만 계산하는 값이므로 Decimal로 충분한 정밀도를 확보한 뒤 반올림 규칙을 적용합니다.
+    """
+    with localcontext() as ctx:
+        ctx.prec = 50
+        r = Decimal(_rate_units(annual_rate)) / (1200 * RATE_SCALE)
+        if r == 0:
+            payment = Decimal(principal) / periods
+        else:
+            growth = (1 + r) ** periods
+            payment = Decimal(principal) * r * growth / (growth - 1)
+        return int(payment.to_integral_value(rounding=_DECIMAL_ROUNDING[rounding]))
+
+def _balance_bound(principal, periods, rate_units):
+    """
+    원리금균등상환 직전 잔금의 상한을 계산합니다.
+
+    회차별 이자와 납입금액의 반올림 차이는 각각 1원 미만이고 이후 회차 동안 (1+r)^k배로 커지므로,
+    잔금은 원금 + 2 × ((1+r)^n - 1) / r 을 넘지 않습니다.
+    """
+    with localcontext() as ctx:
+        ctx.prec = 50
+        r = Decimal(rate_units) / (1200 * RATE_SCALE)
+        drift = Decimal(periods) if r == 0 else ((1 + r) ** periods - 1) / r
+        return principal + 2 * int(drift.to_integral_value(rounding=ROUND_CEILING))
+
+def _check_int64_range(bound, periods, rate_units, level_payment=0):
+    """잔금 상한으로 이자 분자(잔금 × 이자율)와 누적 원금상환이 int64 범위 안인지 확인합니다."""
+    limit = np.iinfo(np.int64).max
+    if 2 * bound * rate_units + 1200 * RATE_SCALE > limit or periods * (level_payment + bound + 1) + bound > limit:
+        raise ValueError("대출금액·기간·이자율이 너무 커서 원 단위 정수(int64)로 계산할 수 없습니다.")
+
+def _level_payment_balances(principal, periods, rate_units, level_payment, rounding, max_iter, bound):
+    """
+    원리금균등상환의 회차별 직전 잔금(int64 배열)을 계산합니다.
+
+    실수 닫힌 식 잔금에서 시작해 "잔금 → 이자 → 누적 원금상환 → 잔금"을 배열 단위로 최대 max_iter번
+    반복합니다. 잔금은 0 아래로 내려가지 않으므로(완납 이후 잔금 0) 고정점은 완납 시점에서 멈추는
+    순차 계산 결과와 같고, 잔금 상한 bound로 자르므로 반복 중에도 int64를 넘지 않습니다.
+    한 번 반복할 때마다 앞 반복과 처음 달라지는 회차까지는 순차 계산 결과와 같으므로, 반복 상한에
+    도달하면 그 회차부터만 정수로 순차 계산합니다. 따라서 비용은 최악에도
+    O(max_iter × 회차 수 + 회차 수)입니다.
+    """
+    denominator = 1200 * RATE_SCALE
+    initial = amortization_columns(principal, periods, rate_units / denominator, "원리금균등상환")[:, 3]
+    initial = np.clip(np.nan_to_num(np.rint(initial[:-1])), 0, principal)
+    previous = np.concatenate([[principal], initial]).astype(np.int64)
+
+    mismatch = 0
+    for _ in range(max_iter):
+        interest = round_won(previous * rate_units, denominator, rounding)
+        principal_payment = level_payment - interest
+        remaining = np.clip(principal - np.cumsum(principal_payment[:-1]), 0, bound)
+        updated = np.concatenate([[principal], remaining])
+        if np.array_equal(updated, previous):
+            return previous
+        mismatch = int(np.argmax(updated != previous))
+        previous = updated
+
+    # 처음 달라진 회차의 직전 잔금까지는 확정값이므로 나머지 회차만 순차 계산
+    balance = int(previous[mismatch])
+    tail = []
+    for _ in range(mismatch, periods):
+        tail.append(balance)
+        balance = max(balance - level_payment + round_won(balance * rate_units, denominator, rounding), 0)
+    previous[mismatch:] = tail
+    return previous
+
+def calculate_loan_schedule_won(principal, periods, annual_rate, payment_type, rounding="절사",
+                                max_iter=FIXED_POINT_PASSES):
+    """
+    모든 금액을 int64 원 단위로 유지하는 대출 상환 스케줄을 계산합니다.
+
+    회차별 이자는 직전 잔금 × 이자율을 정수 분수로 계산한 뒤 반올림 규칙(절사/반올림/절상)을 적용합니다.
+    원금상환 합계는 항상 대출 원금과 같고, 납입금액 합계는 원금상환 합계 + 이자 합계와 원 단위까지 일치합니다.
+    마지막 회차는 남은 잔금을 모두 상환해 잔금이 정확히 0이 됩니다. 원리금균등상환에서 잔금과 이자의 합이
+    납입금액 이하가 되면(절상으로 납입금액이 커진 고금리 장기 대출 등) 그 회차에 잔금과 이자만 내고
+    완납하며, 이후 회차의 금액은 모두 0입니다.
+
+    원리금균등상환은 반올림 때문에 회차 간 의존성이 생기므로, 실수 닫힌 식 잔금에서 시작해
+    "잔금 → 이자 → 누적 원금상환 → 잔금"을 배열 단위로 반복해 고정점을 찾습니다.
+    이 고정점은 회차별 순차 계산 결과와 같으며, 보통 2~3회 반복으로 수렴합니다. 반올림 차이가
+    길게 전파되는 경우에는 max_iter번 반복한 뒤 남은 회차를 순차 계산하므로 실수 구현보다 느립니다
+    (benchmarks/integer_won_benchmark.py 참고).
+
+    잔금 상한 × 이자율이 int64 범위를 넘는 입력(고금리 초장기 대출 등)은 ValueError를 발생시킵니다.
+
+    Args:
+        principal: 대출 원금 (원, 정수)
+        periods: 총 납입 회차 (개월 수)
+        annual_rate: 연이자율 (%, 0.0001% 단위)
+        payment_type: 상환방식 (원리금균등상환, 원금균등상환, 만기일시상환)
+        rounding: 이자·납입금액 반올림 규칙 (절사, 반올림, 절상)
+        max_iter: 원리금균등상환 고정점 반복 최대 횟수
+
+    Returns:
+        DataFrame: int64 상환 스케줄 데이터프레임
+    """
+    principal = int(principal)
+    rate_units = _rate_units(annual_rate)
+    denominator = 1200 * RATE_SCALE
+    k = np.arange(1, periods + 1)
+
+    if payment_type == "원리금균등상환":
+        level_payment = calculate_level_payment_won(principal, periods, annual_rate, rounding)
+        bound = _balance_bound(principal, periods, rate_units)
+        _check_int64_range(bound, periods, rate_units, level_payment)
+        previous = _level_payment_balances(principal, periods, rate_units, level_payment, rounding, max_iter, bound)
+        interest = round_won(previous * rate_units, denominator, rounding)
+        # 완납 회차는 남은 잔금만 상환하고, 이후 회차는 잔금과 이자가 0이므로 상환액도 0
+        principal_payment = np.minimum(level_payment - interest, previous)
+        principal_payment[-1] = previous[-1]
+        remaining = principal - np.cumsum(principal_payment)
+        payment = principal_payment + interest
+
+    elif payment_type == "원금균등상환":
+        _check_int64_range(principal, periods, rate_units)
+        # 나누어 떨어지지 않는 원금은 마지막 회차에 더함
+        principal_payment = np.full(periods, principal // periods, dtype=np.int64)
+        principal_payment[-1] += principal - principal_payment.sum()
+        remaining = principal - np.cumsum(principal_payment)
+        previous = remaining + principal_payment
+        interest = round_won(previous * rate_units, denominator, rounding)
+        payment = principal_payment + interest
+
+    elif payment_type == "만기일시상환":
+        _check_int64_range(principal, periods, rate_units)
+        interest = np.full(periods, round_won(principal * rate_units, denominator, rounding), dtype=np.int64)
+        principal_payment = np.where(k == periods, principal, 0).astype(np.int64)
+        payment = principal_payment + interest
+        remaining = np.where(k == periods, 0, principal).astype(np.int64)
+
+    else:
+        raise ValueError(f"지원하지 않는 상환방식입니다: {payment_type}")
+
+    values = np.empty((periods, len(SCHEDULE_COLUMNS)), dtype=np.int64)
+    values[:, 0] = payment
+    values[:, 1] = principal_payment
+    values[:, 2] = interest
+    values[:, 3] = remaining
+    return pd.DataFrame(values, index=pd.RangeIndex(1, periods + 1, name="회차"), columns=SCHEDULE_COLUMNS)
@@ -0,0 +1,128 @@
+import pandas as pd
+import numpy as np
+
+from utils.financial_utils import _summarize_loan, amortization_columns
+
+SEGMENT_SCHEDULE_COLUMNS = ["적용금리", "납입금액", "원금상환", "이자금액", "중도상환금액", "중도상환수수료", "잔금"]
+PREPAYMENT_COLUMNS = ["중도상환금액", "중도상환수수료", "절감이자"]
+
+def _event_table(events, accumulate=True):
+    """
+    {회차: 값} 또는 (회차, 값) 목록을 회차별 딕셔너리로 정리합니다.
+
+    accumulate가 True이면 같은 회차의 값을 합산하고, False이면 마지막 값을 사용합니다.
+    """
+    if not events:
+        return {}
+    items = events.items() if isinstance(events, dict) else events
+    table = {}
+    for period, value in items:
+        period = int(period)
+        table[period] = table.get(period, 0) + value if accumulate else value
+    return table
+
+def calculate_prepayment_fee(amount, fee_rate, elapsed_periods, fee_periods=36):
+    """
+    중도상환수수료를 계산합니다.
+
+    수수료 = 중도상환금액 × 수수료율 × (잔여 수수료 부과기간 / 수수료 부과기간)
+
+    Args:
+        amount: 중도상환금액
+        fee_rate: 중도상환수수료율 (%)
+        elapsed_periods: 대출 실행 후 경과 회차
+        fee_periods: 수수료 부과기간 (회차, 일반적으로 3년 = 36개월)
+
+    Returns:
+        float: 중도상환수수료
+    """
+    if fee_periods <= 0:
+        return 0.0
+    remaining_ratio = max(0, fee_periods - elapsed_periods) / fee_periods
+    return amount * fee_rate / 100 * remaining_ratio
+
+def calculate_segmented_schedule(principal, periods, annual_rate, payment_type,
+                                 rate_changes=None, prepayments=None,
+                                 prepayment_fee_rate=0.0, fee_periods=36):
+    """
+    변동금리와 중도상환을 반영한 대출 상환 스케줄을 계산합니다.
+
+    금리 변경과 중도상환 시점에서 대출을 구간으로 나누고, 각 구간은 남은 잔금과
+    남은 기간으로 새 대출을 시작한 것처럼 닫힌 식으로 계산합니다.
+    반복은 회차가 아닌 구간 단위로만 일어납니다.
+
+    - 원리금균등상환: 구간마다 남은 기간 기준으로 납입금액을 다시 계산합니다.
+    - 원금균등상환: 구간마다 남은 잔금을 남은 기간으로 나누어 원금상환액을 다시 계산합니다.
+    - 만기일시상환: 줄어든 잔금과 새 금리로 이자를 계산합니다.
+
+    Args:
+        principal: 대출 원금
+        periods: 총 납입 회차 (개월 수)
+        annual_rate: 최초 연이자율 (%)
+        payment_type: 상환방식 (원리금균등상환, 원금균등상환, 만기일시상환)
+        rate_changes: {적용 시작 회차: 새 연이자율(%)} 또는 (회차, 연이자율) 목록
+        prepayments: {회차: 중도상환금액} 또는 (회차, 금액) 목록. 해당 회차 납입 직후 상환합니다.
+        prepayment_fee_rate: 중도상환수수료율 (%)
+        fee_periods: 중도상환수수료 부과기간 (회차)
+
+    Returns:
+        tuple: (상환 스케줄 데이터프레임, 중도상환 내역 데이터프레임)
+            중도상환 내역의 절감이자는 상환 시점의 금리가 만기까지 유지된다고 가정한 값입니다.
+    """
+    rate_changes = _event_table(rate_changes, accumulate=False)
+    prepayments = _event_table(prepayments)
+    boundaries = sorted(
+        {p for p in rate_changes if 1 < p <= periods}
+        | {p + 1 for p in prepayments if 1 <= p < periods}
+    )
+
+    rate = rate_changes.get(1, annual_rate)
+    balance = float(principal)
+    blocks = []
+    indices = []
+    prepayment_rows = []
+
+    for seg_start, seg_next in zip([1] + boundaries, boundaries + [periods + 1]):
+        monthly_rate = rate / 12 / 100
+        remaining_periods = periods - seg_start + 1
+        k = np.arange(1, seg_next - seg_start + 1)
+
+        values = amortization_columns(balance, remaining_periods, monthly_rate, payment_type, k=k)
+        block = np.zeros((k.size, len(SEGMENT_SCHEDULE_COLUMNS)))
+        block[:, 0] = rate
+        block[:, 1:4] = values[:, :3]
+        block[:, 6] = values[:, 3]
+        balance = block[-1, 6]
+
+        seg_end = seg_next - 1
+        amount = min(prepayments.get(seg_end, 0), balance)
+        if amount > 0:
+            fee = calculate_prepayment_fee(amount, prepayment_fee_rate, seg_end, fee_periods)
+            left = periods - seg_end
+            interest_before = _summarize_loan(balance, left, monthly_rate, payment_type)[1]
+            interest_after = _summarize_loan(balance - amount, left, monthly_rate, payment_type)[1] if balance > amount else 0.0
+            balance -= amount
+            block[-1, 4] = amount
+            block[-1, 5] = fee
+            block[-1, 6] = balance
+            prepayment_rows.append((seg_end, amount, fee, interest_before - interest_after))
+
+        blocks.append(block)
+        indices.append(k + seg_start - 1)
+
+        # 잔금을 모두 상환하면 이후 구간은 없음
+        if balance <= 0:
+            break
+        rate = rate_changes.get(seg_next, rate)
+
+    schedule_df = pd.DataFrame(
+        np.concatenate(blocks),
+        index=pd.Index(np.concatenate(indices), name="회차"),
+        columns=SEGMENT_SCHEDULE_COLUMNS
+    )
+    prepayment_df = pd.DataFrame(
+        [row[1:] for row in prepayment_rows],
+        index=pd.Index([row[0] for row in prepayment_rows], name="회차", dtype=np.int64),
+        columns=PREPAYMENT_COLUMNS
+    )
+    return schedule_df, prepayment_df
@@ -0,0 +1,141 @@
+import numpy as np
+
+from utils.financial_utils import _payment_type_codes
+
+def _broadcast(*arrays):
+    """입력값을 같은 모양의 float 배열로 맞춥니다."""
+    return np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in arrays))
+
+def _level_payment_ratio(monthly_rate, periods):
+    """원리금균등상환의 원금 1원당 납입금액 r / (1 - (1+r)^-n)과 그 도함수를 계산합니다."""
+    discount = -np.expm1(-periods * np.log1p(monthly_rate))
+    ratio = monthly_rate / discount
+    derivative = (discount - monthly_rate * periods * np.exp(-(periods + 1) * np.log1p(monthly_rate))) / discount ** 2
+    return ratio, derivative
+
+def solve_loan_principal(payment, periods, annual_rate, payment_type):
+    """
+    납입금액으로 대출 가능 원금을 계산합니다.
+
+    납입금액은 원리금균등상환에서는 매 회차 납입금액, 원금균등상환에서는 첫 회차(최대) 납입금액,
+    만기일시상환에서는 매 회차 이자 납입금액입니다.
+
+    Args:
+        payment: 회차별 납입금액 (배열 가능)
+        periods: 총 납입 회차 (배열 가능)
+        annual_rate: 연이자율(%) (배열 가능)
+        payment_type: 상환방식 문자열 또는 배열
+
+    Returns:
+        ndarray: 대출 가능 원금. 만기일시상환에서 이자율이 0이면 NaN
+    """
+    payment, periods, annual_rate = _broadcast(payment, periods, annual_rate)
+    codes = _payment_type_codes(payment_type, payment.size).reshape(payment.shape)
+    r = annual_rate / 12 / 100
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        level = np.where(r == 0, payment * periods, payment * -np.expm1(-periods * np.log1p(r)) / r)
+        equal_principal = payment / (1 / periods + r)
+        interest_only = np.where(r == 0, np.nan, payment / r)
+
+    return np.select([codes == 0, codes == 1], [level, equal_principal], default=interest_only)
+
+def solve_loan_term(payment, principal, annual_rate, payment_type):
+    """
+    납입금액으로 필요한 상환 회차 수를 계산합니다. 결과는 회차 단위로 올림합니다.
+
+    Args:
+        payment: 회차별 납입금액 (solve_loan_principal과 같은 기준, 배열 가능)
+        principal: 대출 원금 (배열 가능)
+        annual_rate: 연이자율(%) (배열 가능)
+        payment_type: 상환방식 문자열 또는 배열
+
+    Returns:
+        ndarray: 필요한 회차 수. 납입금액이 이자도 감당하지 못하거나
+            만기일시상환처럼 납입금액이 기간과 무관하면 NaN
+    """
+    payment, principal, annual_rate = _broadcast(payment, principal, annual_rate)
+    codes = _payment_type_codes(payment_type, payment.size).reshape(payment.shape)
+    r = annual_rate / 12 / 100
+    interest = principal * r
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        level = np.where(
+            r == 0,
+            principal / payment,
+            -np.log1p(-interest / payment) / np.log1p(r)
+        )
+        equal_principal = principal / (payment - interest)
+        term = np.select([codes == 0, codes == 1], [level, equal_principal], default=np.nan)
+        term = np.where(payment > interest, term, np.nan)
+
+    # 부동소수점 오차로 정수 회차가 한 회차 늘어나지 않도록 여유를 둠
+    return np.ceil(term - 1e-9)
+
+def solve_loan_rate(payment, principal, periods, payment_type, tol=1e-10, max_iter=100):
+    """
+    납입금액으로 실제 적용된 연이자율을 역산합니다.
+
+    원금균등상환과 만기일시상환은 닫힌 식으로 계산합니다. 원리금균등상환은 해석적 도함수를 쓰는
+    뉴턴법으로 풀되, 뉴턴 단계가 구간을 벗어나거나 충분히 줄지 않으면 이분법으로 대신합니다.
+    구간은 매 반복마다 좁혀지므로 항상 수렴합니다.
+
+    Args:
+        payment: 회차별 납입금액 (solve_loan_principal과 같은 기준, 배열 가능)
+        principal: 대출 원금 (배열 가능)
+        periods: 총 납입 회차 (배열 가능)
+        payment_type: 상환방식 문자열 또는 배열
+        tol: 원금 1원당 납입금액 기준 허용 오차
+        max_iter: 최대 반복 횟수
+
+    Returns:
+        ndarray: 연이자율(%). 납입금액이 원금 상환에도 부족하면 NaN
+    """
+    payment, principal, periods = _broadcast(payment, principal, periods)
+    codes = _payment_type_codes(payment_type, payment.size).reshape(payment.shape)
+    target = payment / principal
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        equal_principal = target - 1 / periods
+        interest_only = target
+
+    # 원리금균등상환: 원금 1원당 납입금액 g(r) = target 을 만족하는 r (g는 r에 대해 증가함수)
+    level_mask = codes == 0
+    t, n = target[level_mask], periods[level_mask]
+    lo = np.zeros_like(t)
+    hi = np.ones_like(t)
+    # 소액 이자율 근사식 g(r) ≈ (1 + r(n+1)/2) / n 을 초기값으로 사용
+    r = np.clip(2 * (t * n - 1) / (n + 1), 1e-12, 1.0)
+    active = np.ones(t.shape, dtype=bool)
+    previous_step = hi - lo
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        value, derivative = _level_payment_ratio(r[active], n[active])
+        f = value - t[active]
+        converged = np.abs(f) < tol
+        r_a, lo_a, hi_a = r[active], lo[active], hi[active]
+        lo_a = np.where(f < 0, r_a, lo_a)
+        hi_a = np.where(f > 0, r_a, hi_a)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = r_a - f / derivative
+        # 뉴턴 단계가 구간 안에 있고 직전 단계의 절반 이하로 줄어들 때만 사용, 아니면 이분법
+        use_newton = (newton > lo_a) & (newton < hi_a) & (np.abs(newton - r_a) <= np.abs(previous_step[active]) / 2)
+        step = np.where(use_newton, newton, (lo_a + hi_a) / 2)
+        previous_step[active] = step - r_a
+        r[active] = np.where(converged, r_a, step)
+        lo[active], hi[active] = lo_a, hi_a
+        active[active] = ~converged
+
+    level = np.full(target.shape, np.nan)
+    level_rate = np.where(active, np.nan, r)
+    # 총 납입액이 원금과 같으면 무이자, 원금보다 적으면 해가 없음
+    level_rate[np.abs(t * n - 1) <= 1e-9] = 0
+    level_rate[t * n < 1 - 1e-9] = np.nan
+    level[level_mask] = level_rate
+
+    monthly_rate = np.select([codes == 0, codes == 1], [level, equal_principal], default=interest_only)
+    monthly_rate = np.where(np.abs(monthly_rate) <= 1e-12, 0, monthly_rate)
+    monthly_rate = np.where(monthly_rate < 0, np.nan, monthly_rate)
+    return monthly_rate * 12 * 100
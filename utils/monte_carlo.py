@@ -0,0 +1,97 @@
+import pandas as pd
+import numpy as np
+
+from utils.contributions import contribution_schedule
+
+SIMULATION_METHODS = ["로그정규", "부트스트랩"]
+DEFAULT_PERCENTILES = (5, 50, 95)
+
+def _block_months(n_paths, max_bytes):
+    """(개월 × 경로) 블록이 max_bytes 안에 들어가도록 한 번에 시뮬레이션할 개월 수를 정합니다."""
+    # 난수, 누적 성장률, 잔액, 정렬용 임시 배열 등 float64 배열 약 4개가 동시에 필요
+    return max(1, int(max_bytes // (n_paths * 8 * 4)))
+
+def simulate_investment(initial_investment, monthly_contribution, monthly_rate, total_months,
+                        contribution_period="월 납입", escalation_rate=0.0, annual_volatility=15.0, n_paths=10_000,
+                        method="로그정규", historical_returns=None, target=None,
+                        percentiles=DEFAULT_PERCENTILES, seed=None, max_bytes=64 * 1024 * 1024):
+    """
+    월 수익률이 무작위로 변하는 투자 경로를 n_paths개 시뮬레이션해 분위수 구간을 계산합니다.
+
+    잔액은 B_m = B_(m-1) × (1 + R_m) + c_m 으로 쌓이며, 블록 안에서는 누적 로그수익률로
+    B_m = G_m × (B_0 + Σ c_j / G_j) 를 한 번에 계산합니다. 경로 전체를 한꺼번에 만들지 않고
+    몇 개월씩 블록으로 나눠 경로별 잔액만 다음 블록에 넘기므로, 메모리 사용량은 max_bytes 이내로
+    유지되면서도 월별 분위수는 모든 경로에 대해 정확히 계산됩니다.
+
+    난수는 월 순서대로 (개월, 경로) 모양으로 뽑으므로 같은 seed면 블록 크기와 관계없이 결과가 같습니다.
+
+    Args:
+        initial_investment: 초기투자금액
+        monthly_contribution: 월 납입금액 (연 납입은 월 환산 금액)
+        monthly_rate: 기대 월수익률 (소수, 예: 0.005)
+        total_months: 투자 기간 (개월 수)
+        contribution_period: 투자 주기 ("월 납입" 또는 "연 납입")
+        escalation_rate: 연간 납입금 증가율 (소수)
+        annual_volatility: 연 변동성 (%, 로그정규 방식에서 사용)
+        n_paths: 시뮬레이션 경로 수
+        method: 수익률 생성 방식 ("로그정규" 또는 "부트스트랩")
+        historical_returns: 부트스트랩에 사용할 과거 월수익률 배열 (소수)
+        target: 목표금액 (지정하면 월별 목표 달성 확률을 함께 계산)
+        percentiles: 계산할 분위수 (%)
+        seed: 난수 시드
+        max_bytes: 블록 하나가 사용할 최대 메모리 (바이트)
+
+    Returns:
+        tuple: (월별 분위수 데이터프레임, 경로별 최종 잔액 배열)
+            분위수 데이터프레임은 월을 인덱스로 하고 투자원금, P5·P50·P95 등 분위수 열과
+            target이 주어지면 목표달성확률 열을 가집니다.
+    """
+    if method == "로그정규":
+        sigma = annual_volatility / 100 / np.sqrt(12)
+        # E[1 + R] = 1 + monthly_rate 가 되도록 로그수익률 평균을 보정
+        mu = np.log1p(monthly_rate) - sigma ** 2 / 2
+    elif method == "부트스트랩":
+        if historical_returns is None or len(historical_returns) == 0:
+            raise ValueError("부트스트랩 방식에는 과거 월수익률(historical_returns)이 필요합니다.")
+        log_returns = np.log1p(np.asarray(historical_returns, dtype=np.float64))
+    else:
+        raise ValueError(f"지원하지 않는 시뮬레이션 방식입니다: {method}")
+
+    rng = np.random.default_rng(seed)
+    contributions = contribution_schedule(monthly_contribution, total_months, contribution_period, escalation_rate)
+    invested = initial_investment + np.cumsum(contributions)
+    percentiles = list(percentiles)
+
+    bands = np.empty((total_months + 1, len(percentiles)))
+    bands[0] = initial_investment
+    probability = np.empty(total_months + 1)
+    if target is not None:
+        probability[0] = float(initial_investment >= target)
+
+    balance = np.full(n_paths, float(initial_investment))
+    step = _block_months(n_paths, max_bytes)
+    for start in range(1, total_months + 1, step):
+        stop = min(start + step, total_months + 1)
+        if method == "로그정규":
+            log_growth = rng.standard_normal((stop - start, n_paths))
+            log_growth *= sigma
+            log_growth += mu
+        else:
+            log_growth = log_returns[rng.integers(0, log_returns.size, size=(stop - start, n_paths))]
+
+        growth = np.exp(np.cumsum(log_growth, axis=0, out=log_growth), out=log_growth)
+        block = np.cumsum(contributions[start:stop, None] / growth, axis=0)
+        block += balance
+        block *= growth
+
+        bands[start:stop] = np.percentile(block, percentiles, axis=1).T
+        if target is not None:
+            probability[start:stop] = (block >= target).mean(axis=1)
+        balance = block[-1].copy()
+
+    bands_df = pd.DataFrame(bands, index=pd.RangeIndex(total_months + 1, name="월"),
+                            columns=[f"P{p:g}" for p in percentiles])
+    bands_df.insert(0, "투자원금", invested)
+    if target is not None:
+        bands_df["목표달성확률"] = probability
+    return bands_df, balance
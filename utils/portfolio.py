@@ -0,0 +1,134 @@
+import pandas as pd
+import numpy as np
+
+from utils.contributions import contribution_schedule
+from utils.monte_carlo import DEFAULT_PERCENTILES
+
+REBALANCE_PERIODS = {"월": 1, "분기": 3, "연": 12, "없음": 0}
+
+def _monthly_log_returns(expected_returns, volatilities, correlation, n_paths, rng):
+    """
+    자산별 기대수익률·변동성·상관계수로 한 달치 (경로 × 자산) 로그수익률을 뽑는 함수를 만듭니다.
+
+    E[1 + R] = 1 + 연 기대수익률 / 12 가 되도록 로그수익률 평균을 보정합니다.
+    """
+    sigma = np.asarray(volatilities, dtype=np.float64) / 100 / np.sqrt(12)
+    mu = np.log1p(np.asarray(expected_returns, dtype=np.float64) / 12 / 100) - sigma ** 2 / 2
+    if correlation is None:
+        correlation = np.eye(sigma.size)
+    # 상관행렬의 촐레스키 분해에 변동성을 곱해 공분산 구조를 만듦
+    scale = np.linalg.cholesky(np.asarray(correlation, dtype=np.float64)).T * sigma
+
+    def draw():
+        return mu + rng.standard_normal((n_paths, sigma.size)) @ scale
+    return draw
+
+def simulate_portfolio(initial_investment, monthly_contribution, weights, total_months,
+                       expected_returns=None, volatilities=None, correlation=None, historical_returns=None,
+                       contribution_period="월 납입", escalation_rate=0.0, rebalance="연", drift_band=None, n_paths=None,
+                       percentiles=DEFAULT_PERCENTILES, seed=None, asset_names=None):
+    """
+    목표 비중과 리밸런싱 규칙을 가진 K개 자산 포트폴리오를 시뮬레이션합니다.
+
+    보유금액은 (경로 × 자산) 배열로 유지하며 매월
+    1) 자산별 수익률 반영 2) 납입금을 목표 비중대로 배분 3) 리밸런싱 조건을 만족한 경로만 목표 비중으로 재배분
+    하는 단계를 모든 경로에 대해 배열 연산으로 처리합니다.
+
+    - n_paths가 None이면 기대수익률 그대로의 확정 경로 (historical_returns가 있으면 과거 수익률을 순서대로 재생)
+    - n_paths를 지정하면 몬테카를로 경로 (로그정규 수익률, historical_returns가 있으면 월 단위 부트스트랩)
+
+    Args:
+        initial_investment: 초기투자금액
+        monthly_contribution: 월 납입금액 (연 납입은 월 환산 금액)
+        weights: 자산별 목표 비중 (합계로 정규화)
+        total_months: 투자 기간 (개월 수)
+        expected_returns: 자산별 연 기대수익률 (%)
+        volatilities: 자산별 연 변동성 (%)
+        correlation: 자산 간 상관행렬 (생략하면 독립)
+        historical_returns: (개월 × 자산) 과거 월 수익률 배열 (소수)
+        contribution_period: 투자 주기 ("월 납입" 또는 "연 납입")
+        escalation_rate: 연간 납입금 증가율 (소수)
+        rebalance: 정기 리밸런싱 주기 ("월", "분기", "연", "없음")
+        drift_band: 지정하면 어느 자산이든 목표 비중과의 차이가 이 값(%p)을 넘을 때만 리밸런싱
+        n_paths: 몬테카를로 경로 수 (None이면 확정 경로 하나)
+        percentiles: 총자산 분위수 (%)
+        seed: 난수 시드
+        asset_names: 보유금액 데이터프레임의 자산 이름 (열 이름)
+
+    Returns:
+        dict:
+            holdings: (개월+1 × 자산) 경로 평균 보유금액 데이터프레임
+            bands: 월별 투자원금과 총자산 분위수 데이터프레임
+            final_values: 경로별 최종 총자산 배열
+            rebalance_count: 경로 평균 리밸런싱 횟수
+            turnover: 경로 평균 누적 매매회전율 (총자산 대비 매도금액 합계, %)
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    weights = weights / weights.sum()
+    n_assets = weights.size
+    paths = 1 if n_paths is None else n_paths
+    rng = np.random.default_rng(seed)
+
+    if historical_returns is not None:
+        history = np.log1p(np.asarray(historical_returns, dtype=np.float64).reshape(-1, n_assets))
+        if n_paths is None:
+            if len(history) < total_months:
+                raise ValueError(f"과거 수익률 기간({len(history)}개월)이 투자 기간({total_months}개월)보다 짧습니다.")
+            draw_month = iter(history[:total_months, None, :]).__next__
+        else:
+            def draw_month():
+                return history[rng.integers(0, len(history), size=paths)]
+    elif n_paths is None:
+        deterministic = np.log1p(np.asarray(expected_returns, dtype=np.float64) / 12 / 100)[None, :]
+
+        def draw_month():
+            return deterministic
+    else:
+        draw_month = _monthly_log_returns(expected_returns, volatilities, correlation, paths, rng)
+
+    contributions = contribution_schedule(monthly_contribution, total_months, contribution_period, escalation_rate)
+    period = REBALANCE_PERIODS[rebalance]
+    percentiles = list(percentiles)
+
+    holdings = np.empty((paths, n_assets))
+    holdings[:] = initial_investment * weights
+    mean_holdings = np.empty((total_months + 1, n_assets))
+    mean_holdings[0] = holdings.mean(axis=0)
+    bands = np.empty((total_months + 1, len(percentiles)))
+    bands[0] = initial_investment
+    rebalance_count = np.zeros(paths)
+    sold = np.zeros(paths)
+
+    for month in range(1, total_months + 1):
+        holdings *= np.exp(draw_month())
+        holdings += contributions[month] * weights
+        total = holdings.sum(axis=1)
+
+        if drift_band is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                drift = np.abs(holdings / total[:, None] - weights).max(axis=1) * 100
+            due = drift > drift_band
+        elif period and month % period == 0:
+            due = np.ones(paths, dtype=bool)
+        else:
+            due = None
+
+        if due is not None and due.any():
+            target = total[due, None] * weights
+            sold[due] += np.clip(holdings[due] - target, 0, None).sum(axis=1) / total[due]
+            holdings[due] = target
+            rebalance_count += due
+
+        mean_holdings[month] = holdings.mean(axis=0)
+        bands[month] = np.percentile(total, percentiles)
+
+    index = pd.RangeIndex(total_months + 1, name="월")
+    bands_df = pd.DataFrame(bands, index=index, columns=[f"P{p:g}" for p in percentiles])
+    bands_df.insert(0, "투자원금", initial_investment + np.cumsum(contributions))
+    return {
+        "holdings": pd.DataFrame(mean_holdings, index=index, columns=asset_names),
+        "bands": bands_df,
+        "final_values": holdings.sum(axis=1),
+        "rebalance_count": float(rebalance_count.mean()),
+        "turnover": float(sold.mean() * 100),
+    }
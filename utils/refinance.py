@@ -0,0 +1,88 @@
+import pandas as pd
+import numpy as np
+
+from utils.financial_utils import _payment_type_codes, _remaining_balances
+from utils.loan_segments import calculate_prepayment_fee
+
+def _payment_matrix(principal, periods, monthly_rate, codes, k):
+    """
+    연속된 회차 배열 k의 직전·현재 잔금으로 회차별 납입금액과 잔금을 계산합니다.
+
+    납입금액 = 직전 잔금 - 현재 잔금 + 직전 잔금 × 이자율 이므로 상환방식과 관계없이 같은 식을 씁니다.
+    만기가 지난 회차는 잔금과 납입금액이 모두 0입니다.
+    """
+    balances = _remaining_balances(principal, periods, monthly_rate, codes, np.concatenate([[k[0] - 1], k]))
+    previous, current = balances[..., :-1], balances[..., 1:]
+    return previous - current + previous * monthly_rate, current
+
+def analyze_refinancing(principal, periods, annual_rate, payment_type, elapsed_periods,
+                        offer_rates, offer_periods, offer_payment_types, offer_fees,
+                        prepayment_fee_rate=0.0, fee_periods=36):
+    """
+    기존 대출을 여러 대환 상품으로 갈아탈 때의 순절감액 추이와 손익분기 회차를 한 번에 계산합니다.
+
+    기존 대출의 elapsed_periods 회차 납입 후 잔금을 새 대출 원금으로 보고, (상품 수 × 경과 개월)
+    행렬에서 두 스케줄의 납입금액 차이를 누적합으로 구합니다.
+
+    순절감액(t) = 누적(기존 납입금액 - 신규 납입금액) + (기존 잔금 - 신규 잔금) - 갈아타기 비용
+
+    Args:
+        principal: 기존 대출 원금
+        periods: 기존 대출 총 납입 회차
+        annual_rate: 기존 대출 연이자율 (%)
+        payment_type: 기존 대출 상환방식
+        elapsed_periods: 기존 대출 경과 회차 (이 회차 납입 직후 갈아탐)
+        offer_rates: 대환 상품 연이자율(%) 배열
+        offer_periods: 대환 상품 대출기간(회차) 배열
+        offer_payment_types: 대환 상품 상환방식 배열 또는 문자열
+        offer_fees: 대환 상품별 부대비용(취급수수료, 인지세 등) 배열
+        prepayment_fee_rate: 기존 대출 중도상환수수료율 (%)
+        fee_periods: 기존 대출 중도상환수수료 부과기간 (회차)
+
+    Returns:
+        tuple: (상품별 요약 데이터프레임, 순절감액 추이 데이터프레임)
+            요약의 손익분기회차는 순절감액이 처음 0 이상이 되는 경과 개월이며, 없으면 NaN입니다.
+    """
+    old_code = _payment_type_codes(payment_type, 1)
+    old_rate = annual_rate / 12 / 100
+    balance = float(_remaining_balances(principal, periods, old_rate, old_code, elapsed_periods)[0])
+
+    offer_rates = np.asarray(offer_rates, dtype=np.float64)
+    offer_periods = np.asarray(offer_periods, dtype=np.int64)
+    offer_fees = np.asarray(offer_fees, dtype=np.float64)
+    offer_codes = _payment_type_codes(offer_payment_types, offer_rates.size)
+    switching_cost = offer_fees + calculate_prepayment_fee(balance, prepayment_fee_rate, elapsed_periods, fee_periods)
+
+    horizon = max(periods - elapsed_periods, int(offer_periods.max()))
+    t = np.arange(1, horizon + 1)
+
+    old_payments, old_balances = _payment_matrix(
+        principal, np.int64(periods), old_rate, old_code, t + elapsed_periods
+    )
+
+    new_payments, new_balances = _payment_matrix(
+        balance, offer_periods[:, None], offer_rates[:, None] / 12 / 100, offer_codes[:, None], t
+    )
+
+    savings = (
+        np.cumsum(old_payments[None, :] - new_payments, axis=1)
+        + (old_balances[None, :] - new_balances)
+        - switching_cost[:, None]
+    )
+    reached = savings >= 0
+    break_even = np.where(reached.any(axis=1), reached.argmax(axis=1) + 1, np.nan)
+
+    offers = pd.RangeIndex(1, offer_rates.size + 1, name="상품")
+    summary_df = pd.DataFrame(
+        {
+            "갈아타기 잔금": balance,
+            "신규 월납입금액": new_payments[:, 0],
+            "기존 월납입금액": old_payments[0],
+            "갈아타기 비용": switching_cost,
+            "손익분기회차": break_even,
+            "최종 순절감액": savings[:, -1],
+        },
+        index=offers
+    )
+    savings_df = pd.DataFrame(savings.T, index=pd.Index(t, name="경과개월"), columns=offers)
+    return summary_df, savings_df
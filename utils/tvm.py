@@ -0,0 +1,283 @@
+import pandas as pd
+import numpy as np
+
+# 화폐의 시간가치(TVM) 계산 커널
+#
+# 모든 함수는 한 기간 이자율 r, 기간 수 n에 대해 같은 잔액 등식
+#     pv × (1+r)^n + pmt × A(r, n) = fv
+# 를 풉니다. A(r, n)은 기말 납입 연금 계수 ((1+r)^n - 1) / r 이고(due=True면 기초 납입으로 × (1+r)),
+# escalation_rate를 주면 12기간마다 납입금이 계단식으로 늘어나는 성장형 연금 계수입니다.
+# 납입(저축)은 양수, 인출(생활비·대출 상환)은 음수 pmt로 표현합니다.
+# 모든 인자는 NumPy 브로드캐스팅 규칙을 따르며, 스칼라만 주면 float을 반환합니다.
+
+def _result(value):
+    """0차원 배열은 float으로 바꿔 스칼라 입력에 스칼라를 돌려줍니다."""
+    value = np.asarray(value)
+    return value.item() if value.ndim == 0 else value
+
+def compound_monthly_rate(annual_return, compounding_periods=12):
+    """
+    연수익률(%)과 복리 계산 주기(연 횟수)로 같은 효과를 내는 월수익률(소수)을 계산합니다.
+
+    주기 수익률 p = 연수익률 / 주기 수에 대해 (1 + p)^(주기 수 / 12) - 1 이며, 월 복리면 연수익률 / 12 입니다.
+    배열을 주면 원소별로 계산합니다.
+    """
+    periodic_rate = np.asarray(annual_return, dtype=np.float64) / 100 / compounding_periods
+    return _result(np.expm1(np.log1p(periodic_rate) * (compounding_periods / 12)))
+
+def growth_factor(rate, nper):
+    """(1 + r)^n 을 log1p로 계산합니다."""
+    rate = np.asarray(rate, dtype=np.float64)
+    return _result(np.exp(np.multiply(nper, np.log1p(rate))))
+
+def annuity_factor(rate, nper, escalation_rate=0.0, due=False):
+    """
+    기간마다 1원씩 납입할 때 n기간 뒤의 미래가치 계수를 계산합니다.
+
+    escalation_rate를 주면 납입금이 12기간마다 그 비율만큼 계단식으로 늘어나며(첫해 1원),
+    n = 12Y + m 일 때 해마다 12회 납입의 연말 가치 s_12에 성장형 연금 합계를 곱하고
+    마지막 m기간 납입분을 더합니다.
+
+        FV = (1+r)^m × s_12 × A^(Y-1) × Σ (B/A)^y + B^Y × s_m
+        (A = (1+r)^12, B = 1+g, s_k = ((1+r)^k - 1) / r)
+
+    등비합은 expm1/log1p로 계산해 r이 0에 가깝거나 A ≈ B일 때도 정확하며, 증가율이 0이면
+    일반 연금 계수 ((1+r)^n - 1) / r 과 같습니다.
+
+    Args:
+        rate: 기간 이자율 (소수)
+        nper: 기간 수
+        escalation_rate: 12기간마다 적용하는 납입금 증가율 (소수)
+        due: True면 기초 납입 (각 납입이 한 기간 더 불어남)
+
+    Returns:
+        ndarray 또는 float: 첫해 기간 납입금 1원당 미래가치
+    """
+    rate = np.asarray(rate, dtype=np.float64)
+    nper = np.asarray(nper)
+    years, months = np.divmod(nper, 12)
+    log_rate = np.log1p(rate)
+    log_escalation = np.log1p(escalation_rate)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        def level_factor(k):
+            # s_k = ((1+r)^k - 1) / r, r = 0이면 k
+            return np.where(rate == 0, k, np.expm1(k * log_rate) / rate)
+
+        ratio_log = log_escalation - 12 * log_rate
+        # Σ_(y<Y) (B/A)^y
+        geometric = np.where(np.abs(ratio_log) < 1e-12, years, np.expm1(years * ratio_log) / np.expm1(ratio_log))
+        full_years = np.exp((months + 12 * (years - 1)) * log_rate) * level_factor(12) * geometric
+        partial_year = np.exp(years * log_escalation) * level_factor(months)
+
+    factor = full_years + partial_year
+    if due:
+        factor = factor * (1 + rate)
+    return _result(factor)
+
+def _level_annuity_derivative(rate, nper, due=False):
+    """일반 연금 계수와 r에 대한 도함수를 계산합니다 (rate의 뉴턴 반복용)."""
+    log_growth = nper * np.log1p(rate)
+    growth = np.exp(log_growth)
+    # 계수는 expm1으로 r = 0이 아닌 한 정확히 계산하고, 도함수만 r ≈ 0에서 급수 전개를 사용
+    small = np.abs(rate) < 1e-8
+    safe_rate = np.where(rate == 0, 1.0, rate)
+    factor = np.where(rate == 0, nper, np.expm1(log_growth) / safe_rate)
+    derivative = np.where(
+        small,
+        nper * (nper - 1) / 2 + nper * (nper - 1) * (nper - 2) / 3 * rate,
+        (nper * growth / (1 + safe_rate) - factor) / np.where(small, 1.0, rate)
+    )
+    if due:
+        derivative = factor + (1 + rate) * derivative
+        factor = factor * (1 + rate)
+    return factor, derivative
+
+def fv(rate, nper, pmt=0.0, pv=0.0, escalation_rate=0.0, due=False):
+    """
+    현재 금액 pv와 기간 납입금 pmt의 n기간 뒤 미래가치를 계산합니다.
+
+    Args:
+        rate: 기간 이자율 (소수)
+        nper: 기간 수
+        pmt: 기간 납입금 (인출은 음수)
+        pv: 현재 금액
+        escalation_rate: 12기간마다 적용하는 납입금 증가율 (소수)
+        due: True면 기초 납입
+
+    Returns:
+        ndarray 또는 float: 미래가치
+    """
+    contribution_value = np.multiply(pmt, annuity_factor(rate, nper, escalation_rate, due))
+    return _result(np.multiply(pv, growth_factor(rate, nper)) + contribution_value)
+
+def pv(rate, nper, pmt=0.0, fv=0.0, escalation_rate=0.0, due=False):
+    """
+    n기간 뒤 fv가 되려면 지금 필요한 금액을 계산합니다.
+
+    pmt를 음수(인출)로 주고 fv = 0 이면 n기간 동안 인출할 금액의 현재가치(필요 자금)가 됩니다.
+
+    Args:
+        rate: 기간 이자율 (소수)
+        nper: 기간 수
+        pmt: 기간 납입금 (인출은 음수)
+        fv: 목표 미래가치
+        escalation_rate: 12기간마다 적용하는 납입금 증가율 (소수)
+        due: True면 기초 납입
+
+    Returns:
+        ndarray 또는 float: 필요한 현재 금액 (납입만으로 목표를 넘으면 음수)
+    """
+    contribution_value = np.multiply(pmt, annuity_factor(rate, nper, escalation_rate, due))
+    return _result(np.subtract(fv, contribution_value) / growth_factor(rate, nper))
+
+def pmt(rate, nper, pv=0.0, fv=0.0, escalation_rate=0.0, due=False):
+    """
+    현재 금액 pv에서 n기간 뒤 fv에 도달하기 위한 (첫해) 기간 납입금을 계산합니다.
+
+    대출처럼 pv만큼 빌려 n기간에 갚는 경우(fv = 0)에는 음수 납입금(상환액)이 나옵니다.
+
+    Args:
+        rate: 기간 이자율 (소수)
+        nper: 기간 수 (1 이상)
+        pv: 현재 금액
+        fv: 목표 미래가치
+        escalation_rate: 12기간마다 적용하는 납입금 증가율 (소수)
+        due: True면 기초 납입
+
+    Returns:
+        ndarray 또는 float: 기간 납입금
+    """
+    gap = np.subtract(fv, np.multiply(pv, growth_factor(rate, nper)))
+    return _result(gap / annuity_factor(rate, nper, escalation_rate, due))
+
+def nper(rate, pmt, pv=0.0, fv=0.0, due=False):
+    """
+    현재 금액 pv와 일정한 기간 납입금 pmt로 fv에 도달하는 데 걸리는 기간 수를 계산합니다.
+
+    (1+r)^n = (fv × r + pmt') / (pv × r + pmt') (pmt' = 기초 납입이면 pmt × (1+r)) 을 n에 대해 풀며,
+    r이 0에 가까워도 정확하도록 log1p((fv - pv) × r / (pv × r + pmt')) / log1p(r) 로 계산합니다.
+    도달할 수 없으면 NaN입니다. 기간 수는 소수로 나오므로 필요하면 올림해서 사용합니다.
+
+    Args:
+        rate: 기간 이자율 (소수)
+        pmt: 기간 납입금 (인출은 음수)
+        pv: 현재 금액
+        fv: 목표 미래가치
+        due: True면 기초 납입
+
+    Returns:
+        ndarray 또는 float: 기간 수
+    """
+    rate = np.asarray(rate, dtype=np.float64)
+    payment = np.multiply(pmt, 1 + rate) if due else np.asarray(pmt, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.subtract(fv, pv) * rate / (np.multiply(pv, rate) + payment)
+        periods = np.where(
+            rate == 0,
+            np.subtract(fv, pv) / payment,
+            np.log1p(np.where(ratio > -1, ratio, np.nan)) / np.log1p(rate)
+        )
+    return _result(np.where(periods >= 0, periods, np.nan))
+
+def rate(nper, pmt=0.0, pv=0.0, fv=0.0, escalation_rate=0.0, due=False, lower=-0.5, upper=1.0, tol=1e-9,
+         max_iter=100, return_diagnostics=False):
+    """
+    기간 수, 납입금, 현재 금액, 목표 금액으로부터 기간 이자율을 역산합니다.
+
+    f(r) = pv × (1+r)^n + pmt × A(r, n) - fv 를 [lower, upper] 구간에서 뉴턴법으로 풀고,
+    뉴턴 단계가 부호가 바뀌는 구간을 벗어나거나 직전 단계의 절반보다 크면(지수적으로 커지는 쪽에서
+    천천히 기어오는 경우) 이분법으로 대신합니다. 구간 양 끝에서
+    f의 부호가 같으면 해가 없는 것으로 보고 NaN을 반환합니다. 모든 인자는 배열로 줄 수 있으며
+    원소별로 동시에 풉니다. escalation_rate를 주면 성장형 연금 계수를 쓰고, 그 도함수는 중앙 차분으로
+    근사합니다 (뉴턴 단계가 조금 부정확해도 구간 축소로 수렴은 보장됨).
+
+    Args:
+        nper: 기간 수
+        pmt: 기간 납입금 (인출은 음수)
+        pv: 현재 금액
+        fv: 목표 미래가치
+        escalation_rate: 12기간마다 적용하는 납입금 증가율 (소수)
+        due: True면 기초 납입
+        lower: 탐색 구간 하한 (기간 이자율)
+        upper: 탐색 구간 상한 (기간 이자율)
+        tol: 잔차 허용 오차 (|fv|, fv가 0이면 |pv| + |pmt| × n 대비)
+        max_iter: 최대 반복 횟수
+        return_diagnostics: True면 수렴 진단 데이터프레임을 함께 반환
+
+    Returns:
+        ndarray 또는 float: 기간 이자율 (소수). 해가 없으면 NaN
+        return_diagnostics=True면 (이자율, 반복횟수·상대잔차·수렴여부 데이터프레임)
+    """
+    n, c, p, t = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (nper, pmt, pv, fv)))
+    shape = n.shape
+    n, c, p, t = (a.ravel() for a in (n, c, p, t))
+    scale = np.where(t != 0, np.abs(t), np.abs(p) + np.abs(c) * n)
+    scale = np.where(scale > 0, scale, 1.0)
+
+    def residual_and_derivative(r, index):
+        n_i = n[index]
+        if escalation_rate:
+            h = 1e-6 * (1 + np.abs(r))
+            factor = annuity_factor(r, n_i, escalation_rate, due)
+            factor_derivative = (
+                annuity_factor(r + h, n_i, escalation_rate, due) - annuity_factor(r - h, n_i, escalation_rate, due)
+            ) / (2 * h)
+        else:
+            factor, factor_derivative = _level_annuity_derivative(r, n_i, due)
+        growth = np.exp(n_i * np.log1p(r))
+        f = (p[index] * growth + c[index] * factor - t[index]) / scale[index]
+        derivative = (p[index] * n_i * growth / (1 + r) + c[index] * factor_derivative) / scale[index]
+        return f, derivative
+
+    everything = np.arange(n.size)
+    lo = np.full(n.size, float(lower))
+    hi = np.full(n.size, float(upper))
+    f_lo, _ = residual_and_derivative(lo, everything)
+    f_hi, _ = residual_and_derivative(hi, everything)
+    lo_sign = np.sign(f_lo)
+
+    # 납입 총액 대비 목표 배율로 만든 초기값
+    invested = p + c * annuity_factor(0.0, n, escalation_rate)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.clip(np.log(t / invested) / np.maximum(n / 2, 1), -0.1, 0.1)
+    r = np.where(np.isfinite(r), r, 0.0)
+    iterations = np.zeros(n.size, dtype=np.int64)
+    residual = np.full(n.size, np.nan)
+    converged = (f_lo == 0) | (f_hi == 0)
+    r = np.where(f_lo == 0, lo, np.where(f_hi == 0, hi, r))
+    active = (lo_sign * np.sign(f_hi) < 0) & ~converged
+    previous_step = hi - lo
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        index = np.flatnonzero(active)
+        r_a = r[index]
+        f, derivative = residual_and_derivative(r_a, index)
+        residual[index] = f
+        iterations[index] += 1
+        done = np.abs(f) < tol
+
+        same_as_lo = np.sign(f) == lo_sign[index]
+        lo_a = np.where(same_as_lo, r_a, lo[index])
+        hi_a = np.where(same_as_lo, hi[index], r_a)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = r_a - f / derivative
+        use_newton = (newton > lo_a) & (newton < hi_a) & (np.abs(newton - r_a) <= np.abs(previous_step[index]) / 2)
+        step = np.where(use_newton, newton, (lo_a + hi_a) / 2)
+        previous_step[index] = step - r_a
+        r[index] = np.where(done, r_a, step)
+        lo[index], hi[index] = lo_a, hi_a
+        converged[index] = done
+        active[index] = ~done
+
+    rates = np.where(converged, r, np.nan).reshape(shape)
+    if not return_diagnostics:
+        return _result(rates)
+    diagnostics = pd.DataFrame({
+        "반복횟수": iterations,
+        "상대잔차": residual,
+        "수렴": converged,
+    })
+    return _result(rates), diagnostics
@@ -1,30 +1,120 @@
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import pandas as pd
+import numpy as np
 
-def create_loan_payment_chart(df):
-    """대출 상환 스케줄에 대한 차트를 생성합니다"""
+def lttb_downsample(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets 방식으로 선 그래프 점 개수를 줄입니다.
+
+    첫 점과 마지막 점은 유지하고, 나머지 구간마다 앞 점·다음 구간 평균과 이루는 삼각형 넓이가
+    가장 큰 점을 골라 그래프 모양을 최대한 보존합니다.
+
+    Args:
+        x: x 값 배열
+        y: y 값 배열
+        n_out: 남길 점 개수 (3 이상)
+
+    Returns:
+        tuple: (x 배열, y 배열)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.size
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # 첫 점과 마지막 점을 제외한 구간 경계
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # 다음 구간 평균은 누적합으로 한 번에 계산
+    cum_x = np.concatenate([[0], np.cumsum(x)])
+    cum_y = np.concatenate([[0], np.cumsum(y)])
+    next_start = np.append(edges[1:-1], n - 1)
+    next_end = np.append(edges[2:], n)
+    avg_x = (cum_x[next_end] - cum_x[next_start]) / (next_end - next_start)
+    avg_y = (cum_y[next_end] - cum_y[next_start]) / (next_end - next_start)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i]) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y[i] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return x[selected], y[selected]
+
+def _bar_bucket_size(rows, max_bars):
+    """막대 개수가 max_bars 이하가 되도록 분기(3회차)·연(12회차) 또는 그 배수 단위를 고릅니다."""
+    if rows <= max_bars:
+        return 1
+    if -(-rows // 3) <= max_bars:
+        return 3
+    years = -(-rows // 12)
+    return 12 * -(-years // max_bars)
+
+def create_loan_payment_chart(df, max_bars=120, max_points=1000, webgl_threshold=5000, full_resolution=False):
+    """
+    대출 상환 스케줄에 대한 차트를 생성합니다.
+
+    df에는 회차 인덱스의 스케줄 데이터프레임이나 amortization_columns가 돌려주는 (회차 수, 4) 배열
+    (1회차부터, SCHEDULE_COLUMNS 순서)을 줄 수 있습니다. 회차가 많으면 원금·이자 막대를 분기 또는
+    연 단위로 합산하고, 잔금 선은 LTTB로 점 개수를 줄입니다.
+    그래도 점이 webgl_threshold보다 많으면 WebGL(Scattergl)로 그립니다.
+    전체 해상도가 필요하면 full_resolution=True로 호출하거나 원본 스케줄을 내려받아 사용합니다.
+    """
     fig = go.Figure()
     
+    if isinstance(df, pd.DataFrame):
+        period = df.index.to_numpy()
+        principal_paid, interest, remaining = (df[col].to_numpy() for col in ['원금상환', '이자금액', '잔금'])
+    else:
+        values = np.asarray(df)
+        period = np.arange(1, len(values) + 1)
+        principal_paid, interest, remaining = values[:, 1], values[:, 2], values[:, 3]
+    
+    bucket = 1 if full_resolution else _bar_bucket_size(len(period), max_bars)
+    if bucket > 1:
+        # 구간 시작 위치마다 합산하고, 막대는 구간 마지막 회차에 표시
+        starts = np.arange(0, len(period), bucket)
+        bar_x = period[np.minimum(starts + bucket, len(period)) - 1]
+        bar_principal = np.add.reduceat(principal_paid, starts)
+        bar_interest = np.add.reduceat(interest, starts)
+        unit = "분기" if bucket == 3 else f"{bucket // 12}년"
+        suffix = f" ({unit} 합계)"
+    else:
+        bar_x, bar_principal, bar_interest = period, principal_paid, interest
+        suffix = ""
+    
     # 원금 상환 부분
     fig.add_trace(go.Bar(
-        x=df.index, 
-        y=df['원금상환'],
-        name='원금상환',
+        x=bar_x,
+        y=bar_principal,
+        name='원금상환' + suffix,
         marker_color='#2E86C1'
     ))
     
     # 이자 부분
     fig.add_trace(go.Bar(
-        x=df.index, 
-        y=df['이자금액'],
-        name='이자금액',
+        x=bar_x,
+        y=bar_interest,
+        name='이자금액' + suffix,
         marker_color='#F39C12'
     ))
     
     # 잔금 라인
-    fig.add_trace(go.Scatter(
-        x=df.index, 
-        y=df['잔금'],
+    if full_resolution:
+        line_x, line_y = period, remaining
+    else:
+        line_x, line_y = lttb_downsample(period, remaining, max_points)
+    scatter = go.Scattergl if len(line_x) > webgl_threshold else go.Scatter
+    fig.add_trace(scatter(
+        x=line_x,
+        y=line_y,
         name='잔금',
         mode='lines',
         line=dict(color='#E74C3C', width=3)
@@ -45,3 +135,302 @@ def create_loan_payment_chart(df):
     )
     
     return fig
+
+def create_loan_sensitivity_heatmap(df, title, colorbar_title):
+    """연이자율 × 대출기간 민감도 히트맵을 생성합니다"""
+    fig = go.Figure(go.Heatmap(
+        z=df.values,
+        x=df.columns / 12,
+        y=df.index,
+        colorscale='YlOrRd',
+        colorbar=dict(title=colorbar_title),
+        hovertemplate='대출기간 %{x:.0f}년<br>연이자율 %{y:.2f}%<br>금액 ₩%{z:,.0f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title='대출기간 (년)',
+        yaxis_title='연이자율 (%)'
+    )
+    
+    return fig
+
+def create_repayment_comparison_chart(schedule_df, crossover_period=None):
+    """상환방식별 월 납입금액과 누적이자를 겹쳐 비교하는 차트를 생성합니다"""
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.08,
+        subplot_titles=('월 납입금액', '누적 이자')
+    )
+    colors = {'원리금균등상환': '#2E86C1', '원금균등상환': '#27AE60', '만기일시상환': '#F39C12'}
+    
+    for payment_type, color in colors.items():
+        fig.add_trace(go.Scatter(
+            x=schedule_df.index,
+            y=schedule_df[(payment_type, '납입금액')],
+            name=payment_type,
+            mode='lines',
+            line=dict(color=color, width=2),
+            legendgroup=payment_type
+        ), row=1, col=1)
+        fig.add_trace(go.Scatter(
+            x=schedule_df.index,
+            y=schedule_df[(payment_type, '누적이자')],
+            name=payment_type,
+            mode='lines',
+            line=dict(color=color, width=2),
+            legendgroup=payment_type,
+            showlegend=False
+        ), row=2, col=1)
+    
+    # 만기일시상환 마지막 회차의 원금 상환 때문에 나머지 선이 눌리지 않도록 범위 조정
+    regular_payments = schedule_df.xs('납입금액', axis=1, level='항목').iloc[:-1]
+    if not regular_payments.empty:
+        fig.update_yaxes(range=[0, regular_payments.to_numpy().max() * 1.1], row=1, col=1)
+    
+    if crossover_period is not None:
+        fig.add_vline(
+            x=crossover_period,
+            line=dict(color='gray', dash='dash'),
+            annotation_text=f'{crossover_period}회차 납입금액 역전'
+        )
+    
+    fig.update_layout(
+        title='상환방식 비교',
+        xaxis2_title='납입회차',
+        yaxis_title='금액 (원)',
+        yaxis2_title='금액 (원)',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.05,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    return fig
+
+def create_refinance_savings_chart(savings_df, break_even):
+    """대환 상품별 누적 순절감액 추이와 손익분기 회차를 표시하는 차트를 생성합니다"""
+    fig = go.Figure()
+    
+    for offer in savings_df.columns:
+        fig.add_trace(go.Scatter(
+            x=savings_df.index,
+            y=savings_df[offer],
+            name=f'상품 {offer}',
+            mode='lines',
+            line=dict(width=2)
+        ))
+    
+    # 손익분기 지점 표시
+    reached = break_even.dropna()
+    if not reached.empty:
+        months = reached.to_numpy(dtype=np.int64)
+        fig.add_trace(go.Scatter(
+            x=months,
+            y=[savings_df.at[month, offer] for offer, month in zip(reached.index, months)],
+            name='손익분기',
+            mode='markers',
+            marker=dict(color='black', size=8, symbol='diamond')
+        ))
+    
+    fig.add_hline(y=0, line=dict(color='gray', dash='dash'))
+    fig.update_layout(
+        title='대환대출 누적 순절감액',
+        xaxis_title='갈아탄 후 경과 개월',
+        yaxis_title='순절감액 (원)',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    return fig
+
+def create_fan_chart(bands_df, lower='P5', median='P50', upper='P95', target=None):
+    """몬테카를로 시뮬레이션의 분위수 구간을 팬 차트로 그립니다"""
+    fig = go.Figure()
+    years = bands_df.index / 12
+    
+    # 하위 ~ 상위 분위수 구간
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=bands_df[upper],
+        name=upper,
+        mode='lines',
+        line=dict(color='rgba(46, 134, 193, 0.4)', width=1)
+    ))
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=bands_df[lower],
+        name=f'{lower} ~ {upper}',
+        mode='lines',
+        fill='tonexty',
+        fillcolor='rgba(46, 134, 193, 0.2)',
+        line=dict(color='rgba(46, 134, 193, 0.4)', width=1)
+    ))
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=bands_df[median],
+        name=f'중앙값 ({median})',
+        mode='lines',
+        line=dict(color='#2E86C1', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=bands_df['투자원금'],
+        name='투자원금',
+        mode='lines',
+        line=dict(color='#7F8C8D', dash='dot', width=2)
+    ))
+    
+    if target is not None:
+        fig.add_hline(y=target, line=dict(color='#E74C3C', dash='dash'), annotation_text='목표금액')
+    
+    fig.update_layout(
+        title='투자 자산 시뮬레이션',
+        xaxis_title='투자 기간 (년)',
+        yaxis_title='금액 (원)',
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    return fig
+
+def create_backtest_chart(results, worst_path, best_path):
+    """과거 구간별 최종 자산 분포와 최악·최고 구간의 자산 경로를 그립니다"""
+    fig = make_subplots(
+        rows=1, cols=2,
+        column_widths=[0.45, 0.55],
+        subplot_titles=('구간별 최종 자산 분포', '최악 · 최고 구간 자산 추이')
+    )
+    
+    fig.add_trace(go.Histogram(
+        x=results['최종자산'],
+        name='최종 자산',
+        marker_color='#2E86C1',
+        nbinsx=40
+    ), row=1, col=1)
+    fig.add_vline(x=results['투자원금'].iloc[0], line=dict(color='gray', dash='dash'), row=1, col=1)
+    
+    for label, path, color in [('최악 구간', worst_path, '#E74C3C'), ('최고 구간', best_path, '#27AE60')]:
+        fig.add_trace(go.Scatter(
+            x=path['월'] / 12,
+            y=path['총자산'],
+            name=label,
+            mode='lines',
+            line=dict(color=color, width=2)
+        ), row=1, col=2)
+    fig.add_trace(go.Scatter(
+        x=worst_path['월'] / 12,
+        y=worst_path['투자원금'],
+        name='투자원금',
+        mode='lines',
+        line=dict(color='#7F8C8D', dash='dot', width=2)
+    ), row=1, col=2)
+    
+    fig.update_layout(
+        title='과거 수익률 백테스트',
+        xaxis_title='최종 자산 (원)',
+        yaxis_title='구간 수',
+        xaxis2_title='투자 기간 (년)',
+        yaxis2_title='금액 (원)',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.05,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    return fig
+
+def create_portfolio_chart(holdings_df):
+    """자산별 보유금액 추이를 누적 영역 차트로 그립니다"""
+    fig = go.Figure()
+    
+    for asset in holdings_df.columns:
+        fig.add_trace(go.Scatter(
+            x=holdings_df.index / 12,
+            y=holdings_df[asset],
+            name=str(asset),
+            mode='lines',
+            stackgroup='holdings',
+            line=dict(width=1)
+        ))
+    
+    fig.update_layout(
+        title='자산별 보유금액 추이',
+        xaxis_title='투자 기간 (년)',
+        yaxis_title='금액 (원)',
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    return fig
+
+def create_after_tax_chart(paths_df):
+    """계좌 유형별 세후 평가액 추이를 비교하는 선 차트를 그립니다"""
+    fig = go.Figure()
+    
+    for wrapper in paths_df.columns:
+        fig.add_trace(go.Scatter(
+            x=paths_df.index / 12,
+            y=paths_df[wrapper],
+            name=str(wrapper),
+            mode='lines'
+        ))
+    
+    fig.update_layout(
+        title='계좌 유형별 세후 평가액',
+        xaxis_title='투자 기간 (년)',
+        yaxis_title='금액 (원)',
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    return fig
+
+def create_investment_grid_heatmap(df, title, colorbar_title):
+    """연수익률 × 투자기간 시나리오 히트맵을 생성합니다"""
+    fig = go.Figure(go.Heatmap(
+        z=df.values,
+        x=df.columns / 12,
+        y=df.index,
+        colorscale='YlGnBu',
+        colorbar=dict(title=colorbar_title),
+        hovertemplate='투자기간 %{x:.2f}년<br>연수익률 %{y:.2f}%<br>금액 ₩%{z:,.0f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title='투자기간 (년)',
+        yaxis_title='연수익률 (%)'
+    )
+    
+    return fig
@@ -0,0 +1,147 @@
+import pandas as pd
+import numpy as np
+
+DAYS_PER_YEAR = 365.0
+# 탐색 구간: 연수익률 -99% ~ +1000% (로그 수익률 x = log(1 + r) 기준)
+_LOWER_LOG_RATE = np.log1p(-0.99)
+_UPPER_LOG_RATE = np.log1p(10.0)
+
+def _npv_and_derivative(log_rate, years, amounts, groups, n_groups):
+    """
+    그룹별 NPV = Σ a_i × exp(-x × t_i) 와 x에 대한 도함수를 계산합니다.
+
+    log_rate는 그룹별 x = log(1 + 연수익률) 배열이며, 현금흐름별 항을 계산한 뒤
+    그룹 번호로 합산(bincount)해 모든 그룹을 한 번에 처리합니다.
+    """
+    terms = amounts * np.exp(-log_rate[groups] * years)
+    npv = np.bincount(groups, weights=terms, minlength=n_groups)
+    derivative = np.bincount(groups, weights=-years * terms, minlength=n_groups)
+    return npv, derivative
+
+def _solve_grouped(years, amounts, groups, n_groups, guess=0.1, tol=1e-10, max_iter=100):
+    """
+    그룹 번호가 붙은 현금흐름에서 그룹별 XIRR을 동시에 풉니다.
+
+    x = log(1 + r)에 대해 뉴턴법을 쓰고, 뉴턴 단계가 부호가 바뀌는 구간을 벗어나면
+    이분법으로 대신하므로 구간 안에 해가 있으면 반드시 수렴합니다. 해가 -99%에 가까우면 할인 계수가
+    매우 커져 NPV 잔차가 허용 오차 아래로 내려가지 않을 수 있으므로, 구간 폭이 충분히 줄어든 경우도 수렴으로 봅니다.
+
+    Returns:
+        tuple: (연수익률 배열(소수), 반복횟수 배열, 상대잔차 배열)
+    """
+    # 잔차는 그룹별 현금흐름 절댓값 합계로 나눠 금액 단위와 무관하게 비교
+    scale = np.bincount(groups, weights=np.abs(amounts), minlength=n_groups)
+    has_inflow = np.bincount(groups, weights=amounts > 0, minlength=n_groups) > 0
+    has_outflow = np.bincount(groups, weights=amounts < 0, minlength=n_groups) > 0
+
+    lo = np.full(n_groups, _LOWER_LOG_RATE)
+    hi = np.full(n_groups, _UPPER_LOG_RATE)
+    f_lo, _ = _npv_and_derivative(lo, years, amounts, groups, n_groups)
+    f_hi, _ = _npv_and_derivative(hi, years, amounts, groups, n_groups)
+    # 구간 양 끝에서 NPV 부호가 같으면 구간 안에 해가 없음
+    lo_sign = np.sign(f_lo)
+    bracketed = has_inflow & has_outflow & (lo_sign * np.sign(f_hi) <= 0)
+
+    x = np.full(n_groups, np.log1p(guess))
+    iterations = np.zeros(n_groups, dtype=np.int64)
+    residual = np.full(n_groups, np.nan)
+    converged = np.zeros(n_groups, dtype=bool)
+    active = bracketed.copy()
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        # 활성 그룹의 현금흐름만 골라 계산
+        flow_mask = active[groups]
+        index = np.flatnonzero(active)
+        local = np.full(n_groups, -1)
+        local[index] = np.arange(index.size)
+        npv, derivative = _npv_and_derivative(
+            x[index], years[flow_mask], amounts[flow_mask], local[groups[flow_mask]], index.size
+        )
+        f = npv / scale[index]
+        residual[index] = f
+        iterations[index] += 1
+
+        # f가 lo 쪽과 같은 부호면 해는 x보다 위에 있음
+        x_a = x[index]
+        same_as_lo = np.sign(f) == lo_sign[index]
+        lo_a = np.where(same_as_lo, x_a, lo[index])
+        hi_a = np.where(same_as_lo, hi[index], x_a)
+        done = (np.abs(f) < tol) | (hi_a - lo_a < 1e-14)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = x_a - npv / derivative
+        step = np.where((newton > lo_a) & (newton < hi_a), newton, (lo_a + hi_a) / 2)
+        x[index] = np.where(done, x_a, step)
+        lo[index], hi[index] = lo_a, hi_a
+        converged[index] = done
+        active[index] = ~done
+
+    rates = np.where(converged, np.expm1(x), np.nan)
+    return rates, iterations, residual
+
+def xirr(dates, amounts, guess=0.1, tol=1e-10, max_iter=100):
+    """
+    날짜가 불규칙한 현금흐름의 연환산 내부수익률(XIRR)을 계산합니다.
+
+    Σ 금액_i / (1 + r)^((날짜_i - 첫 날짜) / 365) = 0 을 만족하는 r을 찾습니다 (엑셀 XIRR과 같은 정의).
+    투자자 기준으로 입금(투자)은 음수, 출금과 마지막 평가액은 양수로 입력합니다.
+
+    Args:
+        dates: 현금흐름 날짜 배열
+        amounts: 현금흐름 금액 배열
+        guess: 초기 추정 연수익률 (소수)
+        tol: 현금흐름 절댓값 합계 대비 NPV 허용 오차
+        max_iter: 최대 반복 횟수
+
+    Returns:
+        float: 연환산 수익률 (%). 해가 없으면 NaN
+    """
+    table = pd.DataFrame({"계좌": 0, "날짜": dates, "금액": amounts})
+    result = xirr_batch(table, guess=guess, tol=tol, max_iter=max_iter)
+    return float(result["연환산 수익률 (%)"].iloc[0])
+
+def xirr_batch(cash_flows, account_column="계좌", date_column="날짜", amount_column="금액",
+               guess=0.1, tol=1e-10, max_iter=100):
+    """
+    긴 형식(계좌, 날짜, 금액) 현금흐름 표에서 계좌별 XIRR을 한 번에 계산합니다.
+
+    계좌별로 반복하지 않고 모든 현금흐름을 하나의 배열에 둔 채 계좌 번호로 묶어 합산하므로,
+    수천 개 계좌도 뉴턴 반복 수십 번의 배열 연산으로 풀립니다.
+
+    Args:
+        cash_flows: 계좌, 날짜, 금액 열을 가진 데이터프레임
+        account_column: 계좌 열 이름
+        date_column: 날짜 열 이름
+        amount_column: 금액 열 이름 (입금 음수, 출금·평가액 양수)
+        guess: 초기 추정 연수익률 (소수)
+        tol: 현금흐름 절댓값 합계 대비 NPV 허용 오차
+        max_iter: 최대 반복 횟수
+
+    Returns:
+        DataFrame: 계좌를 인덱스로 하는 연환산 수익률 (%), 현금흐름 수, 총 입금액, 총 출금액,
+            순손익, 반복횟수, 수렴 표
+    """
+    flows = cash_flows[[account_column, date_column, amount_column]].dropna()
+    groups, accounts = pd.factorize(flows[account_column], sort=True)
+    n_groups = len(accounts)
+    amounts = flows[amount_column].to_numpy(dtype=np.float64)
+    days = pd.to_datetime(flows[date_column]).to_numpy().astype("datetime64[D]").astype(np.int64)
+
+    # 계좌별 첫 현금흐름 날짜를 기준(t = 0)으로 연 단위 경과 시간 계산
+    first_day = np.full(n_groups, np.iinfo(np.int64).max)
+    np.minimum.at(first_day, groups, days)
+    years = (days - first_day[groups]) / DAYS_PER_YEAR
+
+    rates, iterations, residual = _solve_grouped(years, amounts, groups, n_groups, guess, tol, max_iter)
+    deposits = np.bincount(groups, weights=np.where(amounts < 0, -amounts, 0.0), minlength=n_groups)
+    withdrawals = np.bincount(groups, weights=np.where(amounts > 0, amounts, 0.0), minlength=n_groups)
+    return pd.DataFrame({
+        "연환산 수익률 (%)": rates * 100,
+        "현금흐름 수": np.bincount(groups, minlength=n_groups),
+        "총 입금액": deposits,
+        "총 출금액": withdrawals,
+        "순손익": withdrawals - deposits,
+        "반복횟수": iterations,
+        "수렴": np.isfinite(rates),
+    }, index=pd.Index(accounts, name=account_column))